@@ -0,0 +1,70 @@
+"""
+Shared fixtures and hooks for the benchmarks.
+"""
+import pytest
+
+
+# The results from the `memory` benchmarks, which are shown in a table at
+# the end of the test session.
+MEMORY_RESULTS = pytest.StashKey[list]()
+
+# The results from the `scaling` benchmarks, which are shown in a table at
+# the end of the test session.
+SCALING_RESULTS = pytest.StashKey[list]()
+
+
+@pytest.fixture(scope='session')
+def memory_results(request):
+    return request.config.stash.setdefault(MEMORY_RESULTS, [])
+
+
+@pytest.fixture(scope='session')
+def scaling_results(request):
+    return request.config.stash.setdefault(SCALING_RESULTS, [])
+
+
+def write_table(terminalreporter, title, columns, rows, num_text_columns):
+    """
+    Write a table of `rows` to the terminal; the first `num_text_columns`
+    columns are aligned left, and the rest (numbers) are aligned right.
+    """
+    widths = [max(len(str(row[i])) for row in [columns, *rows])
+              for i in range(len(columns))]
+
+    def format_row(row):
+        return '  '.join(str(v).ljust(w) if i < num_text_columns
+                         else str(v).rjust(w)
+                         for i, (v, w) in enumerate(zip(row, widths)))
+
+    terminalreporter.write_sep('-', title)
+    terminalreporter.write_line(format_row(columns))
+
+    for row in rows:
+        terminalreporter.write_line(format_row(row))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = config.stash.get(MEMORY_RESULTS, None)
+
+    if results:
+        columns = ('shape', 'name', 'nodes', 'retained', 'peak', 'bytes/node')
+        rows = [(r['shape'], r['name'], f"{r['nodes']:,}", f"{r['retained']:,}",
+                 f"{r['peak']:,}", f"{r['bytes_per_node']:,.1f}")
+                for r in sorted(results,
+                                key=lambda r: (r['shape'], r['retained']))]
+
+        write_table(terminalreporter, 'memory (bytes)', columns, rows, 2)
+
+    results = config.stash.get(SCALING_RESULTS, None)
+
+    if results:
+        columns = ('scenario', 'param', 'op', 'class', 'nodes', 'MB',
+                   'ns/node')
+        rows = [(r['scenario'], r['param'], r['op'], r['class'],
+                 f"{r['nodes']:,}", f"{r['megabytes']:,.2f}",
+                 f"{r['ns_per_node']:,.1f}")
+                for r in sorted(results, key=lambda r: (
+                    r['scenario'], r['op'], r['class'], r['index']))]
+
+        write_table(terminalreporter, 'scaling (time per node)', columns,
+                    rows, 4)
@@ -0,0 +1,71 @@
+"""
+Stress benchmarks for creating `DotWizPlus` objects from many threads at
+once, with overlapping sets of (special-cased) keys.
+
+Each benchmark creates the same total number of objects, split across a
+varying number of threads, so that the results show how throughput scales
+with the number of threads - on free-threaded builds of CPython, for
+example - and how much contention there is on the shared key cache.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.concurrency,
+              pytest.mark.benchmark(group='concurrency')]
+
+
+NUM_RECORDS = 20_000
+
+
+@pytest.fixture(scope='module')
+def records():
+    # every record has overlapping keys, from a pool of ~200 distinct keys.
+    return [{f'Key-{i % 97}': i,
+             f'otherKey{i % 13}': {'NestedKey': [{'Item ID': i}]},
+             f'{i % 89}D': 'value'}
+            for i in range(NUM_RECORDS)]
+
+
+@pytest.fixture(scope='module')
+def expected(records):
+    return [dotwiz.DotWizPlus(r).to_attr_dict() for r in records]
+
+
+def create_in_threads(records, num_threads):
+    chunk_size = -(-len(records) // num_threads)
+    chunks = [records[i:i + chunk_size]
+              for i in range(0, len(records), chunk_size)]
+
+    def create_all(chunk, cls=dotwiz.DotWizPlus):
+        return [cls(r) for r in chunk]
+
+    with ThreadPoolExecutor(max_workers=num_threads) as pool:
+        return [dw for result in pool.map(create_all, chunks)
+                for dw in result]
+
+
+@pytest.mark.parametrize('num_threads', [1, 2, 4, 8, 16, 32])
+@pytest.mark.parametrize('cache_size', [4096, 64])
+def test_dotwiz_plus_threads(benchmark, records, expected,
+                             num_threads, cache_size):
+    """
+    Create objects from `num_threads` threads. A `cache_size` which is
+    smaller than the number of distinct keys forces constant evictions.
+    """
+    dotwiz.clear_key_cache()
+    dotwiz.configure_key_cache(cache_size, policy='lru')
+
+    try:
+        result = benchmark.pedantic(create_in_threads,
+                                    args=(records, num_threads),
+                                    rounds=5)
+    finally:
+        dotwiz.configure_key_cache()
+
+    # the results are deterministic, regardless of the number of threads.
+    assert [dw.to_attr_dict() for dw in result] == expected
@@ -0,0 +1,74 @@
+import copy
+
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.copy,
+              pytest.mark.benchmark(group='copy')]
+
+
+@pytest.fixture(scope='module')
+def my_data():
+    return {'users': [{'id': i, 'userName': f'user{i}', 'isActive': True,
+                       'address': {'streetName': 'Main St', 'zipCode': '75001'},
+                       'tags': ['a', 'b']}
+                      for i in range(200)]}
+
+
+def test_dict_deepcopy(benchmark, my_data):
+    result = benchmark(copy.deepcopy, my_data)
+    assert result['users'][1]['userName'] == 'user1'
+
+
+def test_dotwiz_deepcopy(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+
+    result = benchmark(copy.deepcopy, o)
+    assert result.users[1].userName == 'user1'
+
+
+def test_dotwiz_from_dict(benchmark, my_data):
+    """Copy via `to_dict()`, and convert the result again"""
+    o = dotwiz.DotWiz(my_data)
+
+    result = benchmark(lambda: dotwiz.DotWiz(o.to_dict()))
+    assert result.users[1].userName == 'user1'
+
+
+def test_dotwiz_plus_deepcopy(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    result = benchmark(copy.deepcopy, o)
+    assert result.users[1].user_name == 'user1'
+
+
+def test_dotwiz_plus_from_dict(benchmark, my_data):
+    """Copy via `to_dict()`, and convert the result again"""
+    o = dotwiz.DotWizPlus(my_data)
+
+    result = benchmark(lambda: dotwiz.DotWizPlus(o.to_dict()))
+    assert result.users[1].user_name == 'user1'
+
+
+def test_dict_copy(benchmark, my_data):
+    o = my_data['users'][0]
+
+    result = benchmark(copy.copy, o)
+    assert result['userName'] == 'user0'
+
+
+def test_dotwiz_copy(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data['users'][0])
+
+    result = benchmark(copy.copy, o)
+    assert result.userName == 'user0'
+
+
+def test_dotwiz_plus_copy(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data['users'][0])
+
+    result = benchmark(copy.copy, o)
+    assert result.user_name == 'user0'
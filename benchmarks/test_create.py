@@ -98,6 +98,35 @@ def test_make_dot_wiz_plus(benchmark, my_data):
     assert result.c.bb[0].x == 77
 
 
+def test_dotwiz_lite(benchmark, my_data):
+    result = benchmark(dotwiz.DotWizLite, my_data)
+    # print(result)
+
+    assert result.c.bb[0].x == 77
+
+
+def test_lazy_dotwiz(benchmark, my_data):
+    result = benchmark(dotwiz.LazyDotWiz, my_data)
+    # print(result)
+
+    assert result.c.bb[0].x == 77
+
+
+def test_lazy_dotwiz_plus(benchmark, my_data):
+    result = benchmark(dotwiz.LazyDotWizPlus, my_data)
+    # print(result)
+
+    assert result.c.bb[0].x == 77
+
+
+def test_dotwiz_specialized(benchmark, my_data):
+    cls = dotwiz.DotWiz.specialize(my_data)
+    result = benchmark(cls, my_data)
+    # print(result)
+
+    assert result.c.bb[0].x == 77
+
+
 def test_dotmap(benchmark, my_data):
     result = benchmark(dotmap.DotMap, my_data)
     # print(result)
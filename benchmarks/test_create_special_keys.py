@@ -1,4 +1,5 @@
 import dataclasses
+import re
 
 import addict
 import box
@@ -12,6 +13,7 @@ import prodict
 import pytest
 import scalpl
 from dataclass_wizard import fromdict
+from pyheck import snake
 
 import dotwiz
 
@@ -259,3 +261,62 @@ def test_scalpl(benchmark, my_data):
     # print(result)
 
     assert_eq5(result, subscript_list=True)
+
+
+def snake_pyheck(key):
+    """The `snake` key normalizer without the fast path for ASCII keys"""
+    lower_snake = snake(key)
+
+    for ch in ('.', '\''):
+        if ch in lower_snake:
+            lower_snake = lower_snake.replace(ch, '_').replace('__', '_')
+
+    if lower_snake[0].isdigit():
+        lower_snake = f'_{lower_snake}'
+
+    return lower_snake
+
+
+def identifier(key, __sub=re.compile('[^0-9a-zA-Z_]|^(?=[0-9])').sub):
+    """A user-supplied key normalizer, which keeps the case of keys"""
+    return __sub('_', key)
+
+
+NORMALIZERS = {'snake_pyheck': snake_pyheck, 'identifier': identifier}
+
+
+@pytest.fixture(scope='module')
+def many_special_keys():
+    """1000 distinct special-cased keys, in a mix of common styles"""
+    styles = ('userName{}', 'zip-code-{}', 'first name {}', 'HTTPHeader{}',
+              'Content-Type-{}')
+
+    return {styles[i % len(styles)].format(i): i for i in range(1000)}
+
+
+@pytest.mark.parametrize('cached', [False, True], ids=['uncached', 'cached'])
+@pytest.mark.parametrize('normalizer', ['snake', *NORMALIZERS])
+def test_key_normalizer(benchmark, many_special_keys, normalizer, cached):
+    """
+    The throughput (keys per second, in ``extra_info``) of each key
+    normalizer, with and without its cache.
+    """
+    if normalizer in NORMALIZERS:
+        dotwiz.register_key_normalizer(normalizer, NORMALIZERS[normalizer],
+                                       overwrite=True)
+
+    previous = dotwiz.set_key_normalizer(normalizer)
+    dotwiz.configure_key_cache(4096 if cached else 0)
+
+    try:
+        result = benchmark(dotwiz.DotWizPlus, many_special_keys)
+
+    finally:
+        dotwiz.configure_key_cache()
+        dotwiz.set_key_normalizer(previous)
+
+    benchmark.group = 'create_with_special_keys: normalizers'
+    benchmark.extra_info['keys_per_second'] = \
+        len(many_special_keys) / benchmark.stats.stats.mean
+
+    assert len(result.__dict__) == len(many_special_keys)
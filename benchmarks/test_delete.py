@@ -0,0 +1,95 @@
+import addict
+import box
+import dict2dot
+import dotmap
+import dotsi
+import dotted_dict
+import metadict
+import prodict
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.delete,
+              pytest.mark.benchmark(group='delete')]
+
+
+@pytest.fixture
+def my_data():
+    return {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]}}
+
+
+def delete(benchmark, cls, data, by_attr=False):
+    """
+    Benchmark deleting a key from a new `cls` object, which is created
+    (and not timed) before each round.
+    """
+    def setup():
+        return (cls(data), ), {}
+
+    if by_attr:
+        def delete_key(o):
+            del o.b
+    else:
+        def delete_key(o):
+            del o['b']
+
+    benchmark.pedantic(delete_key, setup=setup, rounds=10_000)
+
+
+def test_dict(benchmark, my_data):
+    delete(benchmark, dict, my_data)
+
+
+def test_box(benchmark, my_data):
+    delete(benchmark, box.Box, my_data, by_attr=True)
+
+
+def test_dotwiz(benchmark, my_data):
+    delete(benchmark, dotwiz.DotWiz, my_data, by_attr=True)
+
+
+def test_dotwiz_delitem(benchmark, my_data):
+    delete(benchmark, dotwiz.DotWiz, my_data)
+
+
+def test_dotwiz_lite(benchmark, my_data):
+    delete(benchmark, dotwiz.DotWizLite, my_data, by_attr=True)
+
+
+def test_dotwiz_plus(benchmark, my_data):
+    delete(benchmark, dotwiz.DotWizPlus, my_data, by_attr=True)
+
+
+def test_dotwiz_plus_delitem(benchmark, my_data):
+    delete(benchmark, dotwiz.DotWizPlus, my_data)
+
+
+def test_dotmap(benchmark, my_data):
+    delete(benchmark, dotmap.DotMap, my_data, by_attr=True)
+
+
+def test_dotted_dict(benchmark, my_data):
+    delete(benchmark, dotted_dict.DottedDict, my_data, by_attr=True)
+
+
+def test_dotsi(benchmark, my_data):
+    delete(benchmark, dotsi.Dict, my_data, by_attr=True)
+
+
+def test_dict2dot(benchmark, my_data):
+    delete(benchmark, dict2dot.Dict2Dot, my_data)
+
+
+def test_addict(benchmark, my_data):
+    delete(benchmark, addict.Dict, my_data, by_attr=True)
+
+
+def test_metadict(benchmark, my_data):
+    delete(benchmark, metadict.MetaDict, my_data, by_attr=True)
+
+
+def test_prodict(benchmark, my_data):
+    delete(benchmark, prodict.Prodict.from_dict, my_data, by_attr=True)
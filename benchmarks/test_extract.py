@@ -0,0 +1,105 @@
+import glom
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.extract,
+              pytest.mark.benchmark(group='extract')]
+
+
+PATHS = [
+    'user.id', 'user.name', 'user.email',
+    'user.address.street', 'user.address.city', 'user.address.zip',
+    'order.id', 'order.total', 'order.currency',
+    'order.items[0].sku', 'order.items[0].qty',
+    'order.shipping.method', 'order.shipping.cost',
+    'meta.source', 'meta.version',
+]
+
+
+@pytest.fixture
+def my_data():
+    return {
+        'user': {'id': 1, 'name': 'Jon', 'email': 'jon@example.com',
+                 'address': {'street': '1 Main St', 'city': 'Paris', 'zip': '75001'}},
+        'order': {'id': 42, 'total': 9.5, 'currency': 'EUR',
+                  'items': [{'sku': 'A1', 'qty': 2}],
+                  'shipping': {'method': 'post', 'cost': 1.5}},
+        'meta': {'source': 'api', 'version': 3},
+    }
+
+
+def test_dotwiz_attr(benchmark, my_data):
+    """Hand-written attribute access for each field, as a baseline"""
+    o = dotwiz.DotWiz(my_data)
+
+    def get(o):
+        user = o.user
+        address = user.address
+        order = o.order
+        item = order.items[0]
+        shipping = order.shipping
+        meta = o.meta
+        return (user.id, user.name, user.email,
+                address.street, address.city, address.zip,
+                order.id, order.total, order.currency,
+                item.sku, item.qty,
+                shipping.method, shipping.cost,
+                meta.source, meta.version)
+
+    result = benchmark(get, o)
+    assert result[-1] == 3
+
+
+def test_dotwiz_extractor(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+    get = dotwiz.extractor(PATHS).get
+
+    result = benchmark(get, o)
+    assert result[-1] == 3
+
+
+def test_dotwiz_extractor_with_missing_keys(benchmark, my_data):
+    del my_data['order']['shipping']
+    o = dotwiz.DotWiz(my_data)
+    get = dotwiz.extractor(PATHS, default=None).get
+
+    result = benchmark(get, o)
+    assert result[-3] is None
+
+
+def test_dotwiz_path_per_field(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+    getters = [dotwiz.path(p).get for p in PATHS]
+
+    result = benchmark(lambda: tuple([get(o) for get in getters]))
+    assert result[-1] == 3
+
+
+def test_dotwiz_plus_extractor(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+    get = dotwiz.extractor(PATHS).get
+
+    result = benchmark(get, o)
+    assert result[-1] == 3
+
+
+def test_dict_extractor(benchmark, my_data):
+    o = my_data
+    get = dotwiz.extractor(PATHS).get
+
+    result = benchmark(get, o)
+    assert result[-1] == 3
+
+
+def test_glom(benchmark, my_data):
+    o = my_data
+    # a dict spec returns a dict with a value for each path
+    spec = {p: p.replace('[0]', '.0') for p in PATHS}
+
+    glom_fn = glom.glom
+
+    result = benchmark(lambda: glom_fn(o, spec))
+    assert result['meta.version'] == 3
@@ -0,0 +1,69 @@
+"""
+Benchmarks for loading a (large) JSON document into a `DotWiz` or
+`DotWizPlus`, using `from_json()` as compared to the two-step approach of
+`json.loads()` followed by creating an object from the result.
+"""
+import json
+
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.from_json,
+              pytest.mark.benchmark(group='from_json')]
+
+
+@pytest.fixture(scope='module')
+def json_string():
+    # a ~5 MB document, with a mix of nested objects and arrays.
+    return json.dumps({
+        'items': [
+            {'id': i,
+             'name': f'Item {i}',
+             'tags': ['a', 'b', 'c'],
+             'price': {'amount': i * 1.5, 'currency': 'USD'},
+             'sellerInfo': {'sellerId': f'S-{i % 100}',
+                            'Ratings': [{'Score': 5, 'Count': i}]}}
+            for i in range(25_000)
+        ]
+    })
+
+
+def test_json_loads(benchmark, json_string):
+    """Baseline: parse the document into plain `dict` objects only."""
+    result = benchmark(json.loads, json_string)
+    assert result['items'][7]['price']['amount'] == 10.5
+
+
+def test_dotwiz_two_step(benchmark, json_string):
+    result = benchmark(lambda: dotwiz.DotWiz(json.loads(json_string)))
+    assert result['items'][7].price.amount == 10.5
+
+
+def test_dotwiz_from_json(benchmark, json_string):
+    result = benchmark(dotwiz.DotWiz.from_json, json_string)
+    assert result['items'][7].price.amount == 10.5
+
+
+def test_dotwiz_from_json_bytes(benchmark, json_string):
+    json_bytes = json_string.encode()
+
+    result = benchmark(dotwiz.DotWiz.from_json, json_bytes)
+    assert result['items'][7].price.amount == 10.5
+
+
+def test_dotwiz_lite_from_json(benchmark, json_string):
+    result = benchmark(dotwiz.DotWizLite.from_json, json_string)
+    assert result['items'][7].price.amount == 10.5
+
+
+def test_dotwiz_plus_two_step(benchmark, json_string):
+    result = benchmark(lambda: dotwiz.DotWizPlus(json.loads(json_string)))
+    assert result.items_[7].seller_info.ratings[0].count == 7
+
+
+def test_dotwiz_plus_from_json(benchmark, json_string):
+    result = benchmark(dotwiz.DotWizPlus.from_json, json_string)
+    assert result.items_[7].seller_info.ratings[0].count == 7
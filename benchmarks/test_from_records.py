@@ -0,0 +1,59 @@
+"""
+Benchmarks for creating a `DotWiz` or `DotWizPlus` for each record in a
+(large) list of records which share the same key names, using
+`from_records()` as compared to calling the constructor for each record.
+"""
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.from_records,
+              pytest.mark.benchmark(group='from_records')]
+
+
+@pytest.fixture(scope='module')
+def records():
+    # 100k records, with a mix of special-cased keys and nested values.
+    return [
+        {'id': i,
+         'userName': f'user{i}',
+         'e-mail': f'user{i}@example.com',
+         'isActive': i % 2 == 0,
+         'score': i * 1.5,
+         'tags': ['a', 'b'],
+         'Address': {'City': 'Paris', 'zipCode': '75001'},
+         'notes': None}
+        for i in range(100_000)
+    ]
+
+
+def test_dotwiz(benchmark, records):
+    result = benchmark(lambda: [dotwiz.DotWiz(r) for r in records])
+    assert result[7].Address.zipCode == '75001'
+
+
+def test_dotwiz_from_records(benchmark, records):
+    result = benchmark(dotwiz.DotWiz.from_records, records)
+    assert result[7].Address.zipCode == '75001'
+
+
+def test_dotwiz_plus(benchmark, records):
+    result = benchmark(lambda: [dotwiz.DotWizPlus(r) for r in records])
+    assert result[7].address.zip_code == '75001'
+
+
+def test_dotwiz_plus_from_records(benchmark, records):
+    result = benchmark(dotwiz.DotWizPlus.from_records, records)
+    assert result[7].address.zip_code == '75001'
+
+
+def test_columnar_list(benchmark, records):
+    result = benchmark(dotwiz.ColumnarList, records)
+    assert result[7].Address.zipCode == '75001'
+
+
+def test_columnar_list_plus(benchmark, records):
+    result = benchmark(dotwiz.ColumnarList, records, dotwiz.DotWizPlus)
+    assert result[7].address.zip_code == '75001'
@@ -72,6 +72,22 @@ def test_dotwiz(benchmark, my_data):
     assert result == 77
 
 
+def test_dotwiz_lite(benchmark, my_data):
+    o = dotwiz.DotWizLite(my_data)
+    # print(o)
+
+    result = benchmark(lambda: o.c.bb[0].x)
+    assert result == 77
+
+
+def test_dotwiz_specialized(benchmark, my_data):
+    o = dotwiz.DotWiz.specialize(my_data)(my_data)
+    # print(o)
+
+    result = benchmark(lambda: o.c.bb[0].x)
+    assert result == 77
+
+
 def test_dotwiz_plus(benchmark, my_data):
     o = dotwiz.DotWizPlus(my_data)
     # print(o)
@@ -0,0 +1,100 @@
+import dotty_dict
+import glom
+import pytest
+import scalpl
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.getattr_path,
+              pytest.mark.benchmark(group='getattr_path')]
+
+
+@pytest.fixture
+def my_data():
+    return {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]}}
+
+
+def test_dotwiz_attr(benchmark, my_data):
+    """Hand-written attribute access, as a baseline"""
+    o = dotwiz.DotWiz(my_data)
+
+    result = benchmark(lambda: o.c.bb[0].x)
+    assert result == 77
+
+
+def test_dotwiz_getattr_loop(benchmark, my_data):
+    """A hand-rolled loop over the keys in a path, with `getattr`"""
+    o = dotwiz.DotWiz(my_data)
+
+    def get(obj, keys=('c', 'bb', 0, 'x')):
+        for key in keys:
+            obj = obj[key] if type(key) is int else getattr(obj, key)
+        return obj
+
+    result = benchmark(get, o)
+    assert result == 77
+
+
+def test_dotwiz_path(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+    get = dotwiz.path('c.bb[0].x').get
+
+    result = benchmark(get, o)
+    assert result == 77
+
+
+def test_dotwiz_get_path(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+
+    result = benchmark(lambda: o.get_path('c.bb[0].x'))
+    assert result == 77
+
+
+def test_dotwiz_plus_path(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+    get = dotwiz.path('c.bb[0].x').get
+
+    result = benchmark(get, o)
+    assert result == 77
+
+
+def test_dotwiz_plus_get_path(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    result = benchmark(lambda: o.get_path('c.bb[0].x'))
+    assert result == 77
+
+
+def test_dict_path(benchmark, my_data):
+    o = my_data
+    get = dotwiz.path('c.bb[0].x').get
+
+    result = benchmark(get, o)
+    assert result == 77
+
+
+def test_glom(benchmark, my_data):
+    o = my_data
+
+    # bring out the function to be fair with other tests, since attribute
+    # access might hurt slightly otherwise.
+    glom_fn = glom.glom
+
+    result = benchmark(lambda: glom_fn(o, 'c.bb.0.x'))
+    assert result == 77
+
+
+def test_dotty_dict(benchmark, my_data):
+    o = dotty_dict.Dotty(my_data)
+
+    result = benchmark(lambda: o['c.bb.0.x'])
+    assert result == 77
+
+
+def test_scalpl(benchmark, my_data):
+    o = scalpl.Cut(my_data)
+
+    result = benchmark(lambda: o['c.bb[0].x'])
+    assert result == 77
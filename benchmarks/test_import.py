@@ -0,0 +1,66 @@
+"""
+Benchmarks for the time to ``import dotwiz`` in a new process, which is
+paid on every cold start of a CLI tool or a serverless function.
+
+`DotWizPlus` and the ``pyheck`` dependency are only imported on first use,
+so ``import dotwiz`` alone should be faster than also using `DotWizPlus`;
+the same goes for the optional features, such as `to_columns` (and NumPy).
+The cumulative import time of the ``dotwiz`` package, as reported by
+``python -X importtime``, is stored in the ``extra_info`` of each benchmark.
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.import_time,
+              pytest.mark.benchmark(group='import_time')]
+
+
+# The root of the repo, so that the local `dotwiz` package is imported.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The number of runs of `-X importtime` to take the median of.
+NUM_RUNS = 9
+
+CODE = {
+    'python': 'pass',
+    'dotwiz': 'import dotwiz',
+    'dotwiz_and_plus': 'import dotwiz; dotwiz.DotWizPlus',
+    'dotwiz_and_columns': 'import dotwiz; dotwiz.to_columns',
+}
+
+
+def run(code, *options):
+    return subprocess.run([sys.executable, *options, '-c', code], cwd=ROOT,
+                          capture_output=True, text=True, check=True)
+
+
+def import_time_us(code):
+    """
+    Return the total time (in microseconds) of the imports in `code`, as
+    reported by ``-X importtime``, without the imports at startup.
+    """
+    lines = run(code, '-X', 'importtime').stderr.splitlines()
+    startup = len(run('pass', '-X', 'importtime').stderr.splitlines())
+
+    # each line is `import time: <self> | <cumulative> | <name>`; the
+    # ones for top-level imports are not indented.
+    return sum(int(line.split('|')[1])
+               for line in lines[startup:]
+               if line.startswith('import time:')
+               and not line.split('|')[2].startswith('  '))
+
+
+@pytest.mark.parametrize('name', CODE)
+def test_import(benchmark, name):
+    code = CODE[name]
+
+    benchmark.extra_info['import_time_us'] = statistics.median(
+        import_time_us(code) for _ in range(NUM_RUNS))
+
+    benchmark.pedantic(run, args=(code, ), rounds=20, iterations=1)
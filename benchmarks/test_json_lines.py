@@ -0,0 +1,85 @@
+"""
+Throughput benchmarks (records per second) for streaming a file of JSON
+lines into `DotWiz` or `DotWizPlus` objects, via `iter_json_lines()`.
+
+The number of records per second is saved in the `extra_info` for each
+benchmark, which is shown with the ``--benchmark-json`` option.
+"""
+import io
+import json
+
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.json_lines,
+              pytest.mark.benchmark(group='json_lines')]
+
+
+NUM_RECORDS = 50_000
+
+
+@pytest.fixture(scope='module')
+def json_lines():
+    return '\n'.join(
+        json.dumps({'eventId': i,
+                    'eventType': 'click',
+                    'user': {'userId': f'U-{i % 1000}', 'Roles': ['a', 'b']},
+                    'Properties': {'page-url': '/home', 'x': i, 'y': -i}})
+        for i in range(NUM_RECORDS)
+    ).encode()
+
+
+def consume(records):
+    count = 0
+    for _ in records:
+        count += 1
+    return count
+
+
+def run(benchmark, fn):
+    count = benchmark(fn)
+
+    assert count == NUM_RECORDS
+    # note: there are no stats with the `--benchmark-disable` option
+    if benchmark.stats is not None:
+        benchmark.extra_info['records_per_sec'] = round(
+            NUM_RECORDS / benchmark.stats.stats.mean)
+
+
+def test_json_loads_per_line(benchmark, json_lines):
+    """Baseline: parse each line into a plain `dict` only."""
+    run(benchmark, lambda: consume(
+        json.loads(line) for line in io.BytesIO(json_lines)))
+
+
+def test_dotwiz_two_step_per_line(benchmark, json_lines):
+    run(benchmark, lambda: consume(
+        dotwiz.DotWiz(json.loads(line)) for line in io.BytesIO(json_lines)))
+
+
+def test_dotwiz(benchmark, json_lines):
+    run(benchmark, lambda: consume(
+        dotwiz.iter_json_lines(io.BytesIO(json_lines))))
+
+
+def test_dotwiz_batched(benchmark, json_lines):
+    run(benchmark, lambda: sum(map(len, dotwiz.iter_json_lines(
+        io.BytesIO(json_lines), batch_size=1_000))))
+
+
+def test_dotwiz_plus_two_step_per_line(benchmark, json_lines):
+    run(benchmark, lambda: consume(
+        dotwiz.DotWizPlus(json.loads(line)) for line in io.BytesIO(json_lines)))
+
+
+def test_dotwiz_plus(benchmark, json_lines):
+    run(benchmark, lambda: consume(
+        dotwiz.iter_json_lines(io.BytesIO(json_lines), dotwiz.DotWizPlus)))
+
+
+def test_dotwiz_plus_batched(benchmark, json_lines):
+    run(benchmark, lambda: sum(map(len, dotwiz.iter_json_lines(
+        io.BytesIO(json_lines), dotwiz.DotWizPlus, batch_size=1_000))))
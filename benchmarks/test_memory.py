@@ -0,0 +1,160 @@
+"""
+Benchmarks for the memory used by a `DotWiz` (and similar libraries) for
+a few payload shapes, as measured with `tracemalloc`.
+
+For each object, this records (in the ``extra_info`` of the benchmark, and
+in a table at the end of the session):
+
+* `retained` - the bytes still allocated after it's created, and after
+  a garbage collection, not counting the input payload itself.
+* `peak` - the peak bytes allocated while it's created.
+* `bytes_per_node` - `retained` divided by the number of ``dict`` objects
+  in the payload.
+
+To keep the results for comparison across releases, pass
+``--benchmark-save=<name>`` (or ``--benchmark-autosave``); the memory
+results are saved in the JSON file along with the timings.
+"""
+import gc
+import tracemalloc
+
+import addict
+import box
+import dict2dot
+import dotmap
+import dotsi
+import dotted_dict
+import metadict
+import prodict
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.memory,
+              pytest.mark.benchmark(group='memory')]
+
+
+def small():
+    return {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]}}
+
+
+def wide():
+    # one object with 1000 keys, and a nested object for every 10th one.
+    return {f'key{i}': {'x': i} if i % 10 == 0 else i for i in range(1000)}
+
+
+def deep():
+    # 200 levels of nested objects.
+    o = {'x': 0}
+    for i in range(1, 200):
+        o = {'x': i, 'child': o}
+    return o
+
+
+def large_list():
+    return {'rows': [{'id': i, 'name': f'user{i}', 'active': i % 2 == 0,
+                      'address': {'city': 'Paris', 'zip': '75001'}}
+                     for i in range(10_000)]}
+
+
+SHAPES = {'small': small, 'wide': wide, 'deep': deep,
+          'large_list': large_list}
+
+
+def dict_copy(o):
+    """Copy a (nested) `dict`, as a baseline for a plain `dict`"""
+    t = type(o)
+
+    if t is dict:
+        return {k: dict_copy(v) for k, v in o.items()}
+    if t is list:
+        return [dict_copy(e) for e in o]
+
+    return o
+
+
+def columnar_list(o):
+    """Store the rows as a `ColumnarList`; only for a list of records"""
+    return dotwiz.ColumnarList(o['rows']) if 'rows' in o else None
+
+
+FACTORIES = {
+    'dict': dict_copy,
+    'dotwiz': dotwiz.DotWiz,
+    'dotwiz_plus': dotwiz.DotWizPlus,
+    'dotwiz_lite': dotwiz.DotWizLite,
+    'frozen_dotwiz': dotwiz.FrozenDotWiz,
+    'columnar_list': columnar_list,
+    'addict': addict.Dict,
+    'box': box.Box,
+    'dict2dot': dict2dot.Dict2Dot,
+    'dotmap': dotmap.DotMap,
+    'dotsi': dotsi.Dict,
+    'dotted_dict': dotted_dict.DottedDict,
+    'metadict': metadict.MetaDict,
+    'prodict': prodict.Prodict.from_dict,
+}
+
+
+def count_nodes(o):
+    """Return the number of `dict` objects in a (nested) payload"""
+    n = 0
+    stack = [o]
+
+    while stack:
+        o = stack.pop()
+        t = type(o)
+
+        if t is dict:
+            n += 1
+            stack.extend(o.values())
+        elif t is list:
+            stack.extend(o)
+
+    return n
+
+
+def measure(factory, data):
+    """
+    Return the bytes retained by the result of `factory(data)`, and the
+    peak bytes allocated while it's created.
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        result = factory(data)
+        _, peak = tracemalloc.get_traced_memory()
+
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+
+    finally:
+        tracemalloc.stop()
+
+    return result, retained, peak
+
+
+@pytest.mark.parametrize('name', FACTORIES)
+@pytest.mark.parametrize('shape', SHAPES)
+def test_memory(benchmark, memory_results, shape, name):
+    factory = FACTORIES[name]
+    data = SHAPES[shape]()
+
+    result, retained, peak = measure(factory, data)
+
+    if result is None:
+        pytest.skip(f'{name!r} is not supported for {shape!r}')
+
+    nodes = count_nodes(data)
+    info = {'retained': retained, 'peak': peak, 'nodes': nodes,
+            'bytes_per_node': retained / nodes}
+
+    benchmark.group = f'memory: {shape}'
+    benchmark.extra_info.update(info)
+    memory_results.append({'shape': shape, 'name': name, **info})
+
+    # also time the creation, so the saved results have both.
+    benchmark.pedantic(factory, args=(data, ), rounds=3, iterations=1)
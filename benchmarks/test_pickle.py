@@ -0,0 +1,76 @@
+import pickle
+
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.pickle,
+              pytest.mark.benchmark(group='pickle')]
+
+
+PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+
+@pytest.fixture(scope='module')
+def my_data():
+    return {'users': [{'id': i, 'userName': f'user{i}', 'isActive': True,
+                       'address': {'streetName': 'Main St', 'zipCode': '75001'},
+                       'tags': ['a', 'b']}
+                      for i in range(200)]}
+
+
+def round_trip(benchmark, dumps, o):
+    payload = dumps(o)
+    benchmark.extra_info['payload_size'] = len(payload)
+
+    return benchmark(lambda: pickle.loads(dumps(o)))
+
+
+def test_dict(benchmark, my_data):
+    result = round_trip(benchmark, lambda o: pickle.dumps(o, PROTOCOL),
+                        my_data)
+    assert result['users'][1]['userName'] == 'user1'
+
+
+def test_dotwiz(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+
+    result = round_trip(benchmark, lambda o: pickle.dumps(o, PROTOCOL), o)
+    assert result.users[1].userName == 'user1'
+
+
+def test_dotwiz_from_dict(benchmark, my_data):
+    """Pickle the result of `to_dict()`, and convert it again when loaded"""
+    o = dotwiz.DotWiz(my_data)
+
+    def dumps(o):
+        return pickle.dumps(o.to_dict(), PROTOCOL)
+
+    payload = dumps(o)
+    benchmark.extra_info['payload_size'] = len(payload)
+
+    result = benchmark(lambda: dotwiz.DotWiz(pickle.loads(dumps(o))))
+    assert result.users[1].userName == 'user1'
+
+
+def test_dotwiz_plus(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    result = round_trip(benchmark, lambda o: pickle.dumps(o, PROTOCOL), o)
+    assert result.users[1].user_name == 'user1'
+
+
+def test_dotwiz_plus_from_dict(benchmark, my_data):
+    """Pickle the result of `to_dict()`, and convert it again when loaded"""
+    o = dotwiz.DotWizPlus(my_data)
+
+    def dumps(o):
+        return pickle.dumps(o.to_dict(), PROTOCOL)
+
+    payload = dumps(o)
+    benchmark.extra_info['payload_size'] = len(payload)
+
+    result = benchmark(lambda: dotwiz.DotWizPlus(pickle.loads(dumps(o))))
+    assert result.users[1].user_name == 'user1'
@@ -0,0 +1,86 @@
+import addict
+import box
+import dict2dot
+import dotmap
+import dotsi
+import dotted_dict
+import metadict
+import prodict
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.repr,
+              pytest.mark.benchmark(group='repr')]
+
+
+@pytest.fixture
+def my_data():
+    return {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]}}
+
+
+def test_dict(benchmark, my_data):
+    result = benchmark(repr, my_data)
+    assert '77' in result
+
+
+def test_box(benchmark, my_data):
+    result = benchmark(repr, box.Box(my_data))
+    assert '77' in result
+
+
+def test_dotwiz(benchmark, my_data):
+    result = benchmark(repr, dotwiz.DotWiz(my_data))
+    assert result == '✫(a=3, b=1, c=✫(aa=33, bb=[✫(x=77)]))'
+
+
+def test_dotwiz_lite(benchmark, my_data):
+    result = benchmark(repr, dotwiz.DotWizLite(my_data))
+    assert '77' in result
+
+
+def test_lazy_dotwiz(benchmark, my_data):
+    result = benchmark(repr, dotwiz.LazyDotWiz(my_data))
+    assert '77' in result
+
+
+def test_dotwiz_plus(benchmark, my_data):
+    result = benchmark(repr, dotwiz.DotWizPlus(my_data))
+    assert result == '✪(a=3, b=1, c=✪(aa=33, bb=[✪(x=77)]))'
+
+
+def test_dotmap(benchmark, my_data):
+    result = benchmark(repr, dotmap.DotMap(my_data))
+    assert '77' in result
+
+
+def test_dotted_dict(benchmark, my_data):
+    result = benchmark(repr, dotted_dict.DottedDict(my_data))
+    assert '77' in result
+
+
+def test_dotsi(benchmark, my_data):
+    result = benchmark(repr, dotsi.Dict(my_data))
+    assert '77' in result
+
+
+def test_dict2dot(benchmark, my_data):
+    result = benchmark(repr, dict2dot.Dict2Dot(my_data))
+    assert '77' in result
+
+
+def test_addict(benchmark, my_data):
+    result = benchmark(repr, addict.Dict(my_data))
+    assert '77' in result
+
+
+def test_metadict(benchmark, my_data):
+    result = benchmark(repr, metadict.MetaDict(my_data))
+    assert '77' in result
+
+
+def test_prodict(benchmark, my_data):
+    result = benchmark(repr, prodict.Prodict.from_dict(my_data))
+    assert '77' in result
@@ -0,0 +1,210 @@
+"""
+Benchmarks for how the cost of a `DotWiz` and `DotWizPlus` scales with the
+size and shape of a payload, from a few KB up to ~45 MB of JSON.
+
+Each scenario varies one property of a (deterministically) generated
+document, and keeps the others fixed:
+
+* `size` - the number of records in a list, and so the total size.
+* `depth` - how deeply objects are nested, for the same number of objects.
+* `fanout` - the number of keys per object, for the same number of values.
+* `list_len` - the length of each nested ``list``, for the same number of
+  values.
+* `special` - the share of keys which are not in *snake case*, and the
+  number of distinct such keys; a `DotWizPlus` caches the attribute name
+  for each one, so a larger vocabulary shows the effect of the cache.
+
+For each, the time to create an object, to read a sample of values by
+their path, and to convert it back with `to_dict()` is divided by the
+number of nodes (values and containers), and shown in a table at the end
+of the session; superlinear behavior shows up as a rising cost per node.
+"""
+import json
+import random
+
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.scaling,
+              pytest.mark.benchmark(group='scaling')]
+
+
+# The number of (random) leaf paths to read from each document.
+NUM_PATHS = 1000
+
+
+def make_document(records=1000, depth=3, fanout=8, list_len=2,
+                  special=0.0, vocab=64, seed=0):
+    """
+    Return a document with a list of `records`, where each record is an
+    object with `fanout` keys, nested `depth` levels deep, and which has a
+    ``list`` of `list_len` values on each level.
+
+    A `special` share of the keys are in *camel case* or contain spaces,
+    which are drawn from a vocabulary of `vocab` distinct names.
+    """
+    rng = random.Random(seed)
+
+    def key(i):
+        if special and rng.random() < special:
+            n = rng.randrange(vocab)
+            return f'someKey{n}' if n % 2 else f'Some Key {n}'
+        return f'key_{i}'
+
+    def value():
+        r = rng.random()
+        if r < 0.4:
+            return rng.randrange(1_000_000)
+        if r < 0.7:
+            return f'value {rng.randrange(1_000_000)}'
+        if r < 0.9:
+            return r * 100
+        return r < 0.95
+
+    def make_object(level):
+        o = {}
+        for i in range(fanout - 1):
+            o[key(i)] = value()
+        if list_len:
+            o['items'] = [value() for _ in range(list_len)]
+        if level < depth:
+            o['child'] = make_object(level + 1)
+        return o
+
+    return {'records': [make_object(1) for _ in range(records)]}
+
+
+# scenario -> list of (param, keyword arguments for `make_document`)
+SCENARIOS = {
+    'size': [(n, {'records': n}) for n in (100, 1000, 10_000, 80_000)],
+    'depth': [(d, {'depth': d, 'records': 16_000 // d})
+              for d in (1, 4, 16, 64)],
+    'fanout': [(f, {'fanout': f, 'depth': 1, 'list_len': 0,
+                    'records': 256_000 // f})
+               for f in (4, 16, 128, 1024)],
+    'list_len': [(n, {'list_len': n, 'depth': 1, 'fanout': 2,
+                      'records': 600_000 // (n + 3)})
+                 for n in (1, 10, 100, 1000)],
+    'special': [(f'{s:.0%}/{v}', {'special': s, 'vocab': v, 'records': 10_000})
+                for s, v in ((0.0, 64), (0.5, 64), (1.0, 64),
+                             (1.0, 4096), (1.0, 65_536))],
+}
+
+PARAMS = [(scenario, index, param, kwargs)
+          for scenario, params in SCENARIOS.items()
+          for index, (param, kwargs) in enumerate(params)]
+
+
+def count_nodes(o):
+    """Return the number of nodes (values and containers) in a document"""
+    n = 0
+    stack = [o]
+
+    while stack:
+        o = stack.pop()
+        n += 1
+        t = type(o)
+
+        if t is dict:
+            stack.extend(o.values())
+        elif t is list:
+            stack.extend(o)
+
+    return n
+
+
+def sample_paths(o, num_paths, seed=0):
+    """Return the paths (as a tuple of keys) to a random sample of leaves"""
+    rng = random.Random(seed)
+    paths = []
+
+    for _ in range(num_paths):
+        keys = []
+        node = o
+
+        while type(node) in (dict, list):
+            if type(node) is dict:
+                k = rng.choice(list(node))
+            elif node:
+                k = rng.randrange(len(node))
+            else:
+                break
+            keys.append(k)
+            node = node[k]
+
+        paths.append(tuple(keys))
+
+    return paths
+
+
+@pytest.fixture(scope='module',
+                params=PARAMS,
+                ids=[f'{s}={p}' for s, _, p, _ in PARAMS])
+def document(request):
+    scenario, index, param, kwargs = request.param
+    data = make_document(**kwargs)
+
+    return {'scenario': scenario, 'index': index, 'param': param,
+            'data': data, 'nodes': count_nodes(data),
+            'megabytes': len(json.dumps(data)) / 1e6,
+            'paths': sample_paths(data, NUM_PATHS)}
+
+
+def run(benchmark, results, document, op, cls, fn, *args, num_ops=None):
+    """
+    Benchmark `fn(*args)`, and record the time per node (or per operation,
+    if `num_ops` is passed).
+    """
+    nodes = document['nodes']
+    rounds = max(3, min(100, 1_000_000 // nodes))
+
+    benchmark.group = f"scaling: {document['scenario']}"
+    result = benchmark.pedantic(fn, args=args, rounds=rounds, iterations=1)
+
+    ns_per_node = benchmark.stats.stats.mean * 1e9 / (num_ops or nodes)
+
+    info = {'scenario': document['scenario'], 'index': document['index'],
+            'param': document['param'], 'op': op, 'class': cls.__name__,
+            'nodes': nodes, 'megabytes': document['megabytes'],
+            'ns_per_node': ns_per_node}
+
+    benchmark.extra_info.update(info)
+    results.append(info)
+
+    return result
+
+
+@pytest.mark.parametrize('cls', [dotwiz.DotWiz, dotwiz.DotWizPlus])
+def test_create(benchmark, scaling_results, document, cls):
+    result = run(benchmark, scaling_results, document, 'create', cls,
+                 cls, document['data'])
+
+    assert len(result['records']) == len(document['data']['records'])
+
+
+@pytest.mark.parametrize('cls', [dotwiz.DotWiz, dotwiz.DotWizPlus])
+def test_access(benchmark, scaling_results, document, cls):
+    """Read a sample of leaf values by their path; the cost is per path"""
+    o = cls(document['data'])
+    getters = [dotwiz.path(p).get for p in document['paths']]
+
+    def access():
+        return [get(o) for get in getters]
+
+    result = run(benchmark, scaling_results, document, 'access', cls,
+                 access, num_ops=len(getters))
+
+    assert len(result) == len(getters)
+
+
+@pytest.mark.parametrize('cls', [dotwiz.DotWiz, dotwiz.DotWizPlus])
+def test_to_dict(benchmark, scaling_results, document, cls):
+    o = cls(document['data'])
+
+    result = run(benchmark, scaling_results, document, 'to_dict', cls,
+                 o.to_dict)
+
+    assert result == document['data']
@@ -0,0 +1,175 @@
+import addict
+import box
+import dict2dot
+import dotmap
+import dotsi
+import dotted_dict
+import metadict
+import prodict
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.setattr,
+              pytest.mark.benchmark(group='setattr')]
+
+
+@pytest.fixture
+def my_data():
+    return {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]}}
+
+
+def set_attr(o):
+    """Return a function which sets a (scalar) value via dot access"""
+    def set_value():
+        o.b = 2
+
+    return set_value
+
+
+def set_item(o):
+    """Return a function which sets a (scalar) value via item access"""
+    def set_value():
+        o['b'] = 2
+
+    return set_value
+
+
+def test_dict_setitem(benchmark, my_data):
+    o = my_data
+
+    benchmark(set_item(o))
+    assert o['b'] == 2
+
+
+def test_box(benchmark, my_data):
+    o = box.Box(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
+
+
+def test_dotwiz(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == o['b'] == 2
+
+
+def test_dotwiz_setitem(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+
+    benchmark(set_item(o))
+    assert o.b == o['b'] == 2
+
+
+def test_dotwiz_nested_value(benchmark, my_data):
+    """Set a nested `dict` value, which is converted to a `DotWiz`"""
+    o = dotwiz.DotWiz(my_data)
+
+    def set_value():
+        o.c = {'aa': 1, 'bb': [{'x': 2}]}
+
+    benchmark(set_value)
+    assert o.c.bb[0].x == 2
+
+
+def test_dotwiz_lite(benchmark, my_data):
+    o = dotwiz.DotWizLite(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == o['b'] == 2
+
+
+def test_dotwiz_specialized(benchmark, my_data):
+    o = dotwiz.DotWiz.specialize(my_data)(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == o['b'] == 2
+
+
+def test_dotwiz_plus(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == o['b'] == 2
+
+
+def test_dotwiz_plus_setitem(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    benchmark(set_item(o))
+    assert o.b == o['b'] == 2
+
+
+def test_dotwiz_plus_special_key(benchmark, my_data):
+    """Set a value for a key which is converted to *snake case*"""
+    o = dotwiz.DotWizPlus(my_data)
+
+    def set_value():
+        o['someKey'] = 2
+
+    benchmark(set_value)
+    assert o.some_key == 2
+
+
+def test_dotwiz_plus_nested_value(benchmark, my_data):
+    """Set a nested `dict` value, which is converted to a `DotWizPlus`"""
+    o = dotwiz.DotWizPlus(my_data)
+
+    def set_value():
+        o.c = {'aa': 1, 'bb': [{'x': 2}]}
+
+    benchmark(set_value)
+    assert o.c.bb[0].x == 2
+
+
+def test_dotmap(benchmark, my_data):
+    o = dotmap.DotMap(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
+
+
+def test_dotted_dict(benchmark, my_data):
+    o = dotted_dict.DottedDict(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
+
+
+def test_dotsi(benchmark, my_data):
+    o = dotsi.Dict(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
+
+
+def test_dict2dot(benchmark, my_data):
+    o = dict2dot.Dict2Dot(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
+
+
+def test_addict(benchmark, my_data):
+    o = addict.Dict(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
+
+
+def test_metadict(benchmark, my_data):
+    o = metadict.MetaDict(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
+
+
+def test_prodict(benchmark, my_data):
+    o = prodict.Prodict.from_dict(my_data)
+
+    benchmark(set_attr(o))
+    assert o.b == 2
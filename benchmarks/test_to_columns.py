@@ -0,0 +1,51 @@
+from array import array
+
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.to_columns,
+              pytest.mark.benchmark(group='to_columns')]
+
+
+PATHS = ['id', 'user.age', 'user.score', 'order.total']
+
+TYPE_CODES = {'id': 'q', 'user.age': 'q'}
+
+
+@pytest.fixture(scope='module')
+def records():
+    return dotwiz.DotWiz.from_records(
+        {'id': i,
+         'user': {'age': i % 90, 'score': i / 2},
+         'order': {'total': i * 1.5}}
+        for i in range(100_000))
+
+
+def test_list_comprehensions(benchmark, records):
+    """One list comprehension (with attribute access) for each column"""
+
+    def to_columns():
+        return {'id': array('q', [r.id for r in records]),
+                'user.age': array('q', [r.user.age for r in records]),
+                'user.score': array('d', [r.user.score for r in records]),
+                'order.total': array('d', [r.order.total for r in records])}
+
+    result = benchmark(to_columns)
+    assert result['user.age'][91] == 1
+
+
+def test_to_columns(benchmark, records):
+    result = benchmark(dotwiz.to_columns, records, PATHS, TYPE_CODES,
+                       use_numpy=False)
+    assert result['user.age'][91] == 1
+
+
+def test_to_columns_numpy(benchmark, records):
+    pytest.importorskip('numpy')
+
+    result = benchmark(dotwiz.to_columns, records, PATHS, TYPE_CODES,
+                       use_numpy=True)
+    assert result['user.age'][91] == 1
@@ -0,0 +1,87 @@
+import addict
+import box
+import dotmap
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.to_dict,
+              pytest.mark.benchmark(group='to_dict')]
+
+
+@pytest.fixture
+def my_data():
+    return {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]},
+            'someKey': {'Other Key': [1, 2, {'x': 'y'}]}}
+
+
+def test_box(benchmark, my_data):
+    o = box.Box(my_data)
+
+    result = benchmark(o.to_dict)
+    assert result == my_data
+
+
+def test_dotwiz(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+
+    result = benchmark(o.to_dict)
+    assert result == my_data
+
+
+def test_dotwiz_preserve_refs(benchmark, my_data):
+    o = dotwiz.DotWiz(my_data)
+
+    result = benchmark(o.to_dict, preserve_refs=True)
+    assert result == my_data
+
+
+def test_dotwiz_lite(benchmark, my_data):
+    o = dotwiz.DotWizLite(my_data)
+
+    result = benchmark(o.to_dict)
+    assert result == my_data
+
+
+def test_lazy_dotwiz(benchmark, my_data):
+    o = dotwiz.LazyDotWiz(my_data)
+
+    result = benchmark(o.to_dict)
+    assert result == my_data
+
+
+def test_frozen_dotwiz(benchmark, my_data):
+    o = dotwiz.FrozenDotWiz(my_data)
+
+    result = benchmark(o.to_dict)
+    assert result == my_data
+
+
+def test_dotwiz_plus(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    result = benchmark(o.to_dict)
+    assert result == my_data
+
+
+def test_dotwiz_plus_to_attr_dict(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    result = benchmark(o.to_attr_dict)
+    assert result['some_key']['other_key'][2] == {'x': 'y'}
+
+
+def test_dotmap(benchmark, my_data):
+    o = dotmap.DotMap(my_data)
+
+    result = benchmark(o.toDict)
+    assert result == my_data
+
+
+def test_addict(benchmark, my_data):
+    o = addict.Dict(my_data)
+
+    result = benchmark(o.to_dict)
+    assert result == my_data
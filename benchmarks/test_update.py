@@ -0,0 +1,125 @@
+import addict
+import box
+import dict2dot
+import dotmap
+import dotsi
+import dotted_dict
+import metadict
+import prodict
+import pytest
+
+import dotwiz
+
+
+# Mark all benchmarks in this module, and assign them to the specified group.
+pytestmark = [pytest.mark.update,
+              pytest.mark.benchmark(group='update')]
+
+
+@pytest.fixture
+def my_data():
+    return {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]}}
+
+
+@pytest.fixture
+def new_data():
+    return {'b': 2, 'c': {'aa': 1, 'bb': [{'x': 2}]}, 'd': 'new'}
+
+
+def test_dict(benchmark, my_data, new_data):
+    o = my_data
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
+
+
+def test_box(benchmark, my_data, new_data):
+    o = box.Box(my_data)
+
+    benchmark(o.update, new_data)
+    assert o.c.bb[0].x == 2
+
+
+def test_dotwiz(benchmark, my_data, new_data):
+    o = dotwiz.DotWiz(my_data)
+
+    benchmark(o.update, new_data)
+    assert o.c.bb[0].x == 2
+
+
+def test_dotwiz_lite(benchmark, my_data, new_data):
+    o = dotwiz.DotWizLite(my_data)
+
+    benchmark(o.update, new_data)
+    assert o.c.bb[0].x == 2
+
+
+def test_dotwiz_specialized(benchmark, my_data, new_data):
+    o = dotwiz.DotWiz.specialize(my_data)(my_data)
+
+    benchmark(o.update, new_data)
+    assert o.c.bb[0].x == 2
+
+
+def test_dotwiz_plus(benchmark, my_data, new_data):
+    o = dotwiz.DotWizPlus(my_data)
+
+    benchmark(o.update, new_data)
+    assert o.c.bb[0].x == 2
+
+
+def test_dotwiz_plus_special_keys(benchmark, my_data):
+    o = dotwiz.DotWizPlus(my_data)
+    new_data = {'someKey': 2, 'Other Key': {'innerKey': [{'x': 2}]}}
+
+    benchmark(o.update, new_data)
+    assert o.other_key.inner_key[0].x == 2
+
+
+def test_dotmap(benchmark, my_data, new_data):
+    o = dotmap.DotMap(my_data)
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
+
+
+def test_dotted_dict(benchmark, my_data, new_data):
+    o = dotted_dict.DottedDict(my_data)
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
+
+
+def test_dotsi(benchmark, my_data, new_data):
+    o = dotsi.Dict(my_data)
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
+
+
+def test_dict2dot(benchmark, my_data, new_data):
+    o = dict2dot.Dict2Dot(my_data)
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
+
+
+def test_addict(benchmark, my_data, new_data):
+    o = addict.Dict(my_data)
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
+
+
+def test_metadict(benchmark, my_data, new_data):
+    o = metadict.MetaDict(my_data)
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
+
+
+def test_prodict(benchmark, my_data, new_data):
+    o = prodict.Prodict.from_dict(my_data)
+
+    benchmark(o.update, new_data)
+    assert o['c']['bb'][0]['x'] == 2
@@ -25,15 +25,92 @@ For full documentation and more advanced usage, please see
 """
 
 __all__ = [
+    'ColumnarList',
+    'DotPath',
     'DotWiz',
+    'DotWizLite',
     'DotWizPlus',
+    'Extractor',
+    'FrozenDotWiz',
+    'FrozenDotWizPlus',
+    'LazyDotWiz',
+    'LazyDotWizPlus',
+    'clear_key_cache',
+    'configure_key_cache',
+    'disable_instrumentation',
+    'enable_instrumentation',
+    'extractor',
+    'get_key_normalizer',
+    'instrumentation_snapshot',
+    'is_instrumentation_enabled',
+    'iter_json_lines',
+    'key_cache_info',
     'make_dot_wiz',
     'make_dot_wiz_plus',
+    'path',
+    'profile',
+    'register_key_normalizer',
+    'reset_instrumentation',
     'set_default_for_missing_keys',
+    'set_key_normalizer',
+    'to_columns',
 ]
 
-from .main import DotWiz, make_dot_wiz
-from .plus import DotWizPlus, make_dot_wiz_plus
+from importlib import import_module
+from threading import Lock
+
+from .main import DotWiz, DotWizLite, LazyDotWiz, make_dot_wiz
+from .paths import (DotPath, Extractor, extractor, path,
+                    __clear_attr_types__)
+
+
+# The exported names which are imported on first use, and the module for
+# each; the `plus` module (and `pyheck`) is only needed for `DotWizPlus`,
+# so this speeds up `import dotwiz` where only `DotWiz` is used. The same
+# goes for the optional features, such as instrumentation.
+__LAZY_NAMES = {
+    'ColumnarList': '.columnar',
+    'to_columns': '.columns',
+    'enable_instrumentation': '.instrument',
+    'disable_instrumentation': '.instrument',
+    'instrumentation_snapshot': '.instrument',
+    'is_instrumentation_enabled': '.instrument',
+    'profile': '.instrument',
+    'reset_instrumentation': '.instrument',
+    'iter_json_lines': '.loaders',
+    'DotWizPlus': '.plus',
+    'LazyDotWizPlus': '.plus',
+    'make_dot_wiz_plus': '.plus',
+    'clear_key_cache': '.plus',
+    'configure_key_cache': '.plus',
+    'key_cache_info': '.plus',
+    'get_key_normalizer': '.plus',
+    'register_key_normalizer': '.plus',
+    'set_key_normalizer': '.plus',
+    'FrozenDotWiz': '.frozen',
+    'FrozenDotWizPlus': '.frozen',
+}
+
+
+def __getattr__(name):
+    """Import an exported name, such as :class:`DotWizPlus`, on first use."""
+    module = __LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+    value = getattr(import_module(module, __name__), name)
+    # cache the value, so `__getattr__()` is not called again for it
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *__all__})
+
+
+# Serializes changes made by `set_default_for_missing_keys()`
+__SET_DEFAULT_LOCK = Lock()
 
 
 def set_default_for_missing_keys(default=None, overwrite=False):
@@ -60,18 +137,30 @@ def set_default_for_missing_keys(default=None, overwrite=False):
       if one already exists; defaults to False.
 
     """
-    for cls in DotWiz, DotWizPlus:
-        cls_dict = cls.__dict__
+    from .plus import DotWizPlus
+
+    classes = DotWiz, DotWizPlus
+
+    # note: the lock ensures that either all classes are modified, or none
+    # are, when this is called from multiple threads at once.
+    with __SET_DEFAULT_LOCK:
+        if not overwrite:
+            for cls in classes:
+                if '__getattr__' in cls.__dict__:
+                    msg = f'{cls.__qualname__} already defines a __getattr__() - ' \
+                          f'pass `overwrite=True` to continue anyway.'
+                    raise ValueError(msg)
+
+        for cls in classes:
+            cls_dict = cls.__dict__
 
-        if not overwrite and '__getattr__' in cls_dict:
-            msg = f'{cls.__qualname__} already defines a __getattr__() - ' \
-                  f'pass `overwrite=True` to continue anyway.'
-            raise ValueError(msg)
+            def __getattr__(self: cls, item: str,
+                            __default=default,
+                            __get=cls_dict.get):
 
-        def __getattr__(self: cls, item: str,
-                        __default=default,
-                        __get=cls_dict.get):
+                return __get(item, __default)
 
-            return __get(item, __default)
+            setattr(cls, '__getattr__', __getattr__)
 
-        setattr(cls, '__getattr__', __getattr__)
+        # a path can no longer be looked up with attribute access
+        __clear_attr_types__()
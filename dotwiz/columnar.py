@@ -0,0 +1,241 @@
+"""Columnar storage for lists of records which share one set of keys."""
+from .common import __convert_to_dict__, __resolve_value__
+from .main import DotWiz
+
+
+def __row_property__(column, cls):
+    """
+    Return a property to get (and set) the value in `column` for a row in
+    a :class:`ColumnarList`.
+    """
+    def fget(self, __column=column):
+        return __column[self.__row__]
+
+    def fset(self, value, __column=column):
+        __column[self.__row__] = __resolve_value__(value, cls)
+
+    return property(fget, fset)
+
+
+def __attr_names_for__(keys, cls):
+    """
+    Return the attribute name for each key in `keys`, as used by `cls`; for
+    a :class:`DotWizPlus`, for example, this is the name in *snake case*.
+    """
+    attrs = list(cls(dict.fromkeys(keys)).__dict__)
+
+    if len(attrs) != len(keys):
+        # some keys map to the same attribute, so use the original names
+        return keys
+
+    return attrs
+
+
+def __immutable_rows__(self, *args, **kwargs):
+    """Raise an error, as rows can't be added to or removed from the list"""
+    raise TypeError(f'{type(self).__name__!r} object does not support '
+                    f'adding or removing rows')
+
+
+class ColumnarRow:
+    """
+    A lightweight view of one row in a :class:`ColumnarList`, which reads
+    (and writes) each value in the column for its key.
+
+    A row supports attribute access, such as ``row.name``, and the common
+    ``dict`` methods, but it can't have a new key added to it.
+
+    """
+    __slots__ = ('__row__', )
+
+    # the mapping of key to column, and the class used to convert (nested)
+    # values; these are set on the row class made for each list.
+    __columns__ = {}
+    __cls__ = DotWiz
+
+    def __getitem__(self, key):
+        return self.__columns__[key][self.__row__]
+
+    def __setitem__(self, key, value):
+        self.__columns__[key][self.__row__] = __resolve_value__(value, self.__cls__)
+
+    def __contains__(self, key):
+        return key in self.__columns__
+
+    def __iter__(self):
+        return iter(self.__columns__)
+
+    def __len__(self):
+        return len(self.__columns__)
+
+    def __eq__(self, other):
+        if isinstance(other, (dict, ColumnarRow)):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(self.__cls__(dict(self.items())))
+
+    def get(self, key, default=None):
+        column = self.__columns__.get(key)
+        return default if column is None else column[self.__row__]
+
+    def keys(self):
+        return self.__columns__.keys()
+
+    def values(self):
+        i = self.__row__
+        return [column[i] for column in self.__columns__.values()]
+
+    def items(self):
+        i = self.__row__
+        return [(key, column[i]) for key, column in self.__columns__.items()]
+
+    def to_dict(self):
+        """Recursively convert the row to a ``dict``."""
+        return __convert_to_dict__(dict(self.items()))
+
+
+class ColumnarList(list):
+    """
+    :class:`ColumnarList` - a ``list`` of records which all share one set
+    of keys, such as the rows in a large JSON API response.
+
+    Instead of a :class:`DotWiz` (with two hash tables) for each record,
+    the values are stored column-wise, in one ``list`` per key; each
+    element is then a lightweight :class:`ColumnarRow` view, which supports
+    attribute access (``rows[i].field``), indexing (``rows[i]['field']``),
+    and :meth:`to_dict`. Nested ``dict`` and ``list`` values are converted
+    to `cls` as usual.
+
+    Rows can't be added or removed once the list is created, but a value
+    in a row can be changed.
+
+    Usage::
+
+        >>> from dotwiz import ColumnarList, DotWiz
+        >>> dw = DotWiz(count=2)
+        >>> dw.rows = ColumnarList([{'id': 1, 'tags': ['a']}, {'id': 2, 'tags': []}])
+        >>> dw.rows[1].id
+        2
+        >>> dw.to_dict()
+        {'count': 2, 'rows': [{'id': 1, 'tags': ['a']}, {'id': 2, 'tags': []}]}
+
+    :param records: An iterable of ``dict`` (or :class:`DotWiz`) objects,
+      which must all have the same keys.
+    :param cls: The class (such as :class:`DotWiz` or :class:`DotWizPlus`)
+      to use for attribute names, and for nested values.
+
+    """
+    __slots__ = ('__columns__', '__cls__')
+
+    # noinspection PyMissingConstructor
+    def __init__(self, records=(), cls=DotWiz,
+                 __get=dict.__getitem__):
+
+        records = records if type(records) is list else list(records)
+
+        keys = tuple(dict.keys(records[0])) if records else ()
+        num_keys = len(keys)
+
+        columns = {key: [] for key in keys}
+        appends = [(key, column.append) for key, column in columns.items()]
+
+        for i, record in enumerate(records):
+            if len(record) != num_keys:
+                raise ValueError(f'record {i} does not have the same keys '
+                                 f'as the first record: {keys!r}')
+            try:
+                for key, append in appends:
+                    # note: this is the same as `__resolve_value__()`, but
+                    # it's faster to only call it for a `dict` or `list`.
+                    value = __get(record, key)
+                    t = type(value)
+                    if t is dict or t is list:
+                        value = __resolve_value__(value, cls)
+                    append(value)
+
+            except KeyError:
+                raise ValueError(f'record {i} does not have the same keys '
+                                 f'as the first record: {keys!r}') from None
+
+        __add_rows__(self, columns, cls, len(records))
+
+    def __reduce__(self):
+        # the row views are not pickled, as they're created from the columns
+        return __columnar_list_from_columns__, (self.__columns__, self.__cls__)
+
+    def column(self, key):
+        """Return the ``list`` of values for `key`, one for each row."""
+        return self.__columns__[key]
+
+    def to_list(self):
+        """Recursively convert the rows to a ``list`` of ``dict`` objects."""
+        return __convert_to_dict__(self.to_objects())
+
+    def to_objects(self):
+        """Return a ``list`` with a new `cls` object for each row."""
+        cls = self.__cls__
+        keys = tuple(self.__columns__)
+
+        return [cls(dict(zip(keys, values)))
+                for values in zip(*self.__columns__.values())]
+
+    # called by `to_dict()`, to convert the rows
+    __objects__ = to_objects
+
+    append = extend = insert = pop = remove = clear = __immutable_rows__
+    sort = reverse = __immutable_rows__
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = __immutable_rows__
+
+
+# the names of the `ColumnarRow` methods, which a key can't shadow.
+__ROW_NAMES = frozenset(dir(ColumnarRow))
+
+
+def __add_rows__(self, columns, cls, num_rows,
+                 __set_row=ColumnarRow.__row__.__set__,
+                 __row_names=__ROW_NAMES):
+    """
+    Set up a :class:`ColumnarList` for `columns`, and add a view for each
+    of its `num_rows` rows.
+    """
+    self.__columns__ = columns
+    self.__cls__ = cls
+
+    keys = tuple(columns)
+    row_dict = {'__slots__': (), '__columns__': columns, '__cls__': cls}
+
+    for key, attr in zip(keys, __attr_names_for__(keys, cls)):
+        # a key such as `items` (or one which is not a valid identifier)
+        # is only accessible with `row[key]`.
+        if (type(attr) is str and attr.isidentifier()
+                and not attr.startswith('__') and attr not in __row_names):
+            row_dict[attr] = __row_property__(columns[key], cls)
+
+    row_cls = type(ColumnarRow.__name__, (ColumnarRow, ), row_dict)
+    new = row_cls.__new__
+
+    rows = []
+    append_row = rows.append
+
+    for i in range(num_rows):
+        row = new(row_cls)
+        __set_row(row, i)
+        append_row(row)
+
+    list.extend(self, rows)
+
+
+def __columnar_list_from_columns__(columns, cls):
+    """
+    Create a :class:`ColumnarList` from its `columns`; used when unpickling.
+    """
+    self = ColumnarList.__new__(ColumnarList)
+    num_rows = len(next(iter(columns.values()))) if columns else 0
+
+    __add_rows__(self, columns, cls, num_rows)
+
+    return self
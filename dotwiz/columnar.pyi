@@ -0,0 +1,86 @@
+from typing import Any, Callable, Iterable, Mapping, NoReturn, TypeVar
+
+from .main import DotWiz
+from .plus import DotWizPlus
+
+_KT = TypeVar('_KT')
+_VT = TypeVar('_VT')
+_D = TypeVar('_D', bound=DotWiz | DotWizPlus)
+
+
+def __row_property__(column: list[_VT], cls: type[_D]) -> property: ...
+
+def __attr_names_for__(keys: tuple[_KT, ...], cls: type[_D]) -> list[str] | tuple[_KT, ...]: ...
+
+def __immutable_rows__(self: ColumnarList, *args, **kwargs) -> NoReturn: ...
+
+
+class ColumnarRow:
+
+    __columns__: dict[_KT, list[_VT]]
+    __cls__: type[_D]
+
+    def __getitem__(self, key: _KT) -> _VT: ...
+    def __setitem__(self, key: _KT, value: _VT) -> None: ...
+    def __contains__(self, key: object) -> bool: ...
+    def __iter__(self) -> Iterable[_KT]: ...
+    def __len__(self) -> int: ...
+    def __eq__(self, other: object) -> bool: ...
+    def __getattr__(self, item: str) -> _VT: ...
+    def __setattr__(self, item: str, value: _VT) -> None: ...
+    def __repr__(self) -> str: ...
+
+    def get(self, key: _KT, default: _VT | None = None) -> _VT | None: ...
+    def keys(self) -> Iterable[_KT]: ...
+    def values(self) -> list[_VT]: ...
+    def items(self) -> list[tuple[_KT, _VT]]: ...
+
+    def to_dict(self) -> dict[_KT, _VT]:
+        """Recursively convert the row to a ``dict``."""
+        ...
+
+
+class ColumnarList(list[ColumnarRow]):
+
+    __columns__: dict[_KT, list[_VT]]
+    __cls__: type[_D]
+
+    def __init__(self,
+                 records: Iterable[Mapping[_KT, _VT]] = (),
+                 cls: type[_D] = DotWiz,
+                 *, __get: Callable[[dict, _KT], _VT] = dict.__getitem__) -> None: ...
+
+    def __reduce__(self) -> tuple[Callable[..., ColumnarList], tuple[dict[_KT, list[_VT]], type[_D]]]: ...
+
+    def column(self, key: _KT) -> list[_VT]:
+        """Return the ``list`` of values for `key`, one for each row."""
+        ...
+
+    def to_list(self) -> list[dict[_KT, _VT]]:
+        """Recursively convert the rows to a ``list`` of ``dict`` objects."""
+        ...
+
+    def to_objects(self) -> list[_D]:
+        """Return a ``list`` with a new `cls` object for each row."""
+        ...
+
+    def __objects__(self) -> list[_D]: ...
+
+    def append(self, *args, **kwargs) -> NoReturn: ...
+    def extend(self, *args, **kwargs) -> NoReturn: ...
+    def insert(self, *args, **kwargs) -> NoReturn: ...
+    def pop(self, *args, **kwargs) -> NoReturn: ...
+    def remove(self, *args, **kwargs) -> NoReturn: ...
+    def clear(self, *args, **kwargs) -> NoReturn: ...
+    def sort(self, *args, **kwargs) -> NoReturn: ...
+    def reverse(self, *args, **kwargs) -> NoReturn: ...
+
+
+def __add_rows__(self: ColumnarList,
+                 columns: dict[_KT, list[_VT]],
+                 cls: type[_D],
+                 num_rows: int,
+                 *, __set_row: Callable[[ColumnarRow, int], None] = ...) -> None: ...
+
+def __columnar_list_from_columns__(columns: dict[_KT, list[_VT]],
+                                   cls: type[_D]) -> ColumnarList: ...
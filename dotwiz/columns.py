@@ -0,0 +1,117 @@
+"""Export lists of `DotWiz` records to columns, for numeric pipelines."""
+from array import array
+from itertools import islice
+
+from .common import _MISSING
+from .paths import extractor
+
+
+# The number of records to read values from, before copying the values
+# into each column.
+__CHUNK_SIZE = 1024
+
+# The `numpy` module, or None if it's not installed; set on first use.
+__NUMPY = _MISSING
+
+
+def __import_numpy__():
+    """
+    Return the `numpy` module, or None if it's not installed; the result
+    is cached, so a failed import is not attempted again.
+    """
+    global __NUMPY
+
+    if __NUMPY is _MISSING:
+        try:
+            import numpy
+        except ImportError:  # pragma: no cover
+            numpy = None
+
+        __NUMPY = numpy
+
+    return __NUMPY
+
+
+def to_columns(records, paths, dtype='d', fill_value=_MISSING,
+               use_numpy=None):
+    """
+    Export the value at each path in `records` - such as a ``list`` of
+    :class:`DotWiz` or :class:`DotWizPlus` objects, or plain ``dict``
+    objects - to a column, and return a ``dict`` of path to column.
+
+    Each column is allocated once, with a slot for each record, as either
+    a NumPy array or an :class:`array.array`. The values are read from
+    a chunk of records at a time with an :func:`extractor`, and then copied
+    into each column in bulk.
+
+    Example::
+
+        >>> from dotwiz import DotWiz, to_columns
+        >>> records = [DotWiz(id=1, price={'amount': 9.5}), DotWiz(id=2, price={})]
+        >>> to_columns(records, ['id', 'price.amount'], dtype={'id': 'q'},
+        ...            fill_value=float('nan'), use_numpy=False)
+        {'id': array('q', [1, 2]), 'price.amount': array('d', [9.5, nan])}
+
+    :param records: A sequence (or iterable) of objects.
+    :param paths: The path of each column, such as ``'order.total'``;
+      see :func:`path`.
+    :param dtype: The type code for each column, as used by
+      :class:`array.array` (and understood by NumPy) - such as ``'d'`` for
+      a ``float``, or ``'q'`` for an ``int`` - or a ``dict`` which maps a
+      path to its type code; the default is ``'d'``.
+    :param fill_value: The value to use for a path which is not found in a
+      record. If not passed, a missing path raises a :exc:`KeyError`.
+    :param use_numpy: True to return NumPy arrays, or False to return
+      :class:`array.array` objects; the default is to use NumPy if it's
+      installed.
+
+    """
+    # NumPy is only imported here, as it's slow to import, and it's not
+    # needed at all for `use_numpy=False`.
+    numpy = None if use_numpy is False else __import_numpy__()
+
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError('NumPy is required for `use_numpy=True`')
+
+    if not hasattr(records, '__len__'):
+        records = list(records)
+
+    ex = extractor(paths, default=fill_value)
+    get = ex.get
+    specs = [p.spec for p in ex.paths]
+
+    if type(dtype) is str:
+        type_codes = [dtype] * len(specs)
+    else:
+        type_codes = [dtype.get(spec, 'd') for spec in specs]
+
+    n = len(records)
+
+    if use_numpy:
+        columns = [numpy.empty(n, dtype=code) for code in type_codes]
+    else:
+        columns = [array(code, bytes(array(code).itemsize * n))
+                   for code in type_codes]
+
+    it = iter(records)
+    start = 0
+
+    while start < n:
+        rows = list(map(get, islice(it, __CHUNK_SIZE)))
+        if not rows:
+            break
+
+        stop = start + len(rows)
+
+        if use_numpy:
+            for column, values in zip(columns, zip(*rows)):
+                column[start:stop] = values
+        else:
+            for column, code, values in zip(columns, type_codes, zip(*rows)):
+                column[start:stop] = array(code, values)
+
+        start = stop
+
+    return dict(zip(specs, columns))
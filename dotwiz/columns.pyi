@@ -0,0 +1,18 @@
+from array import array
+from typing import Any, Iterable, Mapping, Sequence
+
+from .main import DotWiz
+from .paths import DotPath
+from .plus import DotWizPlus
+
+_Record = dict | DotWiz | DotWizPlus
+_Spec = str | Sequence[Any] | DotPath
+
+__CHUNK_SIZE: int = ...
+
+
+def to_columns(records: Iterable[_Record],
+               paths: Sequence[_Spec] | Mapping[_Spec, Any],
+               dtype: str | Mapping[_Spec, str] = 'd',
+               fill_value: Any = ...,
+               use_numpy: bool | None = None) -> dict[_Spec, array | Any]: ...
@@ -1,6 +1,31 @@
 """
 Common (shared) helpers and utilities.
 """
+import copy
+import copyreg
+import json
+from collections import namedtuple
+from reprlib import recursive_repr
+from threading import Lock
+
+
+# Sentinel value for a missing key
+_MISSING = object()
+
+# The depth of nested values at which `__convert_to_dict__()` checks for
+# a circular reference
+__CHECK_CYCLE_DEPTH = 1000
+
+# Types of (immutable) values which a deep copy can share with the original
+__ATOMIC_TYPES = frozenset({str, int, float, bool, type(None), bytes, complex})
+
+# Statistics for a `KeyCache`, in the style of `functools.lru_cache`
+CacheInfo = namedtuple('CacheInfo',
+                       ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+# Each class with a `__repr__` which doesn't guard against circular
+# references yet, and the guarded `__repr__` to set; see `__guard_reprs__()`
+__UNGUARDED_REPRS = []
 
 
 def __add_repr__(name, bases, cls_dict, *, print_char='*', use_attr_dict=False):
@@ -22,39 +47,427 @@ def __add_repr__(name, bases, cls_dict, *, print_char='*', use_attr_dict=False):
             return f'{print_char}({", ".join(fields)})'
 
     cls_dict['__repr__'] = __repr__
+    cls = type(name, bases, cls_dict)
+
+    # the guard against infinite recursion, for objects with circular
+    # references, makes `repr()` about a third slower; so it's only added
+    # once `from_graph()` - which can create such objects - is called, or
+    # an object - which can be from `from_graph()` in another process - is
+    # unpickled or copied.
+    __UNGUARDED_REPRS.append(
+        (cls, recursive_repr(f'{print_char}(...)')(__repr__)))
+
+    return cls
+
+
+def __guard_reprs__():
+    """
+    Set the `__repr__` which guards against circular references on each
+    class which doesn't have it yet.
+    """
+    for cls, guarded_repr in __UNGUARDED_REPRS:
+        cls.__repr__ = guarded_repr
+
+    __UNGUARDED_REPRS.clear()
+
+
+def __getitem_from_dict__(self, key):
+    """Return the value for `key` in an object's `__dict__`"""
+    return self.__dict__[key]
+
+
+def __reduce_ex_impl__(self, protocol, __newobj=copyreg.__newobj__):
+    """
+    Return the arguments to :mod:`pickle` (or :mod:`copy`) an object.
+
+    The object is created empty via ``cls.__new__(cls)``, and its state,
+    from :meth:`__getstate__`, is then restored by :meth:`__setstate__`;
+    unlike the default for a ``dict`` subclass, each value is only written
+    once, and values which are already converted are not passed through
+    :meth:`__init__` again.
+    """
+    return __newobj, (type(self), ), self.__getstate__()
+
 
-    return type(name, bases, cls_dict)
+def __copy_with_state__(self, __new=dict.__new__):
+    """
+    Return a shallow copy of an object, for :func:`copy.copy`.
+
+    The state from :meth:`__getstate__` is restored on a new object as is,
+    so nested values are shared, and no key is converted again.
+    """
+    new = __new(type(self))
+    new.__setstate__(self.__getstate__())
+    return new
+
+
+def __deepcopy_with_state__(self, memo, __new=dict.__new__):
+    """
+    Return a deep copy of an object, for :func:`copy.deepcopy`.
+
+    Each ``dict`` in the state from :meth:`__getstate__` - which is already
+    a new copy - has its values replaced with a deep copy, and the state is
+    then restored on a new object, so no key is converted again.
+    """
+    new = __new(type(self))
+    memo[id(self)] = new
+
+    state = self.__getstate__()
+
+    for d in (state, ) if type(state) is dict else state:
+        if type(d) is dict:
+            __deepcopy_values__(d, memo)
+
+    new.__setstate__(state)
+    return new
 
 
-def __convert_to_attr_dict__(o):
+def __iter_lazy_impl__(self, __iter=dict.__iter__):
     """
-    Recursively convert an object (typically a `dict` subclass) to a
-    Python `dict` type, while preserving the lower-cased keys used
-    for attribute access.
+    Return an iterator over the keys of a lazy object.
+
+    Defining this method is enough for ``dict(o)`` and ``{**o}`` to copy
+    each value via :meth:`__getitem__` - which converts it - rather than
+    reading the ``dict`` storage directly.
+    """
+    return __iter(self)
+
+
+def __pop_lazy_impl__(self, key, default=_MISSING,
+                      __contains=dict.__contains__,
+                      __delete=dict.__delitem__):
+    """
+    Remove `key` from a lazy object, and return its (converted) value, or
+    `default` if the key is missing.
+    """
+    if __contains(self, key):
+        value = self[key]
+        __delete(self, key)
+        return value
+
+    if default is _MISSING:
+        raise KeyError(key)
+
+    return default
+
+
+def __popitem_lazy_impl__(self, __keys=dict.keys):
     """
+    Remove the last key from a lazy object, and return the key and its
+    (converted) value.
+    """
+    for key in reversed(__keys(self)):
+        return key, __pop_lazy_impl__(self, key)
+
+    raise KeyError('popitem(): dictionary is empty')
+
+
+def __setdefault_lazy_impl__(self, key, default=None,
+                             __contains=dict.__contains__):
+    """
+    Return the (converted) value for `key` in a lazy object, after setting
+    it to `default` if the key is missing.
+    """
+    if not __contains(self, key):
+        self[key] = default
+
+    return self[key]
+
+
+def __deepcopy_values__(d, memo, __atomic=__ATOMIC_TYPES,
+                        __deepcopy=copy.deepcopy):
+    """
+    Replace each value in a (new) ``dict`` `d` with a deep copy, in place,
+    and return `d`; values of an immutable type are not copied.
+    """
+    for key, value in d.items():
+        if type(value) not in __atomic:
+            d[key] = __deepcopy(value, memo)
+
+    return d
+
+
+def __attr_items__(o):
+    """Return the attributes (and values) defined in an object's `__dict__`"""
+    return o.__dict__.items()
+
+
+def __convert_to_attr_dict__(o, __items_fn=__attr_items__,
+                             preserve_refs=False, __list_types=list):
+    """
+    Convert an object (typically a `dict` subclass) to a Python `dict`
+    type, while preserving the lower-cased keys used for attribute access.
+    """
+    return __convert_to_dict__(o, __items_fn, preserve_refs, __list_types)
+
+
+def __convert_to_dict__(o, __items_fn=dict.items, preserve_refs=False,
+                        __list_types=list):
+    """
+    Convert an object (typically a `dict` subclass) to a Python `dict`
+    type, including any nested `dict` and `list` values.
+
+    This uses an explicit stack instead of recursion, so that it works with
+    objects of *any* depth, and also avoids a function call per value.
+
+    If `preserve_refs` is true, a nested object which appears in more than
+    one place is only converted once, and the result is shared; this is
+    required for objects with *circular* references. Otherwise, such an
+    object raises a :exc:`ValueError`, as with :func:`json.dumps`.
+
+    Values which are an instance of `__list_types` are converted to a
+    `list`; a frozen object, for example, also passes in `tuple` here.
+    """
+    if preserve_refs:
+        return __convert_graph_to_dict__(o, __items_fn, __list_types)
+
     if isinstance(o, dict):
-        return {k: __convert_to_attr_dict__(v) for k, v in o.__dict__.items()}
+        result = {}
+    elif isinstance(o, __list_types):
+        result = []
+    else:
+        return o
+
+    # a stack of (source, destination, depth) tuples, where `source` is a
+    # `dict` or `list` object that still needs to be copied into
+    # `destination`.
+    stack = [(o, result, 0)]
+    pop = stack.pop
+    push = stack.append
+
+    # the depth at which `o` is checked for a circular reference, which
+    # would otherwise be copied until memory runs out; a (much) deeper
+    # object is rare, so this is only checked once.
+    check_depth = __CHECK_CYCLE_DEPTH
+
+    while stack:
+        src, dst, depth = pop()
+
+        if depth >= check_depth:
+            if __has_cycle__(o, __items_fn, __list_types):
+                raise ValueError('circular reference')
+            check_depth = float('inf')
 
-    if isinstance(o, list):
-        return [__convert_to_attr_dict__(e) for e in o]
+        depth += 1
 
-    return o
+        if type(dst) is dict:
+            # use `dict.items(o)` instead of `o.items()`, to work around this issue:
+            #   https://github.com/rnag/dotwiz/issues/4
+            for k, v in __items_fn(src):
+                if isinstance(v, dict):
+                    dst[k] = new = {}
+                    push((v, new, depth))
+                elif isinstance(v, __list_types):
+                    dst[k] = new = []
+                    push((v, new, depth))
+                else:
+                    dst[k] = v
 
+        else:
+            append = dst.append
 
-def __convert_to_dict__(o, __items_fn=dict.items):
+            # a `list` subclass which stores its elements in another form,
+            # such as a `ColumnarList`, returns them as objects to convert.
+            if type(src) is not list and hasattr(src, '__objects__'):
+                src = src.__objects__()
+
+            for v in src:
+                if isinstance(v, dict):
+                    new = {}
+                    push((v, new, depth))
+                elif isinstance(v, __list_types):
+                    new = []
+                    push((v, new, depth))
+                else:
+                    new = v
+
+                append(new)
+
+    return result
+
+
+def __has_cycle__(o, items_fn, list_types=list):
     """
-    Recursively convert an object (typically a `dict` subclass) to a
-    Python `dict` type.
+    Return true if `o` - a `dict` or `list` object - contains (or is
+    contained in) a nested value which refers back to one of its parents.
+    """
+    # the ids of the objects on the current path from `o`
+    path = set()
+    # each `(obj, False)` entry visits the object, and the `(obj, True)`
+    # entry for it removes the object from the path again.
+    stack = [(o, False)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        src, done = pop()
+
+        if done:
+            path.discard(id(src))
+            continue
+
+        if id(src) in path:
+            return True
+
+        path.add(id(src))
+        push((src, True))
+
+        if isinstance(src, dict):
+            values = [v for _, v in items_fn(src)]
+        else:
+            if type(src) is not list and hasattr(src, '__objects__'):
+                src = src.__objects__()
+            values = src
+
+        for v in values:
+            if isinstance(v, dict) or isinstance(v, list_types):
+                push((v, False))
+
+    return False
+
+
+def __convert_graph_to_dict__(o, items_fn, list_types=list):
+    """
+    Convert an object (typically a `dict` subclass) to a Python `dict`
+    type, converting each distinct nested `dict` or `list` object only
+    once, so that shared and circular references are preserved.
     """
     if isinstance(o, dict):
-        # use `dict.items(o)` instead of `o.items()`, to work around this issue:
-        #   https://github.com/rnag/dotwiz/issues/4
-        return {k: __convert_to_dict__(v) for k, v in __items_fn(o)}
+        result = {}
+    elif isinstance(o, list_types):
+        result = []
+    else:
+        return o
+
+    # mapping of object `id` to its converted value
+    memo = {id(o): result}
+    get = memo.get
+
+    stack = [(o, result)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        src, dst = pop()
+
+        if type(dst) is dict:
+            append = None
+            values = items_fn(src)
+        else:
+            append = dst.append
+            if type(src) is not list and hasattr(src, '__objects__'):
+                src = src.__objects__()
+            values = enumerate(src)
+
+        for k, v in values:
+            if isinstance(v, dict) or isinstance(v, list_types):
+                new = get(id(v))
+
+                if new is None:
+                    memo[id(v)] = new = {} if isinstance(v, dict) else []
+                    push((v, new))
+
+                v = new
+
+            if append is None:
+                dst[k] = v
+            else:
+                append(v)
+
+    return result
+
+
+def __from_graph__(o, dict_type, store_fn):
+    """
+    Convert `o` - a `dict` or `list` which can contain shared or circular
+    references - to a `dict_type`, such as :class:`DotWiz`.
+
+    Each distinct (nested) `dict` or `list` object is converted only once,
+    keyed on its identity, and the result is shared everywhere the object
+    appears; a circular reference therefore stays circular.
+
+    `store_fn` is called with the new `dict_type` instance, its instance
+    ``__dict__``, and the key and (converted) value to store.
+    """
+    if __UNGUARDED_REPRS:
+        __guard_reprs__()
+
+    t = type(o)
+
+    if t is dict:
+        result = dict_type()
+    elif t is list:
+        result = []
+    else:
+        return o
+
+    # mapping of object `id` to its converted value
+    memo = {id(o): result}
+    get = memo.get
+
+    stack = [(o, result)]
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        src, dst = pop()
+
+        if type(src) is dict:
+            __dict = dst.__dict__
+            append = None
+            values = src.items()
+        else:
+            append = dst.append
+            values = enumerate(src)
+
+        for k, v in values:
+            t = type(v)
+
+            if t is dict or t is list:
+                new = get(id(v))
+
+                if new is None:
+                    memo[id(v)] = new = dict_type() if t is dict else []
+                    push((v, new))
+
+                v = new
+
+            if append is None:
+                store_fn(dst, __dict, k, v)
+            else:
+                append(v)
+
+    return result
+
+
+def __from_each_record__(cls, records):
+    """
+    Create a ``list`` of `cls` (a `dict` subclass) instances from an
+    iterable of ``dict`` objects, by calling the constructor for each one.
+    """
+    return list(map(cls, records))
 
-    if isinstance(o, list):
-        return [__convert_to_dict__(e) for e in o]
 
-    return o
+def __from_json__(cls, s, **kwargs):
+    """
+    Create an instance of `cls` (a `dict` subclass) from a JSON string,
+    ``bytes`` or ``bytearray`` object `s`, building each (nested) object
+    directly during parsing, via the ``object_hook`` for `cls`.
+
+    Any additional keyword arguments are passed on to :func:`json.loads`.
+    """
+    return json.loads(s, object_hook=cls.__object_hook__, **kwargs)
+
+
+def __from_json_file__(cls, fp, **kwargs):
+    """
+    Create an instance of `cls` (a `dict` subclass) from a file-like
+    object `fp` containing a JSON document, building each (nested) object
+    directly during parsing, via the ``object_hook`` for `cls`.
+
+    Any additional keyword arguments are passed on to :func:`json.load`.
+    """
+    return json.load(fp, object_hook=cls.__object_hook__, **kwargs)
 
 
 def __resolve_value__(value, dict_type):
@@ -68,3 +481,138 @@ def __resolve_value__(value, dict_type):
         value = [__resolve_value__(e, dict_type) for e in value]
 
     return value
+
+
+class KeyCache:
+    """
+    A bounded cache of key names which have been transformed before (for
+    example, into *snake case*), which keeps a running count of cache
+    hits, misses and evictions.
+
+    :param maxsize: The maximum number of keys to cache. If ``None``, the
+      cache can grow without bound; if ``0``, nothing is cached.
+    :param policy: The eviction policy once the cache is full: either
+      ``'lru'`` to evict the *least recently used* key, or ``'fifo'`` to
+      evict the *oldest* key (which avoids re-ordering keys on a hit).
+
+    **Thread Safety**
+
+    The cache can be shared between threads, including on free-threaded
+    builds of CPython. A cache *hit* does not acquire a lock, and relies
+    only on single (atomic) ``dict`` operations. Changes to the cache -
+    adding or evicting keys, :meth:`configure` and :meth:`clear` - are
+    serialized by a lock.
+
+    As cached values are computed from the key alone, two threads which
+    miss on the same key will both cache the same value. The count of
+    cache *hits* is not updated under the lock, so it is a lower bound
+    when there is contention between threads; all other counts are exact.
+    With an ``'lru'`` policy, a hit can also re-add a key that another
+    thread just evicted, so the size of the cache might briefly exceed
+    `maxsize` by up to the number of threads.
+
+    """
+    __slots__ = ('maxsize', 'policy', 'hits', 'misses', 'evictions',
+                 '_data', '_lru', '_lock')
+
+    POLICIES = ('lru', 'fifo')
+
+    def __init__(self, maxsize=4096, policy='fifo'):
+        self._data = {}
+        self._lock = Lock()
+        self.hits = self.misses = self.evictions = 0
+        self.configure(maxsize, policy)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def configure(self, maxsize=4096, policy='fifo'):
+        """
+        Update the maximum size and eviction policy of the cache, evicting
+        keys if the cache is now over capacity.
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f'Invalid eviction policy {policy!r} - '
+                             f'expected one of: {", ".join(self.POLICIES)}')
+
+        if maxsize is not None and maxsize < 0:
+            raise ValueError(f'maxsize must be None or a non-negative '
+                             f'integer, got: {maxsize!r}')
+
+        with self._lock:
+            self.maxsize = maxsize
+            self.policy = policy
+            self._lru = policy == 'lru'
+
+            if maxsize is not None:
+                self._evict(maxsize)
+
+    def get(self, key, default=None):
+        """Return the cached value for `key`, or `default` on a miss."""
+        data = self._data
+        value = data.get(key, _MISSING)
+
+        if value is _MISSING:
+            with self._lock:
+                self.misses += 1
+            return default
+
+        self.hits += 1
+
+        if self._lru:
+            # move the key to the end, as it is now the most recently used.
+            # note: `pop()` with a default, as another thread might have
+            # moved or evicted the key in the meantime.
+            data.pop(key, None)
+            data[key] = value
+
+        return value
+
+    def set(self, key, value):
+        """Cache the `value` for `key`, and return the value."""
+        with self._lock:
+            maxsize = self.maxsize
+
+            if maxsize is not None:
+                if not maxsize:
+                    return value
+
+                self._evict(maxsize - 1)
+
+            self._data[key] = value
+
+        return value
+
+    def _evict(self, size):
+        """
+        Evict the oldest keys, until at most `size` keys remain.
+
+        The caller must hold the lock.
+        """
+        data = self._data
+
+        while len(data) > size:
+            try:
+                key = next(iter(data))
+            except RuntimeError:
+                # the `dict` was resized by a (lock-free) cache hit.
+                continue
+            except StopIteration:
+                break
+
+            if data.pop(key, _MISSING) is not _MISSING:
+                self.evictions += 1
+
+    def clear(self):
+        """Clear the cache, and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """Return a :class:`CacheInfo` with the cache statistics."""
+        return CacheInfo(self.hits, self.misses, self.evictions,
+                         self.maxsize, len(self._data))
@@ -1,4 +1,8 @@
-from typing import Any, Callable, ItemsView, TypeVar
+from threading import Lock
+from typing import (Any, Callable, ItemsView, Iterable, Iterator, KeysView,
+                    Literal, Mapping, NamedTuple, TypeVar)
+
+from _typeshed import SupportsRead
 
 from dotwiz import DotWiz, DotWizPlus
 
@@ -9,6 +13,21 @@ _KT = TypeVar('_KT')
 _VT = TypeVar('_VT')
 
 _ItemsFn = Callable[[_D ], ItemsView[_KT, _VT]]
+_StoreFn = Callable[[_D, dict, _KT, _VT], Any]
+_Policy = Literal['lru', 'fifo']
+
+_MISSING: object = ...
+
+__CHECK_CYCLE_DEPTH: int = ...
+__ATOMIC_TYPES: frozenset[type] = ...
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    currsize: int
 
 
 def __add_repr__(name: str,
@@ -17,9 +36,110 @@ def __add_repr__(name: str,
                  *, print_char='*',
                  use_attr_dict=False): ...
 
-def __convert_to_attr_dict__(o: dict | DotWiz | DotWizPlus | list | _T) -> dict[_KT, _VT] : ...
+def __guard_reprs__() -> None: ...
+
+def __attr_items__(o: DotWizPlus) -> ItemsView[str, _VT]: ...
+
+def __getitem_from_dict__(self: DotWiz, key: _KT) -> _VT: ...
+
+def __copy_with_state__(self: _D,
+                        *, __new: Callable[[type[_D]], _D] = dict.__new__) -> _D: ...
+
+def __deepcopy_with_state__(self: _D,
+                            memo: dict[int, Any],
+                            *, __new: Callable[[type[_D]], _D] = dict.__new__) -> _D: ...
+
+def __iter_lazy_impl__(self: dict[_KT, _VT],
+                       *, __iter: Callable[[dict], Iterator[_KT]] = dict.__iter__) -> Iterator[_KT]: ...
+
+def __pop_lazy_impl__(self: dict[_KT, _VT], key: _KT,
+                      default: _VT | _T = ...,
+                      *, __contains: Callable[[dict, _KT], bool] = dict.__contains__,
+                      __delete: Callable[[dict, _KT], None] = dict.__delitem__) -> _VT | _T: ...
+
+def __popitem_lazy_impl__(self: dict[_KT, _VT],
+                          *, __keys: Callable[[dict], KeysView[_KT]] = dict.keys) -> tuple[_KT, _VT]: ...
+
+def __setdefault_lazy_impl__(self: dict[_KT, _VT], key: _KT,
+                             default: _VT | None = None,
+                             *, __contains: Callable[[dict, _KT], bool] = dict.__contains__) -> _VT | None: ...
+
+def __deepcopy_values__(d: dict[_KT, _VT],
+                        memo: dict[int, Any],
+                        *, __atomic: frozenset[type] = ...,
+                        __deepcopy: Callable[[_T, dict[int, Any]], _T] = ...) -> dict[_KT, _VT]: ...
+
+def __reduce_ex_impl__(self: _D,
+                       protocol: int,
+                       *, __newobj: Callable[..., _D] = ...) -> tuple[Callable[..., _D], tuple[type[_D]], Any]: ...
+
+def __convert_to_attr_dict__(o: dict | DotWiz | DotWizPlus | list | _T,
+                             *, __items_fn: _ItemsFn = __attr_items__,
+                             preserve_refs: bool = False,
+                             __list_types: type | tuple[type, ...] = list) -> dict[_KT, _VT] : ...
 
 def __convert_to_dict__(o: dict | DotWiz | DotWizPlus | list | _T,
-                        *, __items_fn: _ItemsFn = dict.items) -> dict[_KT, _VT] : ...
+                        *, __items_fn: _ItemsFn = dict.items,
+                        preserve_refs: bool = False,
+                        __list_types: type | tuple[type, ...] = list) -> dict[_KT, _VT] : ...
+
+def __has_cycle__(o: dict | list,
+                  items_fn: _ItemsFn,
+                  list_types: type | tuple[type, ...] = list) -> bool: ...
+
+def __convert_graph_to_dict__(o: dict | DotWiz | DotWizPlus | list | _T,
+                              items_fn: _ItemsFn,
+                              list_types: type | tuple[type, ...] = list) -> dict[_KT, _VT] : ...
+
+def __from_graph__(o: dict | list | _T,
+                   dict_type: type[_D],
+                   store_fn: _StoreFn) -> _D | list[_D] | _T: ...
+
+def __from_each_record__(cls: type[_D],
+                         records: Iterable[Mapping[_KT, _VT]]) -> list[_D]: ...
+
+def __from_json__(cls: type[_D],
+                  s: str | bytes | bytearray,
+                  **kwargs: Any) -> _D | list[_D] | Any: ...
+
+def __from_json_file__(cls: type[_D],
+                       fp: SupportsRead[str | bytes],
+                       **kwargs: Any) -> _D | list[_D] | Any: ...
 
 def __resolve_value__(value: _T, dict_type: type[_D]) -> _T | _D | list[_D]: ...
+
+
+class KeyCache:
+    POLICIES: tuple[_Policy, ...]
+
+    maxsize: int | None
+    policy: _Policy
+    hits: int
+    misses: int
+    evictions: int
+
+    _data: dict[str, str]
+    _lru: bool
+    _lock: Lock
+
+    def __init__(self,
+                 maxsize: int | None = 4096,
+                 policy: _Policy = 'fifo') -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def __contains__(self, key: str) -> bool: ...
+
+    def configure(self,
+                  maxsize: int | None = 4096,
+                  policy: _Policy = 'fifo') -> None: ...
+
+    def get(self, key: str, default: _T = None) -> str | _T: ...
+
+    def set(self, key: str, value: str) -> str: ...
+
+    def _evict(self, size: int) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def info(self) -> CacheInfo: ...
@@ -0,0 +1,368 @@
+"""Frozen (immutable) Dot Wiz module."""
+
+from .common import (
+    _MISSING,
+    __attr_items__,
+    __convert_to_attr_dict__,
+    __convert_to_dict__,
+    __from_each_record__,
+)
+from .main import DotWiz, __store_in_object__
+from .paths import __reserve_attr_names__
+from .plus import DotWizPlus
+from .plus import __store_in_object__ as __store_in_object_plus__
+
+
+# noinspection PyDefaultArgument
+def __new_frozen_dot_wiz__(cls, input_dict={},
+                           __new=dict.__new__,
+                           __set=dict.__setitem__,
+                           **kwargs):
+    """
+    Helper method to create a :class:`FrozenDotWiz` from a Python ``dict``
+    object, and optional *keyword arguments*.
+
+    Nested ``dict`` values are converted to `cls`, and ``list`` values are
+    converted to a ``tuple``.
+
+    """
+    self = __new(cls)
+    __dict = self.__dict__
+
+    if kwargs:
+        if input_dict:
+            input_dict = {**input_dict, **kwargs}
+        else:
+            input_dict = kwargs
+
+    for key in input_dict:
+        # note: this logic is the same as `__freeze_value__()`; it's
+        # inlined here as it's faster to eliminate a function call.
+        value = input_dict[key]
+        t = type(value)
+
+        if t is dict:
+            value = cls(value)
+        elif t is list or t is tuple:
+            value = tuple([__freeze_value__(e, cls) for e in value])
+        elif isinstance(value, dict) and not isinstance(value, __FROZEN_TYPES):
+            value = cls(value)
+
+        __set(self, key, value)
+        __dict[key] = value
+
+    return self
+
+
+# noinspection PyDefaultArgument
+def __new_frozen_dot_wiz_plus__(cls, input_dict={},
+                                __new=dict.__new__,
+                                **kwargs):
+    """
+    Helper method to create a :class:`FrozenDotWizPlus` from a Python ``dict``
+    object, and optional *keyword arguments*.
+
+    Nested ``dict`` values are converted to `cls`, and ``list`` values are
+    converted to a ``tuple``.
+
+    """
+    self = __new(cls)
+    __dict = self.__dict__
+
+    if kwargs:
+        if input_dict:
+            input_dict = {**input_dict, **kwargs}
+        else:
+            input_dict = kwargs
+
+    for key in input_dict:
+        # note: this logic is the same as `__freeze_value__()`; it's
+        # inlined here as it's faster to eliminate a function call.
+        value = input_dict[key]
+        t = type(value)
+
+        if t is dict:
+            value = cls(value)
+        elif t is list or t is tuple:
+            value = tuple([__freeze_value__(e, cls) for e in value])
+        elif isinstance(value, dict) and not isinstance(value, __FROZEN_TYPES):
+            value = cls(value)
+
+        __store_in_object_plus__(self, __dict, key, value)
+
+    return self
+
+
+def __freeze_value__(value, cls):
+    """
+    Resolve `value` for a frozen `cls`, which converts a ``dict`` (including
+    a mutable :class:`DotWiz`) to `cls` and a ``list`` to a ``tuple``.
+    """
+    t = type(value)
+
+    if t is dict:
+        return cls(value)
+
+    if t is list or t is tuple:
+        return tuple([__freeze_value__(e, cls) for e in value])
+
+    if isinstance(value, dict) and not isinstance(value, __FROZEN_TYPES):
+        return cls(value)
+
+    return value
+
+
+def __copy_with__(node, key, value,
+                  __new=dict.__new__,
+                  __update=dict.update):
+    """
+    Return a shallow copy of a frozen `node` (or a ``tuple``), with `key`
+    set to `value`. All other values are shared with `node`.
+    """
+    if type(node) is tuple:
+        n = len(node)
+        i = int(key)
+        # a negative index counts from the end, as it does for a `tuple`
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError(f'tuple index out of range: {key!r}')
+
+        return node[:i] + (value, ) + node[i + 1:]
+
+    new = __new(type(node))
+    __update(new, node)
+
+    __dict = new.__dict__
+    __update(__dict, node.__dict__)
+
+    node.__store_fn__(new, __dict, key, value)
+
+    return new
+
+
+def __evolve__(self, path, value):
+    """
+    Return a copy of the frozen instance, with the value at `path` set to
+    `value`.
+
+    `path` is either a string of dot-separated key names, such as
+    ``'a.b.c'``, or a sequence of keys, such as ``('a', 1, 'c')``, which
+    is needed if a key is not a ``str`` or contains a dot. An index into
+    a ``tuple`` (or ``list``) value can be passed as an ``int``, or as a
+    string of digits.
+
+    Only the objects along `path` are copied, so the new instance shares
+    every other (nested) value with this instance. Any objects which are
+    missing along `path` are created.
+
+    """
+    keys = path.split('.') if type(path) is str else tuple(path)
+
+    if not keys:
+        raise ValueError('path must contain at least one key')
+
+    cls = type(self)
+    value = __freeze_value__(value, cls)
+
+    nodes = [self]
+    node = self
+
+    for key in keys[:-1]:
+        if type(node) is tuple:
+            node = node[int(key)]
+        elif isinstance(node, dict):
+            node = dict.get(node, key, _MISSING)
+            if node is _MISSING:
+                node = cls()
+        else:
+            raise TypeError(f'cannot set {key!r} on a value of type '
+                            f'{type(node).__name__!r}')
+
+        nodes.append(node)
+
+    if not (type(node) is tuple or isinstance(node, dict)):
+        raise TypeError(f'cannot set {keys[-1]!r} on a value of type '
+                        f'{type(node).__name__!r}')
+
+    # copy each object along the path, from the bottom up
+    for node, key in zip(reversed(nodes), reversed(keys)):
+        value = __copy_with__(node, key, value)
+
+    return value
+
+
+def __frozen_to_dict__(self, preserve_refs=False):
+    """
+    Recursively convert the frozen instance back to a ``dict``, with each
+    ``tuple`` value converted back to a ``list``.
+    """
+    return __convert_to_dict__(self, preserve_refs=preserve_refs,
+                               __list_types=(list, tuple))
+
+
+def __frozen_to_attr_dict__(self, preserve_refs=False):
+    """
+    Recursively convert the :class:`FrozenDotWizPlus` instance back to a
+    ``dict``, while preserving the lower-cased keys used for attribute
+    access, with each ``tuple`` value converted back to a ``list``.
+    """
+    return __convert_to_attr_dict__(self, __attr_items__, preserve_refs,
+                                    __list_types=(list, tuple))
+
+
+def __cached_hash_for__(cls):
+    """
+    Return a :meth:`__hash__` for a frozen `cls`, which computes the hash of
+    an object once, on first use, and caches it in the ``__hash_value__``
+    slot.
+
+    The hash is based on the (unordered) items in the ``dict`` storage, so
+    it's consistent with ``dict`` equality.
+    """
+    slot = cls.__dict__['__hash_value__']
+
+    def __hash__(self, __get=slot.__get__, __set=slot.__set__,
+                 __items=dict.items):
+        try:
+            return __get(self)
+        except AttributeError:
+            value = hash(frozenset(__items(self)))
+            __set(self, value)
+            return value
+
+    return __hash__
+
+
+def __object_hook_frozen__(cls, o):
+    """
+    Create a frozen instance of `cls` from a ``dict`` object `o` which is
+    decoded from JSON.
+    """
+    return cls(o)
+
+
+def __from_graph_frozen__(cls, o):
+    """
+    Frozen objects can't contain circular references, so this is not
+    supported.
+    """
+    raise TypeError(f'{cls.__name__}.from_graph() is not supported, as a '
+                    f'frozen object can not contain circular references')
+
+
+def __immutable__(self, *args, **kwargs):
+    """Raise an error, as a frozen object can't be modified"""
+    raise TypeError(f'{type(self).__name__!r} object is immutable')
+
+
+def __init_frozen__(self, *args, **kwargs):
+    """The object is already set up by :meth:`__new__`"""
+
+
+def __copy_frozen__(self):
+    """A frozen object can't be modified, so a shallow copy is the object"""
+    return self
+
+
+class FrozenDotWiz(DotWiz):
+    """
+    :class:`FrozenDotWiz` - an *immutable*, *hashable* :class:`DotWiz`,
+    which can be updated cheaply with :meth:`evolve`.
+
+    Nested ``dict`` values are converted to a :class:`FrozenDotWiz`, and
+    ``list`` values to a ``tuple``, on creation. As no (nested) value can
+    change, a new version made with :meth:`evolve` only copies the objects
+    along the path to the changed value, and shares everything else with
+    the original. Keeping many versions in memory then costs about the
+    size of the changes between them.
+
+    The hash of an object is computed once, when first needed, and then
+    cached; this means it can be used as a key in a ``dict``, or as an
+    argument to a function wrapped with :func:`functools.lru_cache`.
+    All values (such as a ``set``) must be hashable for this to work.
+
+    Usage::
+
+        >>> from dotwiz import FrozenDotWiz
+        >>> v1 = FrozenDotWiz({'db': {'host': 'localhost', 'port': 5432}, 'debug': False})
+        >>> v2 = v1.evolve('db.port', 5433)
+        >>> v2
+        ✫(db=✫(host='localhost', port=5433), debug=False)
+        >>> v1.db.port
+        5432
+
+    """
+    __slots__ = ('__hash_value__', )
+
+    __new__ = __new_frozen_dot_wiz__
+    __init__ = __init_frozen__
+
+    __delattr__ = __delitem__ = __immutable__
+    __setattr__ = __setitem__ = __immutable__
+
+    update = clear = pop = popitem = setdefault = __ior__ = __immutable__
+
+    __copy__ = __copy_frozen__
+
+    evolve = __evolve__
+
+    to_dict = __frozen_to_dict__
+
+    from_graph = classmethod(__from_graph_frozen__)
+    from_records = classmethod(__from_each_record__)
+
+    __object_hook__ = classmethod(__object_hook_frozen__)
+
+    __store_fn__ = staticmethod(__store_in_object__)
+
+
+class FrozenDotWizPlus(DotWizPlus):
+    """
+    :class:`FrozenDotWizPlus` - an *immutable*, *hashable*
+    :class:`DotWizPlus`, which can be updated cheaply with :meth:`evolve`.
+
+    This works the same as a :class:`FrozenDotWiz`; note that the `path`
+    passed to :meth:`evolve` uses the *original* key names.
+
+    Usage::
+
+        >>> from dotwiz import FrozenDotWizPlus
+        >>> v1 = FrozenDotWizPlus({'Database': {'hostName': 'localhost'}})
+        >>> v1.evolve('Database.hostName', 'db.local')
+        ✪(database=✪(host_name='db.local'))
+
+    """
+    __slots__ = ('__hash_value__', )
+
+    __new__ = __new_frozen_dot_wiz_plus__
+    __init__ = __init_frozen__
+
+    __delattr__ = __delitem__ = __immutable__
+    __setattr__ = __setitem__ = __immutable__
+
+    update = clear = pop = popitem = setdefault = __ior__ = __immutable__
+
+    __copy__ = __copy_frozen__
+
+    evolve = __evolve__
+
+    to_attr_dict = __frozen_to_attr_dict__
+    to_dict = __frozen_to_dict__
+
+    from_graph = classmethod(__from_graph_frozen__)
+    from_records = classmethod(__from_each_record__)
+
+    __object_hook__ = classmethod(__object_hook_frozen__)
+
+    __store_fn__ = staticmethod(__store_in_object_plus__)
+
+
+FrozenDotWiz.__hash__ = __cached_hash_for__(FrozenDotWiz)
+FrozenDotWizPlus.__hash__ = __cached_hash_for__(FrozenDotWizPlus)
+
+# The frozen types, which are used as-is when nested in a frozen object.
+__FROZEN_TYPES = (FrozenDotWiz, FrozenDotWizPlus)
+
+# a key such as `evolve` is never looked up as an attribute in a path.
+__reserve_attr_names__(FrozenDotWiz, FrozenDotWizPlus)
@@ -0,0 +1,186 @@
+from typing import (Any, Callable, Iterable, Mapping, NoReturn,
+                    Sequence, TypeVar)
+
+from .main import DotWiz
+from .plus import DotWizPlus
+
+_T = TypeVar('_T')
+_KT = TypeVar('_KT')
+_VT = TypeVar('_VT')
+_F = TypeVar('_F', bound=FrozenDotWiz | FrozenDotWizPlus)
+
+_SetItem = Callable[[dict, _KT, _VT], None]
+_Path = str | Sequence[Any]
+_StoreFn = Callable[[_F, dict, _KT, _VT], Any]
+
+__FROZEN_TYPES: tuple[type[FrozenDotWiz], type[FrozenDotWizPlus]] = ...
+
+
+# noinspection PyDefaultArgument
+def __new_frozen_dot_wiz__(cls: type[_F],
+                           input_dict: Mapping[_KT, _VT] = {},
+                           *, __new: Callable[[type[_F]], _F] = dict.__new__,
+                           __set: _SetItem = dict.__setitem__,
+                           **kwargs: _T) -> _F: ...
+
+# noinspection PyDefaultArgument
+def __new_frozen_dot_wiz_plus__(cls: type[_F],
+                                input_dict: Mapping[_KT, _VT] = {},
+                                *, __new: Callable[[type[_F]], _F] = dict.__new__,
+                                **kwargs: _T) -> _F: ...
+
+def __freeze_value__(value: _T, cls: type[_F]) -> _T | _F | tuple: ...
+
+def __copy_with__(node: _F | tuple,
+                  key: _KT,
+                  value: _VT,
+                  *, __new: Callable[[type[_F]], _F] = dict.__new__,
+                  __update: Callable[..., None] = dict.update) -> _F | tuple: ...
+
+def __evolve__(self: _F, path: _Path, value: Any) -> _F: ...
+
+def __frozen_to_dict__(self: FrozenDotWiz | FrozenDotWizPlus,
+                       preserve_refs: bool = False) -> dict[_KT, _VT]: ...
+
+def __frozen_to_attr_dict__(self: FrozenDotWizPlus,
+                            preserve_refs: bool = False) -> dict[_KT, _VT]: ...
+
+def __cached_hash_for__(cls: type[_F]) -> Callable[[_F], int]: ...
+
+def __object_hook_frozen__(cls: type[_F], o: dict[_KT, _VT]) -> _F: ...
+
+def __from_graph_frozen__(cls: type[_F], o: dict[_KT, _VT]) -> NoReturn: ...
+
+def __immutable__(self: FrozenDotWiz | FrozenDotWizPlus, *args: Any, **kwargs: Any) -> NoReturn: ...
+
+def __init_frozen__(self: FrozenDotWiz | FrozenDotWizPlus, *args: Any, **kwargs: Any) -> None: ...
+
+def __copy_frozen__(self: _F) -> _F: ...
+
+
+class FrozenDotWiz(DotWiz):
+    __hash_value__: int
+    __store_fn__: _StoreFn
+
+    # noinspection PyDefaultArgument
+    def __new__(cls,
+                input_dict: Mapping[_KT, _VT] = {},
+                **kwargs: _T) -> FrozenDotWiz: ...
+
+    def __init__(self,
+                 input_dict: Mapping[_KT, _VT] = {},
+                 **kwargs: _T) -> None: ...
+
+    def evolve(self, path: _Path, value: Any) -> FrozenDotWiz:
+        """
+        Return a copy of the :class:`FrozenDotWiz` instance, with the value at
+        `path` set to `value`.
+
+        `path` is either a string of dot-separated key names, such as
+        ``'a.b.c'``, or a sequence of keys, such as ``('a', 1, 'c')``.
+
+        Only the objects along `path` are copied, so the new instance shares
+        every other (nested) value with this instance.
+        """
+        ...
+
+    def __hash__(self) -> int:
+        """
+        Return the hash of the object, which is computed on first use and
+        then cached.
+        """
+        ...
+
+    def to_dict(self, preserve_refs: bool = False) -> dict[_KT, _VT]:
+        """
+        Recursively convert the :class:`FrozenDotWiz` instance back to a
+        ``dict``, with each ``tuple`` value converted back to a ``list``.
+        """
+        ...
+
+    @classmethod
+    def from_graph(cls, o: dict[_KT, _VT]) -> NoReturn: ...
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[_KT, _VT]]) -> list[FrozenDotWiz]: ...
+
+    def __delattr__(self, item: str) -> NoReturn: ...
+    def __delitem__(self, v: _KT) -> NoReturn: ...
+
+    def __setattr__(self, item: str, value: _VT) -> NoReturn: ...
+    def __setitem__(self, k: _KT, v: _VT) -> NoReturn: ...
+
+    def update(self, *args: Any, **kwargs: Any) -> NoReturn: ...
+    def clear(self) -> NoReturn: ...
+    def pop(self, *args: Any) -> NoReturn: ...
+    def popitem(self) -> NoReturn: ...
+    def setdefault(self, *args: Any) -> NoReturn: ...
+    def __ior__(self, other: Any) -> NoReturn: ...
+
+
+class FrozenDotWizPlus(DotWizPlus):
+    __hash_value__: int
+    __store_fn__: _StoreFn
+
+    # noinspection PyDefaultArgument
+    def __new__(cls,
+                input_dict: Mapping[_KT, _VT] = {},
+                **kwargs: _T) -> FrozenDotWizPlus: ...
+
+    def __init__(self,
+                 input_dict: Mapping[_KT, _VT] = {},
+                 **kwargs: _T) -> None: ...
+
+    def evolve(self, path: _Path, value: Any) -> FrozenDotWizPlus:
+        """
+        Return a copy of the :class:`FrozenDotWizPlus` instance, with the value
+        at `path` set to `value`.
+
+        `path` is either a string of dot-separated (original) key names, such
+        as ``'a.b.c'``, or a sequence of keys, such as ``('a', 1, 'c')``.
+
+        Only the objects along `path` are copied, so the new instance shares
+        every other (nested) value with this instance.
+        """
+        ...
+
+    def __hash__(self) -> int:
+        """
+        Return the hash of the object, which is computed on first use and
+        then cached.
+        """
+        ...
+
+    def to_dict(self, preserve_refs: bool = False) -> dict[_KT, _VT]:
+        """
+        Recursively convert the :class:`FrozenDotWizPlus` instance back to a
+        ``dict``, with each ``tuple`` value converted back to a ``list``.
+        """
+        ...
+
+    def to_attr_dict(self, preserve_refs: bool = False) -> dict[_KT, _VT]:
+        """
+        Recursively convert the :class:`FrozenDotWizPlus` instance back to a
+        ``dict``, while preserving the lower-cased keys used for attribute
+        access, with each ``tuple`` value converted back to a ``list``.
+        """
+        ...
+
+    @classmethod
+    def from_graph(cls, o: dict[_KT, _VT]) -> NoReturn: ...
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[_KT, _VT]]) -> list[FrozenDotWizPlus]: ...
+
+    def __delattr__(self, item: str) -> NoReturn: ...
+    def __delitem__(self, v: _KT) -> NoReturn: ...
+
+    def __setattr__(self, item: str, value: _VT) -> NoReturn: ...
+    def __setitem__(self, k: _KT, v: _VT) -> NoReturn: ...
+
+    def update(self, *args: Any, **kwargs: Any) -> NoReturn: ...
+    def clear(self) -> NoReturn: ...
+    def pop(self, *args: Any) -> NoReturn: ...
+    def popitem(self) -> NoReturn: ...
+    def setdefault(self, *args: Any) -> NoReturn: ...
+    def __ior__(self, other: Any) -> NoReturn: ...
@@ -0,0 +1,617 @@
+"""Opt-in instrumentation of the conversion done by `DotWiz` classes."""
+import os
+import sys
+from collections import namedtuple
+from contextlib import ContextDecorator
+from functools import wraps
+from threading import Lock, local
+from time import perf_counter
+
+
+# The methods to instrument, and the operation each one is recorded as.
+__OPERATIONS = {
+    '__new__': 'create',
+    '__init__': 'create',
+    'update': 'update',
+    '__setitem__': 'update',
+    '__setattr__': 'update',
+    'to_dict': 'to_dict',
+    'to_attr_dict': 'to_dict',
+    'from_json': 'from_json',
+    'from_json_file': 'from_json',
+    'from_records': 'from_records',
+    'from_graph': 'from_graph',
+}
+
+# The operations which convert their input, and so count the objects and
+# `list` values they return (or set, for an update).
+__CONVERTING_OPS = frozenset({'create', 'update', 'from_json',
+                              'from_records', 'from_graph'})
+
+# The original attributes, keyed on `(cls, name)`, which are replaced
+# while instrumentation is enabled.
+__ORIGINALS = {}
+
+# Serializes enabling and disabling instrumentation, and updates to the
+# time taken for each operation.
+__LOCK = Lock()
+
+# The depth of (nested) instrumented calls in each thread, so that only the
+# outermost call is timed.
+__STATE = local()
+
+# True if `enable_instrumentation()` is called; the methods are also
+# replaced while a `profile()` is active.
+__ENABLED = False
+
+# The callback (if any) for each outermost operation.
+__HOOK = None
+
+# The active profiles, which each outermost call is recorded in.
+__PROFILES = ()
+
+# The directory of this package; calls made from modules in it (such as
+# `loaders`) are attributed to the first caller outside of it.
+__PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+# The counters; `nodes` and `lists` are incremented without a lock, so
+# they are a lower bound with multiple threads.
+__COUNTS = {'nodes': 0, 'lists': 0}
+
+# Sentinel value for a key which is not set before an update
+__NOT_SET = object()
+__TIMES = {}
+
+# The hits and misses in the cache of each key normalizer, at the time
+# instrumentation is enabled (or reset while enabled).
+__KEY_CACHE_BASE = {}
+
+# The key cache hits and misses counted up to when instrumentation was last
+# disabled, since the last reset.
+__KEY_CACHE_COUNTS = [0, 0]
+
+
+def __count_converted__(trees, __values=dict.values):
+    """
+    Return the number of objects (``dict`` subclasses), and ``list`` or
+    ``tuple`` values, in the `trees` which are returned by a conversion.
+
+    A plain ``dict`` - such as a nested value of a lazy object, which isn't
+    converted yet - is not counted, nor are the values in it.
+    """
+    nodes = lists = 0
+    seen = set()
+    stack = list(trees)
+    pop = stack.pop
+    push = stack.extend
+
+    while stack:
+        o = pop()
+        t = type(o)
+
+        if t is dict or id(o) in seen:
+            continue
+
+        if isinstance(o, dict):
+            seen.add(id(o))
+            nodes += 1
+            push(__values(o))
+
+        elif isinstance(o, (list, tuple)):
+            seen.add(id(o))
+            lists += 1
+            push(o)
+
+    return nodes, lists
+
+
+def __count__(trees, __counts=__COUNTS):
+    """
+    Add the objects and ``list`` values in `trees` to the counters, and
+    return the number of objects.
+    """
+    nodes, lists = __count_converted__(trees)
+
+    __counts['nodes'] += nodes
+    __counts['lists'] += lists
+
+    return nodes
+
+
+def __instrumented__(fn, op, name, __state=__STATE):
+    """
+    Return a wrapper for `fn` - the method `name` - which records the
+    (outermost) call as `op`; for an operation which converts its input,
+    the objects and ``list`` values in the result are also counted.
+    """
+    sets_item = name == '__setitem__' or name == '__setattr__'
+    is_update = op == 'update' and not sets_item
+    converts = op in __CONVERTING_OPS
+    # an update is not profiled, as only the new values are converted
+    profiled = op != 'update'
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if getattr(__state, 'depth', 0):
+            return fn(*args, **kwargs)
+
+        enabled = __ENABLED
+        if enabled and is_update:
+            # only the values which the update sets are counted
+            before = dict(args[0])
+
+        profiles = __PROFILES if profiled else ()
+        tracing = False
+        if profiles:
+            import tracemalloc
+            tracing = tracemalloc.is_tracing()
+            if tracing:
+                memory = tracemalloc.get_traced_memory()[0]
+
+        __state.depth = 1
+        start = perf_counter()
+
+        try:
+            result = fn(*args, **kwargs)
+
+        except BaseException:
+            __state.depth = 0
+            if enabled:
+                __record__(op, perf_counter() - start, 0)
+            raise
+
+        elapsed = perf_counter() - start
+        __state.depth = 0
+
+        if enabled:
+            nodes = 0
+            if sets_item:
+                nodes = __count__((dict.get(args[0], args[1]), ))
+            elif is_update:
+                get = before.get
+                nodes = __count__([v for k, v in dict.items(args[0])
+                                   if get(k, __NOT_SET) is not v])
+            elif converts:
+                # note: `__init__()` returns None, so use the object itself
+                nodes = __count__((args[0] if result is None else result, ))
+
+            __record__(op, elapsed, nodes)
+
+        if profiles:
+            allocated = tracemalloc.get_traced_memory()[0] - memory if tracing else 0
+            # note: `__init__()` returns None, so use the object itself
+            __profile_call__(profiles, op, args[0],
+                             args[0] if result is None else result,
+                             elapsed, allocated)
+
+        return result
+
+    return wrapper
+
+
+def __key_caches__():
+    """Return the cache of each registered key normalizer."""
+    # note: this is imported here, as `import dotwiz` only imports the
+    # `plus` module on first use.
+    from .plus import __NORMALIZERS
+
+    return [cache for _, cache in __NORMALIZERS.values()]
+
+
+def __set_key_cache_base__():
+    """Save the current statistics of each key cache as the baseline."""
+    __KEY_CACHE_BASE.clear()
+
+    for cache in __key_caches__():
+        __KEY_CACHE_BASE[cache] = cache.hits, cache.misses
+
+
+def __key_cache_counts__():
+    """
+    Return the hits and misses in the key caches since the baseline; that
+    is, since instrumentation is enabled, summed over every key normalizer.
+    """
+    if not __ENABLED:
+        return 0, 0
+
+    hits = misses = 0
+    # a cache which is replaced (or registered) since is also counted
+    for cache in {**__KEY_CACHE_BASE, **dict.fromkeys(__key_caches__())}:
+        base_hits, base_misses = __KEY_CACHE_BASE.get(cache, (0, 0))
+        # the statistics are reset if the cache is cleared
+        hits += (cache.hits - base_hits if cache.hits >= base_hits
+                 else cache.hits)
+        misses += (cache.misses - base_misses if cache.misses >= base_misses
+                   else cache.misses)
+
+    return hits, misses
+
+
+def __record__(op, elapsed, nodes):
+    """Record the time taken for an (outermost) operation"""
+    with __LOCK:
+        times = __TIMES.get(op)
+        if times is None:
+            __TIMES[op] = [1, elapsed]
+        else:
+            times[0] += 1
+            times[1] += elapsed
+
+    hook = __HOOK
+    if hook is not None:
+        hook(op, elapsed, nodes)
+
+
+def __patch__():
+    """Replace the methods of each class with an instrumented version"""
+    if __ORIGINALS:
+        return
+
+    # note: these are imported here, as `import dotwiz` only imports the
+    # `plus` and `frozen` modules on first use.
+    from .frozen import (FrozenDotWiz, FrozenDotWizPlus,
+                         __immutable__, __init_frozen__)
+    from .main import DotWiz, DotWizLite, LazyDotWiz
+    from .plus import DotWizPlus, LazyDotWizPlus
+
+    for cls in (DotWiz, DotWizLite, LazyDotWiz, DotWizPlus, LazyDotWizPlus,
+                FrozenDotWiz, FrozenDotWizPlus):
+        cls_dict = cls.__dict__
+
+        for name, op in __OPERATIONS.items():
+            orig = cls_dict.get(name)
+            if orig is None or orig is __init_frozen__ or orig is __immutable__:
+                continue
+
+            if isinstance(orig, classmethod):
+                new = classmethod(__instrumented__(orig.__func__, op, name))
+            elif isinstance(orig, staticmethod):
+                new = staticmethod(__instrumented__(orig.__func__, op, name))
+            else:
+                new = __instrumented__(orig, op, name)
+
+            __ORIGINALS[cls, name] = orig
+            setattr(cls, name, new)
+
+
+def __unpatch__():
+    """
+    Restore the original methods of each class, unless instrumentation or
+    a profile is still active.
+    """
+    if __ENABLED or __PROFILES:
+        return
+
+    for (cls, name), orig in __ORIGINALS.items():
+        setattr(cls, name, orig)
+
+    __ORIGINALS.clear()
+
+
+def enable_instrumentation(hook=None):
+    """
+    Start recording the conversion done by :class:`DotWiz`,
+    :class:`DotWizPlus` and their variants: the number of nodes (objects)
+    converted and ``list`` values walked, the hits and misses in the cache
+    for special-cased keys, and the calls to and cumulative time of each
+    operation, such as ``'create'``, ``'update'`` and ``'to_dict'``.
+
+    The methods of each class are replaced with an instrumented version,
+    until :func:`disable_instrumentation` is called; there is no cost at
+    all while instrumentation is disabled.
+
+    Example::
+
+        >>> import dotwiz
+        >>> dotwiz.enable_instrumentation()
+        >>> _ = dotwiz.DotWiz({'a': {'b': [1, 2]}}).to_dict()
+        >>> stats = dotwiz.instrumentation_snapshot()
+        >>> stats['nodes'], stats['lists'], stats['operations']['to_dict']['calls']
+        (2, 1, 1)
+        >>> dotwiz.disable_instrumentation()
+
+    :param hook: An optional callback, which is called as
+      ``hook(op, seconds, nodes)`` after each outermost operation; this can
+      be used to export the metrics to a monitoring system.
+
+    """
+    global __ENABLED, __HOOK
+
+    with __LOCK:
+        if not __ENABLED:
+            __ENABLED = True
+            __set_key_cache_base__()
+
+        __HOOK = hook
+        __patch__()
+
+
+def disable_instrumentation():
+    """
+    Stop recording, and restore the original methods of each class; the
+    statistics are kept until :func:`reset_instrumentation` is called.
+    """
+    global __ENABLED, __HOOK
+
+    with __LOCK:
+        hits, misses = __key_cache_counts__()
+        __KEY_CACHE_COUNTS[0] += hits
+        __KEY_CACHE_COUNTS[1] += misses
+        __KEY_CACHE_BASE.clear()
+
+        __ENABLED = False
+        __HOOK = None
+        __unpatch__()
+
+
+def is_instrumentation_enabled():
+    """Return true if instrumentation is currently enabled."""
+    return __ENABLED
+
+
+def instrumentation_snapshot():
+    """
+    Return a ``dict`` with the statistics recorded since the last reset:
+
+    * ``nodes`` - the number of objects converted.
+    * ``lists`` - the number of ``list`` values walked.
+
+    These are counted after each outermost ``'create'``, ``'update'``
+    (which includes setting an item or attribute), ``'from_json'``,
+    ``'from_records'`` and ``'from_graph'`` operation, from the objects and
+    ``list`` values it returns (or sets, for an update) - including any
+    nested values which were already converted. A value of a lazy object
+    which isn't converted yet is counted on first access.
+    * ``key_cache_hits`` and ``key_cache_misses`` - lookups in the cache
+      for special-cased keys, by :class:`DotWizPlus`, while instrumentation
+      is enabled; the caches of all key normalizers are counted.
+    * ``operations`` - a ``dict`` of each operation name to its number of
+      ``calls``, and the total ``seconds`` taken.
+
+    """
+    with __LOCK:
+        hits, misses = __key_cache_counts__()
+        operations = {op: {'calls': calls, 'seconds': seconds}
+                      for op, (calls, seconds) in __TIMES.items()}
+
+    return {'nodes': __COUNTS['nodes'],
+            'lists': __COUNTS['lists'],
+            'key_cache_hits': __KEY_CACHE_COUNTS[0] + hits,
+            'key_cache_misses': __KEY_CACHE_COUNTS[1] + misses,
+            'operations': operations}
+
+
+def reset_instrumentation():
+    """Reset the statistics returned by :func:`instrumentation_snapshot`."""
+    with __LOCK:
+        __COUNTS['nodes'] = __COUNTS['lists'] = 0
+        __TIMES.clear()
+        __KEY_CACHE_COUNTS[:] = 0, 0
+
+        if __ENABLED:
+            __set_key_cache_base__()
+
+
+# The aggregated statistics for the calls from one location, as returned
+# by :meth:`Profile.report`.
+ProfileEntry = namedtuple('ProfileEntry',
+                          ['location', 'op', 'cls', 'calls', 'nodes',
+                           'max_depth', 'seconds', 'bytes'])
+
+# The fields of a `ProfileEntry` which a report can be sorted by.
+_SORT_FIELDS = frozenset({'calls', 'nodes', 'max_depth', 'seconds', 'bytes'})
+
+
+def __caller__(__package_dir=__PACKAGE_DIR):
+    """
+    Return the location (``filename:lineno(function)``) of the first caller
+    outside of this package.
+    """
+    f = sys._getframe(2)
+
+    while f is not None and f.f_code.co_filename.startswith(__package_dir):
+        f = f.f_back
+
+    if f is None:
+        return '<unknown>'
+
+    code = f.f_code
+    return f'{code.co_filename}:{f.f_lineno}({code.co_name})'
+
+
+def __tree_size__(o, __values=dict.values):
+    """
+    Return the number of objects (``dict`` values) in a tree, and how
+    deeply they are nested; a ``list`` doesn't count as a level.
+
+    The values are read from the ``dict`` storage, so a nested value in
+    a lazy object is counted without converting it.
+    """
+    nodes = max_depth = 0
+    seen = set()
+    stack = [(o, 1)]
+
+    while stack:
+        o, depth = stack.pop()
+
+        if id(o) in seen:
+            continue
+
+        if isinstance(o, dict):
+            seen.add(id(o))
+            nodes += 1
+            if depth > max_depth:
+                max_depth = depth
+            stack.extend([(v, depth + 1) for v in __values(o)])
+
+        elif isinstance(o, (list, tuple)):
+            seen.add(id(o))
+            stack.extend([(v, depth) for v in o])
+
+    return nodes, max_depth
+
+
+def __profile_call__(profiles, op, self, tree, elapsed, allocated):
+    """Record an (outermost) call in each active profile"""
+    location = __caller__()
+    # `self` is the class for a `classmethod`, such as `from_json()`
+    cls = self if isinstance(self, type) else type(self)
+    nodes, max_depth = __tree_size__(tree)
+    key = (location, op, cls.__name__)
+
+    with __LOCK:
+        for p in profiles:
+            stats = p.stats.get(key)
+            if stats is None:
+                p.stats[key] = [1, nodes, max_depth, elapsed, allocated]
+            else:
+                stats[0] += 1
+                stats[1] += nodes
+                if max_depth > stats[2]:
+                    stats[2] = max_depth
+                stats[3] += elapsed
+                stats[4] += allocated
+
+
+def __start_profile__(p):
+    """Add a profile to the active ones"""
+    global __PROFILES
+    import tracemalloc
+
+    with __LOCK:
+        if p.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            p._started_tracing = True
+
+        __PROFILES = (*__PROFILES, p)
+        __patch__()
+
+
+def __stop_profile__(p):
+    """Remove a profile from the active ones"""
+    global __PROFILES
+    import tracemalloc
+
+    with __LOCK:
+        profiles = list(__PROFILES)
+        profiles.remove(p)
+        __PROFILES = tuple(profiles)
+        __unpatch__()
+
+        if p._started_tracing:
+            tracemalloc.stop()
+            p._started_tracing = False
+
+
+def __profile_entries__(p):
+    """Return a :class:`ProfileEntry` for each location in a profile"""
+    with __LOCK:
+        return [ProfileEntry(*key, *stats) for key, stats in p.stats.items()]
+
+
+class Profile(ContextDecorator):
+    """
+    Records each top-level conversion -- such as creating a :class:`DotWiz`
+    or :class:`DotWizPlus`, or calling :meth:`to_dict` -- while it's active,
+    and aggregates the statistics by the location it's called from. Use
+    :func:`profile` to create one.
+
+    :param sort_by: The field to sort a report by, in descending order:
+      one of ``'seconds'`` (the default), ``'bytes'``, ``'nodes'``,
+      ``'max_depth'`` or ``'calls'``.
+    :param trace_memory: True (the default) to record the bytes allocated
+      by each call, with :mod:`tracemalloc`; this makes the calls slower.
+    :param print_report: True to print a report when the profile exits.
+    :param limit: The maximum number of entries to print.
+    :param file: The file to print to; defaults to :data:`sys.stdout`.
+
+    """
+
+    def __init__(self, sort_by='seconds', trace_memory=True,
+                 print_report=False, limit=20, file=None):
+
+        if sort_by not in _SORT_FIELDS:
+            raise ValueError(f'Invalid sort_by={sort_by!r}: expected one of '
+                             f'{sorted(_SORT_FIELDS)}')
+
+        self.sort_by = sort_by
+        self.trace_memory = trace_memory
+        self.print_report = print_report
+        self.limit = limit
+        self.file = file
+
+        #: The statistics for each ``(location, op, cls)``: the number of
+        #: calls, the total nodes, the maximum depth, the total seconds,
+        #: and the total bytes allocated.
+        self.stats = {}
+
+        self._started_tracing = False
+
+    def __enter__(self):
+        __start_profile__(self)
+        return self
+
+    def __exit__(self, *exc):
+        __stop_profile__(self)
+
+        if self.print_report:
+            self.print_stats(self.limit, self.file)
+
+    def report(self, sort_by=None):
+        """
+        Return a ``list`` of :class:`ProfileEntry` for each location and
+        operation, sorted by `sort_by` (defaults to the one passed in) in
+        descending order.
+        """
+        field = ProfileEntry._fields.index(sort_by or self.sort_by)
+
+        entries = __profile_entries__(self)
+        entries.sort(key=lambda e: e[field], reverse=True)
+        return entries
+
+    def print_stats(self, limit=20, file=None):
+        """Print a report of the top `limit` entries to `file`."""
+        entries = self.report()[:limit]
+        columns = ('calls', 'nodes', 'depth', 'seconds', 'bytes', 'op',
+                   'class', 'location')
+        rows = [(f'{e.calls:,}', f'{e.nodes:,}', f'{e.max_depth:,}',
+                 f'{e.seconds:.6f}', f'{e.bytes:,}', e.op, e.cls, e.location)
+                for e in entries]
+
+        widths = [max(len(row[i]) for row in [columns, *rows])
+                  for i in range(len(columns))]
+
+        for row in [columns, *rows]:
+            # the numbers are aligned right, and the text on the left
+            line = '  '.join(v.rjust(w) if i < 5 else v.ljust(w)
+                             for i, (v, w) in enumerate(zip(row, widths)))
+            print(line.rstrip(), file=file or sys.stdout)
+
+
+def profile(sort_by='seconds', trace_memory=True, print_report=False,
+            limit=20, file=None):
+    """
+    Return a :class:`Profile`, which can be used as a context manager or a
+    decorator, to find the call sites which create the most expensive
+    :class:`DotWiz` and :class:`DotWizPlus` objects.
+
+    While the profile is active, each top-level call to create an object
+    (including :meth:`from_json` and :meth:`from_records`), or to
+    :meth:`to_dict`, is recorded with the location it's called from, the
+    number of nodes (objects) in the tree and how deeply they are nested,
+    the time taken, and the bytes allocated. The methods are only replaced
+    while a profile is active, so there is no cost at all otherwise.
+
+    Example::
+
+        >>> import dotwiz
+        >>> with dotwiz.profile() as p:
+        ...     _ = dotwiz.DotWiz({'a': {'b': {'c': 1}}})
+        >>> entry = p.report()[0]
+        >>> entry.op, entry.cls, entry.calls, entry.nodes, entry.max_depth
+        ('create', 'DotWiz', 1, 3, 3)
+
+    See :class:`Profile` for a description of the parameters.
+
+    """
+    return Profile(sort_by, trace_memory, print_report, limit, file)
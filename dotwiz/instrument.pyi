@@ -0,0 +1,127 @@
+from contextlib import ContextDecorator
+from threading import Lock, local
+from typing import Any, Callable, Iterable, Literal, NamedTuple, TextIO, TypedDict
+
+from .common import KeyCache
+
+_Hook = Callable[[str, float, int], Any]
+_SortBy = Literal['calls', 'nodes', 'max_depth', 'seconds', 'bytes']
+
+
+class _OperationStats(TypedDict):
+    calls: int
+    seconds: float
+
+
+class _Snapshot(TypedDict):
+    nodes: int
+    lists: int
+    key_cache_hits: int
+    key_cache_misses: int
+    operations: dict[str, _OperationStats]
+
+
+__OPERATIONS: dict[str, str] = ...
+__CONVERTING_OPS: frozenset[str] = ...
+__ORIGINALS: dict[tuple[type, str], Any] = ...
+__LOCK: Lock = ...
+__STATE: local = ...
+__ENABLED: bool = ...
+__HOOK: _Hook | None = ...
+__PROFILES: tuple[Profile, ...] = ...
+__PACKAGE_DIR: str = ...
+__COUNTS: dict[str, int] = ...
+__NOT_SET: object = ...
+__TIMES: dict[str, list[int | float]] = ...
+__KEY_CACHE_BASE: dict[KeyCache, tuple[int, int]] = ...
+__KEY_CACHE_COUNTS: list[int] = ...
+
+
+def __count_converted__(trees: Iterable[Any]) -> tuple[int, int]: ...
+
+def __count__(trees: Iterable[Any], __counts: dict[str, int] = ...) -> int: ...
+
+def __instrumented__(fn: Callable[..., Any], op: str, name: str,
+                     __state: local = ...) -> Callable[..., Any]: ...
+
+def __key_caches__() -> list[KeyCache]: ...
+
+def __set_key_cache_base__() -> None: ...
+
+def __key_cache_counts__() -> tuple[int, int]: ...
+
+def __record__(op: str, elapsed: float, nodes: int) -> None: ...
+
+def __patch__() -> None: ...
+
+def __unpatch__() -> None: ...
+
+def enable_instrumentation(hook: _Hook | None = None) -> None: ...
+
+def disable_instrumentation() -> None: ...
+
+def is_instrumentation_enabled() -> bool: ...
+
+def instrumentation_snapshot() -> _Snapshot: ...
+
+def reset_instrumentation() -> None: ...
+
+
+class ProfileEntry(NamedTuple):
+    location: str
+    op: str
+    cls: str
+    calls: int
+    nodes: int
+    max_depth: int
+    seconds: float
+    bytes: int
+
+
+_SORT_FIELDS: frozenset[str] = ...
+
+
+def __caller__(__package_dir: str = ...) -> str: ...
+
+def __tree_size__(o: Any) -> tuple[int, int]: ...
+
+def __profile_call__(profiles: tuple[Profile, ...], op: str, self: Any,
+                     tree: Any, elapsed: float, allocated: int) -> None: ...
+
+def __start_profile__(p: Profile) -> None: ...
+
+def __stop_profile__(p: Profile) -> None: ...
+
+def __profile_entries__(p: Profile) -> list[ProfileEntry]: ...
+
+
+class Profile(ContextDecorator):
+
+    sort_by: _SortBy
+    trace_memory: bool
+    print_report: bool
+    limit: int
+    file: TextIO | None
+    stats: dict[tuple[str, str, str], list[int | float]]
+    _started_tracing: bool
+
+    def __init__(self, sort_by: _SortBy = 'seconds',
+                 trace_memory: bool = True,
+                 print_report: bool = False,
+                 limit: int = 20,
+                 file: TextIO | None = None) -> None: ...
+
+    def __enter__(self) -> Profile: ...
+
+    def __exit__(self, *exc: Any) -> None: ...
+
+    def report(self, sort_by: _SortBy | None = None) -> list[ProfileEntry]: ...
+
+    def print_stats(self, limit: int = 20, file: TextIO | None = None) -> None: ...
+
+
+def profile(sort_by: _SortBy = 'seconds',
+            trace_memory: bool = True,
+            print_report: bool = False,
+            limit: int = 20,
+            file: TextIO | None = None) -> Profile: ...
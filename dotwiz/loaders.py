@@ -0,0 +1,122 @@
+"""Loaders for streaming (large) files into `DotWiz` objects."""
+import json
+
+from .main import DotWiz
+
+
+def iter_json_lines(fp, cls=DotWiz, batch_size=None,
+                    chunk_size=1 << 20, **kwargs):
+    """
+    Read a file of JSON lines (also known as NDJSON), and yield each record
+    as a :class:`DotWiz` - or as another `cls`, such as :class:`DotWizPlus` -
+    one at a time.
+
+    The file is read in large chunks, so a file which is larger than the
+    available memory can be processed at a constant memory cost. Blank
+    lines are skipped.
+
+    Example::
+
+        >>> from dotwiz import DotWizPlus, iter_json_lines
+        >>> with open('events.jsonl', 'rb') as f:
+        ...     for batch in iter_json_lines(f, DotWizPlus, batch_size=1000):
+        ...         process(batch)
+
+    :param fp: A file-like object, opened in either text or binary mode. In
+      binary mode, the contents are expected to be UTF-8 encoded.
+    :param cls: The class (such as :class:`DotWiz` or :class:`DotWizPlus`)
+      to create for each JSON object.
+    :param batch_size: If passed, yield lists of up to `batch_size` records
+      at a time, instead of one record at a time.
+    :param chunk_size: The number of bytes (or characters) to read from
+      `fp` at a time.
+    :param kwargs: Any additional keyword arguments to pass on to the
+      :class:`json.JSONDecoder`.
+
+    """
+    # note: this is the same as `cls.from_json()`, but creating the decoder
+    # once is faster than doing so for each line.
+    decode = json.JSONDecoder(object_hook=cls.__object_hook__,
+                              **kwargs).decode
+
+    records = (decode(line) for line in __iter_lines__(fp, chunk_size))
+
+    if batch_size is None:
+        return records
+
+    if batch_size < 1:
+        raise ValueError(f'batch_size must be a positive integer, '
+                         f'got: {batch_size!r}')
+
+    return __iter_batches__(records, batch_size)
+
+
+def __iter_lines__(fp, chunk_size):
+    """
+    Read a file-like object `fp` in chunks of `chunk_size`, and yield each
+    line which isn't blank, as a ``str``.
+    """
+    read = fp.read
+
+    chunk = read(chunk_size)
+    is_binary = isinstance(chunk, (bytes, bytearray))
+    newline = b'\n' if is_binary else '\n'
+    join = chunk[:0].join
+    # the pieces of a partial line, which can span several chunks; these
+    # are joined once the line is complete, as concatenating each chunk
+    # would copy a long line over and over.
+    pieces = []
+
+    while chunk:
+        # split off a (possibly) partial line at the end of the chunk,
+        # which is completed by the next chunk.
+        lines, has_newline, rest = chunk.rpartition(newline)
+
+        if not has_newline:
+            pieces.append(chunk)
+            chunk = read(chunk_size)
+            continue
+
+        if pieces:
+            pieces.append(lines)
+            lines = join(pieces)
+            pieces.clear()
+
+        if rest:
+            pieces.append(rest)
+
+        if is_binary:
+            # note: it's safe to decode here, as a newline is never part
+            # of a multi-byte character in UTF-8.
+            lines = lines.decode()
+
+        for line in lines.split('\n'):
+            if line and not line.isspace():
+                yield line
+
+        chunk = read(chunk_size)
+
+    if pieces:
+        line = join(pieces)
+        if is_binary:
+            line = line.decode()
+
+        if not line.isspace():
+            yield line
+
+
+def __iter_batches__(records, batch_size):
+    """Yield lists of up to `batch_size` items from an iterable `records`."""
+    batch = []
+    append = batch.append
+
+    for record in records:
+        append(record)
+
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+            append = batch.append
+
+    if batch:
+        yield batch
@@ -0,0 +1,28 @@
+from typing import Any, Iterator, TypeVar, overload
+
+from _typeshed import SupportsRead
+
+from .main import DotWiz
+
+_D = TypeVar('_D', bound=dict)  # a `dict` subclass
+
+
+@overload
+def iter_json_lines(fp: SupportsRead[str | bytes],
+                    cls: type[_D] = DotWiz,
+                    batch_size: None = None,
+                    chunk_size: int = 1 << 20,
+                    **kwargs: Any) -> Iterator[_D]: ...
+
+@overload
+def iter_json_lines(fp: SupportsRead[str | bytes],
+                    cls: type[_D] = DotWiz,
+                    batch_size: int = ...,
+                    chunk_size: int = 1 << 20,
+                    **kwargs: Any) -> Iterator[list[_D]]: ...
+
+def __iter_lines__(fp: SupportsRead[str | bytes],
+                   chunk_size: int) -> Iterator[str]: ...
+
+def __iter_batches__(records: Iterator[_D],
+                     batch_size: int) -> Iterator[list[_D]]: ...
@@ -1,10 +1,27 @@
 """Main module."""
+from keyword import iskeyword
 
 from .common import (
     __add_repr__,
     __convert_to_dict__,
+    __copy_with_state__,
+    __deepcopy_with_state__,
+    __from_each_record__,
+    __from_graph__,
+    __from_json__,
+    __from_json_file__,
+    __getitem_from_dict__,
+    __guard_reprs__,
+    __iter_lazy_impl__,
+    __pop_lazy_impl__,
+    __popitem_lazy_impl__,
+    __reduce_ex_impl__,
     __resolve_value__,
+    __setdefault_lazy_impl__,
+    __UNGUARDED_REPRS,
 )
+from .paths import (__get_path__, __has_path__, __set_path__,
+                    __reserve_attr_names__)
 
 
 def make_dot_wiz(*args, **kwargs):
@@ -69,6 +86,396 @@ def __setitem_impl__(self, key, value, __set=dict.__setitem__):
     self.__dict__[key] = value
 
 
+def __object_hook__(cls, o, __update=dict.update):
+    """
+    Create a :class:`DotWiz` from a ``dict`` object `o` which is decoded from
+    JSON, and which is then owned by the new instance.
+
+    Nested values are already converted by the time `o` is decoded, so `o`
+    itself is used as the instance :attr:`__dict__`.
+
+    """
+    self = cls.__new__(cls)
+
+    __update(self, o)
+    __set_dict(self, o)
+
+    return self
+
+
+def __store_in_object__(self, __self_dict, key, value,
+                        __set=dict.__setitem__):
+    """
+    Helper method to store a key-value pair in an object :param:`self` (a
+    ``DotWiz`` instance), in both the object's :attr:`__dict__` and the
+    underlying ``dict`` store.
+    """
+    __set(self, key, value)
+    # note: a `DotWizLite` uses itself as the `__dict__`, so bypass any
+    # `__setitem__` override here.
+    __set(__self_dict, key, value)
+
+
+def __from_graph_impl__(cls, o):
+    """
+    Create a :class:`DotWiz` from a ``dict`` object `o`, which can contain
+    shared or circular references to nested ``dict`` and ``list`` objects.
+    """
+    return __from_graph__(o, cls, __store_in_object__)
+
+
+def __from_record__(cls, record,
+                    __new=dict.__new__,
+                    __update=dict.update,
+                    __set=dict.__setitem__):
+    """
+    Create a :class:`DotWiz` from a ``dict`` object `record`.
+
+    Both the ``dict`` storage and the instance :attr:`__dict__` are filled
+    with a (C-level) copy of `record`, and then only nested ``dict`` and
+    ``list`` values are converted and set again.
+    """
+    self = __new(cls)
+    __update(self, record)
+
+    __dict = dict(record)
+
+    for key in __dict:
+        value = __dict[key]
+        t = type(value)
+
+        if t is dict:
+            value = __from_record__(cls, value)
+        elif t is list:
+            value = [__from_record__(cls, e) if type(e) is dict
+                     else __resolve_value__(e, cls) for e in value]
+        else:
+            continue
+
+        __set(self, key, value)
+        __dict[key] = value
+
+    __set_dict(self, __dict)
+
+    return self
+
+
+def __from_records__(cls, records):
+    """
+    Create a ``list`` of :class:`DotWiz` instances from an iterable of
+    ``dict`` objects, such as the records in a JSON API response.
+    """
+    return [__from_record__(cls, record) for record in records]
+
+
+# A cache of specialized `DotWiz` classes, keyed on the (nested) key shape.
+__SPECIALIZED_CLASSES = {}
+
+# Source code for the (unrolled) constructor of a specialized `DotWiz` class.
+#
+# Storage is first populated with `dict.update()`, so that key order is
+# the same as for `DotWiz`; only nested `dict` and `list` values need to
+# be converted and set again.
+__SPECIALIZED_INIT = """\
+def __init__(self, input_dict={{}}, __set=dict.__setitem__,
+             __update=dict.update, **kwargs):
+    if kwargs or len(input_dict) != {num_keys}:
+        return __upsert(self, input_dict, **kwargs)
+
+    __update(self, input_dict)
+{get_dict}
+    try:
+{body}
+    except KeyError:
+        # the input has a different set of keys
+        __upsert(self, input_dict)
+"""
+
+# Source code to store a value in a specialized `DotWiz` class.
+__SPECIALIZED_STORE = """\
+        v = input_dict[{key}]
+        t = type(v)
+        if t is dict:
+            v = __dict_type_{i}(v)
+            __set(self, {key}, v)
+        elif t is list:
+            v = [__resolve(e, __elem_type_{i}) for e in v]
+            __set(self, {key}, v)
+        {store}
+"""
+
+
+def __shape_of__(value):
+    """
+    Return the (hashable) *shape* of `value`, which is the key names of a
+    ``dict`` and the shape of its nested values, or ``None`` if `value` is
+    not a ``dict`` or a non-empty ``list``.
+
+    The shape of a ``list`` is the shape of its first element.
+    """
+    t = type(value)
+
+    if t is dict:
+        return dict, tuple([(k, __shape_of__(value[k])) for k in value])
+
+    if t is list and value:
+        elem_shape = __shape_of__(value[0])
+        if elem_shape is not None:
+            return list, elem_shape
+
+    return None
+
+
+def __is_slot_key__(key):
+    """
+    Return true if `key` can be stored in a slot of a specialized
+    :class:`DotWiz` class.
+    """
+    return (type(key) is str
+            and key.isidentifier()
+            and not iskeyword(key)
+            and not key.startswith('__')
+            and not hasattr(DotWiz, key))
+
+
+def __class_for_shape__(shape):
+    """
+    Return the specialized :class:`DotWiz` class for a `shape`, generating
+    (and caching) the class if needed.
+    """
+    if shape is None:
+        return DotWiz
+
+    kind, fields = shape
+
+    if kind is list:
+        return __class_for_shape__(fields)
+
+    try:
+        return __SPECIALIZED_CLASSES[shape]
+    except KeyError:
+        pass
+
+    slots = tuple([k for k, _ in fields if __is_slot_key__(k)])
+
+    cls = type('SpecializedDotWiz', (DotWiz, ), {
+        '__slots__': slots,
+        '__module__': __name__,
+        '__getitem__': dict.__getitem__,
+        '__setattr__': __setitem_specialized_impl__,
+        '__setitem__': __setitem_specialized_impl__,
+        'update': __upsert_into_specialized_dot_wiz__,
+        'from_graph': classmethod(__from_graph_specialized__),
+        'from_records': classmethod(__from_each_record__),
+        '__object_hook__': classmethod(__object_hook_specialized__),
+        '__reduce_ex__': __reduce_ex_specialized__,
+        '__setstate__': __setstate_specialized__,
+        '__copy__': __copy_with_state__,
+    })
+
+    setters = {k: getattr(cls, k).__set__ for k in slots}
+
+    scope = {'__upsert': __upsert_into_specialized_dot_wiz__,
+             '__resolve': __resolve_value__}
+    body = []
+
+    for i, (key, value_shape) in enumerate(fields):
+        # use a literal for the key name where possible, as it's faster
+        if type(key) is str or type(key) is int:
+            key_name = repr(key)
+        else:
+            key_name = f'__key_{i}'
+            scope[key_name] = key
+
+        if value_shape is not None and value_shape[0] is dict:
+            scope[f'__dict_type_{i}'] = __class_for_shape__(value_shape)
+            scope[f'__elem_type_{i}'] = DotWiz
+        else:
+            scope[f'__dict_type_{i}'] = DotWiz
+            scope[f'__elem_type_{i}'] = __class_for_shape__(value_shape)
+
+        if key in setters:
+            scope[f'__set_{i}'] = setters[key]
+            store = f'__set_{i}(self, v)'
+        else:
+            store = f'__dict[{key_name}] = v'
+
+        body.append(__SPECIALIZED_STORE.format(key=key_name, i=i,
+                                               store=store))
+
+    get_dict = '' if len(slots) == len(fields) else '    __dict = self.__dict__'
+
+    exec(__SPECIALIZED_INIT.format(num_keys=len(fields),
+                                   get_dict=get_dict,
+                                   body=''.join(body)), scope)
+
+    cls.__init__ = scope['__init__']
+    cls.__setters__ = setters
+    cls.__shape__ = shape
+
+    __SPECIALIZED_CLASSES[shape] = cls
+
+    return cls
+
+
+def __specialize__(cls, sample_or_keys):
+    """
+    Return a :class:`DotWiz` subclass which is *specialized* for a given
+    shape, which is either a sample ``dict`` or an iterable of key names.
+
+    Values for key names which are valid identifiers are stored in
+    ``__slots__``, rather than in an instance :attr:`__dict__`, and the
+    constructor is generated with a step for each key. If a sample
+    ``dict`` is passed in, nested ``dict`` values (and the first element
+    of ``list`` values) are also converted to specialized classes.
+
+    The same class is returned for the same shape.
+
+    Example::
+
+        >>> from dotwiz import DotWiz
+        >>> User = DotWiz.specialize({'id': 1, 'name': 'Jon'})
+        >>> User({'id': 2, 'name': 'Jane'})
+        ✫(id=2, name='Jane')
+
+    """
+    if cls is not DotWiz:
+        raise TypeError(f'{cls.__name__}.specialize() is not supported; '
+                        'use DotWiz.specialize() instead')
+
+    if isinstance(sample_or_keys, dict):
+        shape = __shape_of__(dict(sample_or_keys))
+    else:
+        shape = dict, tuple([(k, None) for k in sample_or_keys])
+
+    return __class_for_shape__(shape)
+
+
+def __store_in_specialized_object__(self, __self_dict, key, value,
+                                    __set=dict.__setitem__):
+    """
+    Helper method to store a key-value pair in a specialized :class:`DotWiz`
+    instance, in either a slot or the object's :attr:`__dict__`, and in the
+    underlying ``dict`` store.
+    """
+    __set(self, key, value)
+
+    setter = self.__setters__.get(key)
+
+    if setter is not None:
+        setter(self, value)
+    elif __self_dict is None:
+        self.__dict__[key] = value
+    else:
+        __self_dict[key] = value
+
+
+# noinspection PyDefaultArgument
+def __upsert_into_specialized_dot_wiz__(self, input_dict={}, **kwargs):
+    """
+    Helper method to update a specialized :class:`DotWiz` from a Python
+    ``dict`` object, and optional *keyword arguments*, where the key
+    names don't match the shape of the class.
+    """
+    if kwargs:
+        if input_dict:
+            input_dict.update(kwargs)
+        else:
+            input_dict = kwargs
+
+    for key in input_dict:
+        value = input_dict[key]
+        t = type(value)
+
+        if t is dict:
+            value = DotWiz(value)
+        elif t is list:
+            value = [__resolve_value__(e, DotWiz) for e in value]
+
+        __store_in_specialized_object__(self, None, key, value)
+
+
+def __setitem_specialized_impl__(self, key, value):
+    """Implementation of `__setitem__` for a specialized :class:`DotWiz`"""
+    value = __resolve_value__(value, DotWiz)
+    __store_in_specialized_object__(self, None, key, value)
+
+
+def __from_graph_specialized__(cls, o):
+    """
+    Create a specialized :class:`DotWiz` from a ``dict`` object `o`, which
+    can contain shared or circular references.
+    """
+    return __from_graph__(o, cls, __store_in_specialized_object__)
+
+
+def __new_specialized__(shape):
+    """
+    Create an empty instance of the specialized :class:`DotWiz` class for
+    a `shape`; used when unpickling, as the generated class itself can't
+    be imported.
+    """
+    return dict.__new__(__class_for_shape__(shape))
+
+
+def __reduce_ex_specialized__(self, protocol):
+    """
+    Return the arguments to :mod:`pickle` a specialized :class:`DotWiz`,
+    which is recreated from the shape of its class.
+    """
+    return __new_specialized__, (type(self).__shape__, ), dict(self)
+
+
+def __setstate_specialized__(self, state):
+    """
+    Restore a specialized :class:`DotWiz` from its pickled `state`, which
+    also sets the value in the slot for each key.
+    """
+    type(self).__init__(self, state)
+
+
+def __object_hook_specialized__(cls, o):
+    """
+    Create a specialized :class:`DotWiz` from a ``dict`` object `o` which
+    is decoded from JSON.
+    """
+    return cls(o)
+
+
+def __getstate_impl__(self):
+    """
+    Return the state of a :class:`DotWiz` to pickle, which is a copy of
+    the ``dict`` storage; the instance :attr:`__dict__` has the same items.
+    """
+    return dict(self)
+
+
+def __setstate_impl__(self, state, __update=dict.update):
+    """
+    Restore a :class:`DotWiz` from its pickled `state`, in which nested
+    values are already converted.
+
+    A pickle from an older version has the instance :attr:`__dict__` as
+    the `state`, which has the same items, so it's restored the same way.
+    """
+    if __UNGUARDED_REPRS:
+        __guard_reprs__()
+
+    __update(self, state)
+    __set_dict(self, state)
+
+
+def __copy_impl__(self, __new=dict.__new__, __update=dict.update):
+    """
+    Return a shallow copy of a :class:`DotWiz`, for :func:`copy.copy`;
+    nested values are shared with the original.
+    """
+    new = __new(type(self))
+    __update(new, self)
+    __set_dict(new, self.__dict__.copy())
+    return new
+
+
 class DotWiz(dict, metaclass=__add_repr__, print_char='✫'):
     """
     :class:`DotWiz` - a blazing *fast* ``dict`` subclass that also supports
@@ -90,9 +497,319 @@ class DotWiz(dict, metaclass=__add_repr__, print_char='✫'):
     __delattr__ = __delitem__ = dict.__delitem__
     __setattr__ = __setitem__ = __setitem_impl__
 
-    def __getitem__(self, key):
-        return self.__dict__[key]
+    __getitem__ = __getitem_from_dict__
 
     to_dict = __convert_to_dict__
     to_dict.__doc__ = 'Recursively convert the :class:`DotWiz` instance ' \
                       'back to a ``dict``.'
+
+    from_graph = classmethod(__from_graph_impl__)
+    from_records = classmethod(__from_records__)
+
+    __object_hook__ = classmethod(__object_hook__)
+
+    from_json = classmethod(__from_json__)
+    from_json_file = classmethod(__from_json_file__)
+
+    get_path = __get_path__
+    has_path = __has_path__
+    set_path = __set_path__
+
+    specialize = classmethod(__specialize__)
+
+    __reduce_ex__ = __reduce_ex_impl__
+    __getstate__ = __getstate_impl__
+    __setstate__ = __setstate_impl__
+
+    __copy__ = __copy_impl__
+    __deepcopy__ = __deepcopy_with_state__
+
+
+# Setter for the instance `__dict__` of a `DotWiz`
+__set_dict = DotWiz.__dict__['__dict__'].__set__
+
+
+# noinspection PyDefaultArgument
+def __upsert_into_lazy_dot_wiz__(self, input_dict={},
+                                 __set=dict.__setitem__,
+                                 **kwargs):
+    """
+    Helper method to generate / update a :class:`LazyDotWiz` (dot-access dict)
+    from a Python ``dict`` object, and optional *keyword arguments*.
+
+    Nested ``dict`` and ``list`` values are stored as-is, and are only
+    converted when first accessed.
+
+    """
+    __dict = self.__dict__
+    __class_attrs = __LAZY_CLASS_ATTRS
+
+    if kwargs:
+        # avoids the potential pitfall of a "mutable default argument" -
+        # only update or modify `input_dict` if the param is passed in.
+        if input_dict:
+            input_dict.update(kwargs)
+        else:
+            input_dict = kwargs
+
+    for key in input_dict:
+        value = input_dict[key]
+        t = type(value)
+
+        # a key which is missing from the instance `__dict__` is one that
+        # still needs to be converted, on first access.
+        if t is dict or t is list:
+            # except for a key such as `items`, which would otherwise be
+            # looked up as the method, as it's not missing.
+            if key in __class_attrs:
+                value = __resolve_value__(value, LazyDotWiz)
+                __dict[key] = value
+            else:
+                __dict.pop(key, None)
+        else:
+            __dict[key] = value
+
+        __set(self, key, value)
+
+
+def __setitem_lazy_impl__(self, key, value):
+    """Implementation of `LazyDotWiz.__setitem__` to preserve dot access"""
+    __upsert_into_lazy_dot_wiz__(self, {key: value})
+
+
+def __resolve_lazy_value__(self, key,
+                           __get=dict.__getitem__,
+                           __set=dict.__setitem__):
+    """
+    Convert the (nested) value for `key` in a :class:`LazyDotWiz`, and
+    cache the result in place.
+    """
+    value = __resolve_value__(__get(self, key), LazyDotWiz)
+
+    __set(self, key, value)
+    self.__dict__[key] = value
+
+    return value
+
+
+def __resolve_all_lazy__(self, __keys=dict.keys):
+    """Convert any (top-level) values that haven't been accessed yet."""
+    __dict = self.__dict__
+
+    for key in [k for k in __keys(self) if k not in __dict]:
+        __resolve_lazy_value__(self, key)
+
+
+def __getstate_lazy_impl__(self, __items=dict.items):
+    """
+    Return the state of a :class:`LazyDotWiz` to pickle, which is a copy
+    of the ``dict`` storage - where a nested value might not be converted
+    yet - and the keys which are set in the instance :attr:`__dict__`.
+    """
+    # note: `dict(self)` would convert each value, via `__getitem__()`
+    return dict(__items(self)), tuple(self.__dict__)
+
+
+def __setstate_lazy_impl__(self, state, __update=dict.update):
+    """Restore a :class:`LazyDotWiz` from its pickled `state`."""
+    if __UNGUARDED_REPRS:
+        __guard_reprs__()
+
+    storage, keys = state
+
+    __update(self, storage)
+    __set_dict(self, {k: storage[k] for k in keys})
+
+
+class LazyDotWiz(DotWiz):
+    """
+    :class:`LazyDotWiz` - a :class:`DotWiz` which converts nested ``dict``
+    and ``list`` values on *first access*, rather than on creation.
+
+    This is useful when only a few fields of a large payload are ever
+    accessed, as the cost of creating the object then scales with the
+    number of values which are actually accessed.
+
+    Usage::
+
+        >>> from dotwiz import LazyDotWiz
+        >>> dw = LazyDotWiz({'a': {'b': [{'c': 1}]}, 'd': 2})
+        >>> assert dw.a.b[0].c == 1
+        >>> dw
+        ✫(a=✫(b=[✫(c=1)]), d=2)
+
+    The results of ``repr``, ``to_dict``, ``pop``, ``setdefault``,
+    ``dict(...)`` and equality comparisons are the same as with a
+    :class:`DotWiz`, whether or not a nested value has been accessed yet.
+
+    """
+    __slots__ = ()
+
+    __init__ = update = __upsert_into_lazy_dot_wiz__
+
+    __setattr__ = __setitem__ = __setitem_lazy_impl__
+
+    from_records = classmethod(__from_each_record__)
+
+    __getstate__ = __getstate_lazy_impl__
+    __setstate__ = __setstate_lazy_impl__
+
+    __iter__ = __iter_lazy_impl__
+
+    pop = __pop_lazy_impl__
+    popitem = __popitem_lazy_impl__
+    setdefault = __setdefault_lazy_impl__
+
+    def __getattr__(self, item, __contains=dict.__contains__):
+        if __contains(self, item):
+            return __resolve_lazy_value__(self, item)
+
+        # defer to a `__getattr__()` added via `set_default_for_missing_keys`
+        default_getattr = getattr(DotWiz, '__getattr__', None)
+        if default_getattr is not None:
+            return default_getattr(self, item)
+
+        raise AttributeError(
+            f'{type(self).__name__!r} object has no attribute {item!r}')
+
+    def __getitem__(self, key):
+        __dict = self.__dict__
+
+        if key in __dict:
+            return __dict[key]
+
+        return __resolve_lazy_value__(self, key)
+
+    def get(self, key, default=None, __contains=dict.__contains__):
+        return self[key] if __contains(self, key) else default
+
+    def items(self):
+        __resolve_all_lazy__(self)
+        return dict.items(self)
+
+    def values(self):
+        __resolve_all_lazy__(self)
+        return dict.values(self)
+
+    def __repr__(self):
+        __resolve_all_lazy__(self)
+        # note: this is looked up on each call, as the `__repr__` is
+        # replaced once `from_graph()` is first called.
+        return DotWiz.__repr__(self)
+
+
+# The names of the `LazyDotWiz` attributes (such as methods); a nested value
+# with one of these keys is converted right away.
+__LAZY_CLASS_ATTRS = frozenset(dir(LazyDotWiz))
+
+
+# noinspection PyDefaultArgument
+def __upsert_into_dot_wiz_lite__(self, input_dict={},
+                                 __set=dict.__setitem__,
+                                 **kwargs):
+    """
+    Helper method to generate / update a :class:`DotWizLite` (dot-access dict)
+    from a Python ``dict`` object, and optional *keyword arguments*.
+
+    """
+    # the instance `__dict__` is the object itself, so attribute lookups
+    # are resolved from the `dict` storage, without a second hash table.
+    __set_dict(self, self)
+
+    if kwargs:
+        # avoids the potential pitfall of a "mutable default argument" -
+        # only update or modify `input_dict` if the param is passed in.
+        if input_dict:
+            input_dict.update(kwargs)
+        else:
+            input_dict = kwargs
+
+    for key in input_dict:
+        # note: this logic is the same as `__resolve_value__()`, but is
+        # inlined for performance reasons (same as in `DotWiz`).
+        value = input_dict[key]
+        t = type(value)
+
+        if t is dict:
+            value = DotWizLite(value)
+        elif t is list:
+            value = [__resolve_value__(e, DotWizLite) for e in value]
+
+        __set(self, key, value)
+
+
+def __object_hook_lite__(cls, o, __update=dict.update):
+    """
+    Create a :class:`DotWizLite` from a ``dict`` object `o` which is decoded
+    from JSON.
+    """
+    self = cls.__new__(cls)
+
+    __update(self, o)
+    __set_dict(self, self)
+
+    return self
+
+
+def __setstate_lite_impl__(self, state, __update=dict.update):
+    """Restore a :class:`DotWizLite` from its pickled `state`."""
+    if __UNGUARDED_REPRS:
+        __guard_reprs__()
+
+    __update(self, state)
+    __set_dict(self, self)
+
+
+def __setitem_lite_impl__(self, key, value, __set=dict.__setitem__):
+    """Implementation of `DotWizLite.__setitem__` to preserve dot access"""
+    __set(self, key, __resolve_value__(value, DotWizLite))
+
+
+class DotWizLite(DotWiz):
+    """
+    :class:`DotWizLite` - a :class:`DotWiz` which stores each key-value
+    pair only *once*.
+
+    A :class:`DotWiz` keeps a copy of every key-value pair in the instance
+    :attr:`__dict__`, in addition to the ``dict`` storage. Instead, the
+    instance :attr:`__dict__` of a :class:`DotWizLite` *is* the ``dict``
+    storage, so there is only one hash table per object. This cuts the
+    memory used per object by up to half.
+
+    The trade-off is that attribute access is about two to three times as
+    slow as for a :class:`DotWiz`, as CPython only has a fast path for an
+    instance :attr:`__dict__` which is a plain ``dict``.
+
+    Usage::
+
+        >>> from dotwiz import DotWizLite
+        >>> dw = DotWizLite({'key_1': [{'k': 'v'}], 'keyTwo': '5', 'key-3': 3.21})
+        >>> assert dw.key_1[0].k == 'v'
+        >>> assert dw.keyTwo == '5'
+        >>> assert dw['key-3'] == 3.21
+
+    Note that as each object refers to itself (via its :attr:`__dict__`),
+    every object is a reference cycle. It is not freed when it goes out of
+    scope, but only by the cyclic garbage collector (see :mod:`gc`); so
+    creating many objects triggers more (and longer) collections, and the
+    memory is held until the next one runs.
+
+    """
+    __slots__ = ()
+
+    __init__ = update = __upsert_into_dot_wiz_lite__
+
+    __getitem__ = dict.__getitem__
+    __setattr__ = __setitem__ = __setitem_lite_impl__
+
+    from_records = classmethod(__from_each_record__)
+
+    __object_hook__ = classmethod(__object_hook_lite__)
+
+    __setstate__ = __setstate_lite_impl__
+
+    __copy__ = __copy_with_state__
+
+
+# a key such as `to_dict` is never looked up as an attribute in a path.
+__reserve_attr_names__(DotWiz, LazyDotWiz, DotWizLite)
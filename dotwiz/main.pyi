@@ -1,10 +1,16 @@
-from typing import TypeVar, Callable, Protocol, Mapping, MutableMapping, Iterable
+from typing import (Any, TypeVar, Callable, Protocol, Mapping, MutableMapping, Iterable,
+                    ItemsView, Iterator, KeysView, ValuesView, Sequence)
+
+from _typeshed import SupportsRead
+
+from .paths import DotPath
 
 _T = TypeVar('_T')
 _KT = TypeVar('_KT')
 _VT = TypeVar('_VT')
 
 _SetItem = Callable[[dict, _KT, _VT], None]
+_Shape = tuple[type, Any]
 
 # Ref: https://stackoverflow.com/a/68392079/10237506
 class _Update(Protocol):
@@ -28,8 +34,130 @@ def __setitem_impl__(self: DotWiz,
                      *, __set: _SetItem = dict.__setitem__) -> None: ...
 
 
+__SPECIALIZED_CLASSES: dict[_Shape, type[DotWiz]] = ...
+__SPECIALIZED_INIT: str = ...
+__SPECIALIZED_STORE: str = ...
+
+
+def __shape_of__(value: Any) -> _Shape | None: ...
+
+def __is_slot_key__(key: Any) -> bool: ...
+
+def __class_for_shape__(shape: _Shape | None) -> type[DotWiz]: ...
+
+def __specialize__(cls: type[DotWiz],
+                   sample_or_keys: Mapping[_KT, _VT] | Iterable[_KT]) -> type[DotWiz]: ...
+
+def __store_in_specialized_object__(self: DotWiz,
+                                    __self_dict: dict | None,
+                                    key: _KT,
+                                    value: _VT,
+                                    *, __set: _SetItem = dict.__setitem__) -> None: ...
+
+# noinspection PyDefaultArgument
+def __upsert_into_specialized_dot_wiz__(self: DotWiz,
+                                        input_dict: MutableMapping[_KT, _VT] = {},
+                                        **kwargs: _T) -> None: ...
+
+def __setitem_specialized_impl__(self: DotWiz, key: _KT, value: _VT) -> None: ...
+
+def __from_graph_specialized__(cls: type[DotWiz], o: dict[_KT, _VT]) -> DotWiz: ...
+
+def __new_specialized__(shape: _Shape) -> DotWiz: ...
+
+def __reduce_ex_specialized__(self: DotWiz,
+                              protocol: int) -> tuple[Callable[[_Shape], DotWiz], tuple[_Shape], dict[_KT, _VT]]: ...
+
+def __setstate_specialized__(self: DotWiz, state: dict[_KT, _VT]) -> None: ...
+
+def __object_hook_specialized__(cls: type[DotWiz], o: dict[_KT, _VT]) -> DotWiz: ...
+
+
+def __store_in_object__(self: DotWiz,
+                        __self_dict: dict,
+                        key: _KT,
+                        value: _VT,
+                        *, __set: _SetItem = dict.__setitem__) -> None: ...
+
+def __from_record__(cls: type[DotWiz],
+                    record: Mapping[_KT, _VT],
+                    *, __new: Callable[[type[DotWiz]], DotWiz] = dict.__new__,
+                    __update: _Update = dict.update,
+                    __set: _SetItem = dict.__setitem__) -> DotWiz: ...
+
+def __from_records__(cls: type[DotWiz],
+                     records: Iterable[Mapping[_KT, _VT]]) -> list[DotWiz]: ...
+
+def __from_graph_impl__(cls: type[DotWiz], o: dict[_KT, _VT]) -> DotWiz: ...
+
+def __object_hook__(cls: type[DotWiz], o: dict[_KT, _VT]) -> DotWiz: ...
+
+def __getstate_impl__(self: DotWiz) -> dict[_KT, _VT]: ...
+
+def __copy_impl__(self: DotWiz,
+                  *, __new: Callable[[type[DotWiz]], DotWiz] = dict.__new__,
+                  __update: _Update = dict.update) -> DotWiz: ...
+
+def __setstate_impl__(self: DotWiz,
+                      state: dict[_KT, _VT],
+                      *, __update: _Update = dict.update) -> None: ...
+
+
 class DotWiz(dict):
 
+    @classmethod
+    def __object_hook__(cls, o: dict[_KT, _VT]) -> DotWiz: ...
+
+    @classmethod
+    def from_graph(cls, o: dict[_KT, _VT]) -> DotWiz:
+        """
+        Create a :class:`DotWiz` from a ``dict`` object, which can contain shared
+        or circular references to nested ``dict`` and ``list`` objects.
+
+        Each distinct nested object is converted only once, and the result
+        is shared everywhere the object appears.
+        """
+        ...
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[_KT, _VT]]) -> list[DotWiz]:
+        """
+        Create a ``list`` of :class:`DotWiz` instances from an iterable of ``dict``
+        objects, such as the records in a JSON API response.
+        """
+        ...
+
+    @classmethod
+    def from_json(cls, s: str | bytes | bytearray,
+                  **kwargs: Any) -> DotWiz | list[DotWiz] | Any:
+        """
+        Create a :class:`DotWiz` from a JSON string, ``bytes`` or ``bytearray``
+        object, building each (nested) object directly during parsing.
+        """
+        ...
+
+    @classmethod
+    def from_json_file(cls, fp: SupportsRead[str | bytes],
+                       **kwargs: Any) -> DotWiz | list[DotWiz] | Any:
+        """
+        Create a :class:`DotWiz` from a file-like object containing a JSON
+        document, building each (nested) object directly during parsing.
+        """
+        ...
+
+    @classmethod
+    def specialize(cls,
+                   sample_or_keys: Mapping[_KT, _VT] | Iterable[_KT]) -> type[DotWiz]:
+        """
+        Return a :class:`DotWiz` subclass which is *specialized* for a given
+        shape, which is either a sample ``dict`` or an iterable of key names.
+
+        Values are stored in ``__slots__`` where possible, and the constructor
+        is generated with a step for each key, so instances are faster to
+        create and use less memory.
+        """
+        ...
+
     # noinspection PyDefaultArgument
     def __init__(self,
                  input_dict: MutableMapping[_KT, _VT] = {},
@@ -44,9 +172,38 @@ class DotWiz(dict):
     def __setattr__(self, item: str, value: _VT) -> None: ...
     def __setitem__(self, k: _KT, v: _VT) -> None: ...
 
-    def to_dict(self) -> dict[_KT, _VT]:
+    def get_path(self, path_: str | Sequence[_KT] | DotPath,
+                 default: _T = ...) -> _VT | _T:
+        """
+        Return the value at `path_` - a path string such as ``'a.b[0].c'``,
+        or a sequence of keys - in the :class:`DotWiz`. If the path is not
+        found, return `default` if it's passed in; otherwise, raise the
+        original error (such as a :exc:`KeyError`).
+        """
+        ...
+
+    def has_path(self, path_: str | Sequence[_KT] | DotPath) -> bool:
+        """
+        Return true if `path_` - a path string such as ``'a.b[0].c'``, or a
+        sequence of keys - is found in the :class:`DotWiz`.
+        """
+        ...
+
+    def set_path(self, path_: str | Sequence[_KT] | DotPath, value: _VT) -> None:
+        """
+        Set the value at `path_` - a path string such as ``'a.b[0].c'``, or
+        a sequence of keys - in the :class:`DotWiz` to `value`, creating any
+        objects which are missing along the path.
+        """
+        ...
+
+    def to_dict(self, preserve_refs: bool = False) -> dict[_KT, _VT]:
         """
         Recursively convert the :class:`DotWiz` instance back to a ``dict``.
+
+        If `preserve_refs` is true, a nested object which appears in more
+        than one place is converted only once, and the result is shared;
+        this is required for objects with circular references.
         """
         ...
 
@@ -57,3 +214,80 @@ class DotWiz(dict):
                **kwargs: _T) -> None: ...
 
     def __repr__(self) -> str: ...
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Callable[..., DotWiz], tuple[type[DotWiz]], Any]: ...
+    def __getstate__(self) -> Any: ...
+    def __setstate__(self, state: Any) -> None: ...
+
+    def __copy__(self) -> DotWiz: ...
+    def __deepcopy__(self, memo: dict[int, Any]) -> DotWiz: ...
+
+
+__set_dict: Callable[[DotWiz, dict], None] = ...
+__LAZY_CLASS_ATTRS: frozenset[str] = ...
+
+
+# noinspection PyDefaultArgument
+def __upsert_into_lazy_dot_wiz__(self: LazyDotWiz,
+                                 input_dict: MutableMapping[_KT, _VT] = {},
+                                 *, __set: _SetItem = dict.__setitem__,
+                                 **kwargs: _T) -> None: ...
+
+def __setitem_lazy_impl__(self: LazyDotWiz,
+                          key: _KT,
+                          value: _VT) -> None: ...
+
+def __resolve_lazy_value__(self: LazyDotWiz,
+                           key: _KT,
+                           *, __get: Callable[[dict, _KT], _VT] = dict.__getitem__,
+                           __set: _SetItem = dict.__setitem__) -> _VT: ...
+
+def __resolve_all_lazy__(self: LazyDotWiz,
+                         *, __keys: Callable[[dict], KeysView[_KT]] = dict.keys) -> None: ...
+
+def __getstate_lazy_impl__(self: LazyDotWiz,
+                           *, __items: Callable[[dict], ItemsView[_KT, _VT]] = dict.items) -> tuple[dict[_KT, _VT], tuple[_KT, ...]]: ...
+
+def __setstate_lazy_impl__(self: LazyDotWiz,
+                           state: tuple[dict[_KT, _VT], tuple[_KT, ...]],
+                           *, __update: _Update = dict.update) -> None: ...
+
+
+class LazyDotWiz(DotWiz):
+
+    def get(self, key: _KT, default: _T | None = None) -> _VT | _T | None: ...
+
+    def items(self) -> ItemsView[_KT, _VT]: ...
+
+    def values(self) -> ValuesView[_VT]: ...
+
+    def __iter__(self) -> Iterator[_KT]: ...
+
+    def pop(self, key: _KT, default: _VT | _T = ...) -> _VT | _T: ...
+
+    def popitem(self) -> tuple[_KT, _VT]: ...
+
+    def setdefault(self, key: _KT, default: _VT | None = None) -> _VT | None: ...
+
+
+# noinspection PyDefaultArgument
+def __upsert_into_dot_wiz_lite__(self: DotWizLite,
+                                 input_dict: MutableMapping[_KT, _VT] = {},
+                                 *, __set: _SetItem = dict.__setitem__,
+                                 **kwargs: _T) -> None: ...
+
+def __setitem_lite_impl__(self: DotWizLite,
+                          key: _KT,
+                          value: _VT,
+                          *, __set: _SetItem = dict.__setitem__) -> None: ...
+
+
+def __object_hook_lite__(cls: type[DotWizLite], o: dict[_KT, _VT]) -> DotWizLite: ...
+
+def __setstate_lite_impl__(self: DotWizLite,
+                           state: dict[_KT, _VT],
+                           *, __update: _Update = dict.update) -> None: ...
+
+
+class DotWizLite(DotWiz):
+    ...
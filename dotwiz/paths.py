@@ -0,0 +1,564 @@
+"""Dotted-path accessors, such as ``'order.items[3].sku'``."""
+import re
+from keyword import iskeyword
+
+from .common import KeyCache, _MISSING, __getitem_from_dict__
+
+
+# The maximum number of paths to cache a compiled `DotPath` for.
+__MAX_PATHS = 1024
+
+# A (bounded) cache of path string, or tuple of keys, to its compiled
+# `DotPath`; the oldest paths are evicted once it's full.
+__PATHS = KeyCache(__MAX_PATHS)
+
+# Look up a cached path, without updating the statistics of the cache; this
+# is used on the hot path, as it's a lot faster than `KeyCache.get()`, and
+# is the same for the 'fifo' policy.
+__PATHS_GET = __PATHS._data.get
+
+# Matches one token in a path string: a key name, an index such as `[3]`,
+# a quoted key such as `["a.b"]`, or a dot.
+__TOKEN = re.compile(r"""
+    (?P<name>[^.\[\]]+)
+  | \[(?P<index>-?\d+)\]
+  | \[(?P<quote>['"])(?P<key>.*?)(?P=quote)\]
+  | (?P<dot>\.)
+""", re.VERBOSE)
+
+# Source code for the `get()` function of a `DotPath`.
+#
+# If `o` is a `DotWiz`, which reads keys from the instance `__dict__`, then
+# first try plain attribute access, which is about as fast as it gets; if
+# that fails, for example because a value along the path isn't a `DotWiz`,
+# then fall back to item access.
+__GET_PATH = """\
+def get(o, default=__missing):
+    try:
+{attr_access}        return o{item_chain}
+    except (LookupError, TypeError):
+        if default is __missing:
+            raise
+        return default
+"""
+
+__GET_PATH_ATTR_ACCESS = """\
+        root_type = type(o)
+        use_attrs = __attr_types_get(root_type)
+        if use_attrs is None:
+            use_attrs = __check_attr_type(root_type)
+        if use_attrs:
+            try:
+{attr_lines}
+            except (AttributeError, LookupError, TypeError):
+                pass
+"""
+
+# Source code to check that a node (other than the root) along a path is
+# also a `DotWiz`, before a key is looked up as an attribute on it; for
+# a leaf value such as a `str`, `'a.upper'` would return a method instead.
+# The `TypeError` falls back to item access. A node of the same type as
+# the root, which is the most common case, is checked first.
+__CHECK_ATTR_NODE = (
+    'if type({var}) is not root_type '
+    'and not (__attr_types_get(type({var})) '
+    'or __check_attr_type(type({var}))): raise TypeError'
+)
+
+# Key names which are never looked up as attributes, since a `dict`, `list`
+# or `tuple` found along the path would return a method instead; the names
+# of `DotWiz` classes, such as `to_dict`, are added by each module with
+# `__reserve_attr_names__()`.
+__RESERVED_NAMES = set(dir(dict)) | set(dir(list)) | set(dir(tuple))
+
+# A mapping of type to a bool, which is true if the type supports looking up
+# (any) key as an attribute.
+__ATTR_TYPES = {}
+
+
+def __check_attr_type__(t):
+    """
+    Return true if a key in an object of type `t` can be looked up as an
+    attribute, which is the case for a :class:`DotWiz` unless a default
+    for missing keys is set.
+    """
+    use_attrs = __ATTR_TYPES[t] = (
+        getattr(t, '__getitem__', None) is __getitem_from_dict__
+        and not hasattr(t, '__getattr__')
+    )
+    return use_attrs
+
+
+def __reserve_attr_names__(*classes):
+    """
+    Add the attribute names of `classes`, such as ``to_dict``, to the key
+    names which are never looked up as attributes, and clear the cached
+    paths (which might look one up) if there are any new names.
+    """
+    names = {name for cls in classes for name in dir(cls)}
+
+    if not names <= __RESERVED_NAMES:
+        __RESERVED_NAMES.update(names)
+        __PATHS.clear()
+
+
+def __clear_attr_types__():
+    """
+    Clear the types cached by :func:`__check_attr_type__`; this needs to be
+    called when a :meth:`__getattr__` is added to a class.
+    """
+    __ATTR_TYPES.clear()
+
+
+def __is_attr_name__(key):
+    """Return true if `key` can be looked up as an attribute in a path."""
+    return (type(key) is str
+            and key.isidentifier()
+            and not iskeyword(key)
+            and not key.startswith('__')
+            and key not in __RESERVED_NAMES)
+
+
+def path(spec):
+    """
+    Return a :class:`DotPath` for `spec`, which is either a path string
+    such as ``'order.items[3].sku'``, or a sequence of keys such as
+    ``('order', 'items', 3, 'sku')``.
+
+    A path is only parsed and compiled once, and the result is cached, so
+    it's fine to call this for each lookup.
+
+    Example::
+
+        >>> from dotwiz import DotWiz, path
+        >>> sku = path('order.items[1].sku')
+        >>> sku.get(DotWiz(order={'items': [{'sku': 'A1'}, {'sku': 'B2'}]}))
+        'B2'
+
+    """
+    if type(spec) is str:
+        return __PATHS_GET(spec) or __path_from_str__(spec)
+
+    if type(spec) is DotPath:
+        return spec
+
+    keys = tuple(spec)
+
+    try:
+        p = __PATHS_GET(keys)
+    except TypeError:  # a key is not hashable
+        return DotPath(keys, spec)
+
+    return p or __PATHS.set(keys, DotPath(keys, keys))
+
+
+def __path_from_str__(s):
+    """Return a new :class:`DotPath` for a path string `s`, and cache it."""
+    return __PATHS.set(s, DotPath(__parse_path__(s), s))
+
+
+def __parse_path__(s):
+    """
+    Parse a path string `s` into a tuple of keys.
+
+    Key names are separated by a dot, and an index (or a key which is
+    not a valid name, such as one with a dot) can be given in square
+    brackets, as in ``'a.b[0]["c.d"]'``.
+
+    """
+    keys = []
+    # the previous token: `None` at the start, then either `dot` or `key`
+    prev = None
+    pos = 0
+    n = len(s)
+
+    while pos < n:
+        m = __TOKEN.match(s, pos)
+
+        if m is None:
+            raise ValueError(f'Invalid path {s!r} at position {pos}')
+
+        name, index, _, key, dot = m.groups()
+
+        if dot is not None:
+            if prev != 'key':
+                raise ValueError(f'Invalid path {s!r} at position {pos}')
+            prev = 'dot'
+
+        elif name is not None:
+            if prev == 'key':
+                raise ValueError(f'Invalid path {s!r} at position {pos}')
+            keys.append(name)
+            prev = 'key'
+
+        else:
+            if prev == 'dot':
+                raise ValueError(f'Invalid path {s!r} at position {pos}')
+            keys.append(int(index) if index is not None else key)
+            prev = 'key'
+
+        pos = m.end()
+
+    if prev != 'key':
+        raise ValueError(f'Invalid path {s!r}')
+
+    return tuple(keys)
+
+
+def __compile_get__(keys):
+    """
+    Compile a `get()` function which returns the value at the path of
+    `keys` in an object, or a default if the path is not found.
+    """
+    scope = {'__missing': _MISSING,
+             '__attr_types_get': __ATTR_TYPES.get,
+             '__check_attr_type': __check_attr_type__}
+
+    item_chain = []
+    attr_lines = ['o0 = o']
+    # true if any key is looked up as an attribute
+    use_attrs = False
+    # false if any key can't be looked up as an attribute
+    attrs_ok = True
+
+    for i, key in enumerate(keys):
+        # use a literal for the key where possible, as it's faster
+        if type(key) is str or type(key) is int:
+            key_name = repr(key)
+        else:
+            key_name = f'__key_{i}'
+            scope[key_name] = key
+
+        item_chain.append(f'[{key_name}]')
+
+        if type(key) is int:
+            # most likely an index into a `list`
+            attr_lines.append(f'o{i + 1} = o{i}[{key_name}]')
+        elif __is_attr_name__(key):
+            if i:
+                attr_lines.append(__CHECK_ATTR_NODE.format(var=f'o{i}'))
+            attr_lines.append(f'o{i + 1} = o{i}.{key}')
+            use_attrs = True
+        else:
+            attrs_ok = False
+
+    if use_attrs and attrs_ok:
+        attr_lines.append(f'return o{len(keys)}')
+        attr_access = __GET_PATH_ATTR_ACCESS.format(
+            attr_lines='\n'.join(' ' * 16 + line for line in attr_lines))
+    else:
+        attr_access = ''
+
+    exec(__GET_PATH.format(attr_access=attr_access,
+                           item_chain=''.join(item_chain)), scope)
+
+    return scope['get']
+
+
+class DotPath:
+    """
+    A compiled accessor for a path of (nested) keys in an object, such as
+    a :class:`DotWiz`, a :class:`DotWizPlus`, or a plain ``dict`` or
+    ``list``. Use :func:`path` to create one.
+
+    For a :class:`DotWizPlus`, the path uses the *original* key names.
+
+    :param keys: The keys along the path.
+    :param spec: The path string (or sequence of keys) used to create it.
+
+    """
+    __slots__ = ('keys', 'spec', 'get')
+
+    def __init__(self, keys, spec=None):
+        if not keys:
+            raise ValueError('A path must contain at least one key')
+
+        self.keys = keys
+        self.spec = keys if spec is None else spec
+
+        #: Return the value at the path in an object `o`. If the path is
+        #: not found, return `default` if it's passed in; otherwise, raise
+        #: the original error (such as a :exc:`KeyError`).
+        self.get = __compile_get__(keys)
+
+    def __repr__(self):
+        return f'path({self.spec!r})'
+
+    def __eq__(self, other):
+        if type(other) is not DotPath:
+            return NotImplemented
+        return self.keys == other.keys
+
+    def __hash__(self):
+        return hash(self.keys)
+
+    def has(self, o):
+        """Return true if the path is found in an object `o`."""
+        return self.get(o, _NOT_FOUND) is not _NOT_FOUND
+
+    def set(self, o, value):
+        """
+        Set the value at the path in an object `o` to `value`.
+
+        Any objects which are missing along the path are created as an
+        empty ``dict``, which a :class:`DotWiz` then converts as usual.
+        """
+        keys = self.keys
+
+        for key in keys[:-1]:
+            try:
+                o = o[key]
+            except KeyError:
+                o[key] = {}
+                o = o[key]
+
+        o[keys[-1]] = value
+
+
+def extractor(paths, default=_MISSING):
+    """
+    Return an :class:`Extractor` for `paths`, which reads the value at each
+    path in an object in a single pass, and returns the values in a tuple.
+
+    `paths` is a sequence of paths, where each one is a path string such
+    as ``'user.id'``, a sequence of keys, or a :class:`DotPath`; it can
+    also be a ``dict`` which maps each path to its own default value.
+
+    If a path is not found, then its default is used, or `default` if it
+    has none; if that's not passed in either, a :exc:`KeyError` is raised.
+
+    Example::
+
+        >>> from dotwiz import DotWiz, extractor
+        >>> get = extractor({'user.id': None, 'user.name': '', 'order.total': 0}).get
+        >>> get(DotWiz(user={'id': 1, 'name': 'Jon'}))
+        (1, 'Jon', 0)
+
+    """
+    if isinstance(paths, dict):
+        defaults = [default if d is _MISSING else d for d in paths.values()]
+    else:
+        defaults = [default] * len(paths)
+
+    return Extractor([path(spec) for spec in paths], defaults)
+
+
+# Source code for the `get()` function of an `Extractor`. The object is the
+# root node `n0`, and the value at each path is stored in a variable `r{i}`.
+#
+# First try to read every value with plain attribute (for a `DotWiz`) or
+# item access, which is the fastest; if that fails, for example because a
+# key is missing, then read each value in turn, so that a default can be
+# used for any path which is not found.
+__EXTRACT = """\
+def get(n0):
+{check_attrs}    try:
+{fast_access}
+        return ({results})
+    except (AttributeError, LookupError, TypeError):
+        pass
+{safe_access}
+    return ({results})
+"""
+
+__EXTRACT_CHECK_ATTRS = """\
+    root_type = type(n0)
+    use_attrs = __attr_types_get(root_type)
+    if use_attrs is None:
+        use_attrs = __check_attr_type(root_type)
+"""
+
+__EXTRACT_FAST_ACCESS = """\
+        if use_attrs:
+{attr_access}
+        else:
+{item_access}"""
+
+
+def __compile_extract__(dot_paths, defaults):
+    """
+    Compile a `get()` function which returns a tuple of the value at each
+    path in `dot_paths`, or its default if the path is not found.
+
+    The paths are arranged in a prefix tree, so that the value for a key
+    which is shared by more than one path is only looked up once.
+    """
+    scope = {'__missing': _MISSING,
+             '__attr_types_get': __ATTR_TYPES.get,
+             '__check_attr_type': __check_attr_type__}
+
+    # each node in the tree is a list of `[children, indices]`, where
+    # `indices` are the indices of the paths which end at the node.
+    root = [{}, []]
+
+    for i, dot_path in enumerate(dot_paths):
+        node = root
+        for key in dot_path.keys:
+            node = node[0].setdefault((type(key), key), [{}, []])
+        node[1].append(i)
+
+    def key_literal(key):
+        # use a literal for the key where possible, as it's faster
+        if type(key) is str or type(key) is int:
+            return repr(key)
+
+        key_name = f'__key_{len(scope)}'
+        scope[key_name] = key
+        return key_name
+
+    attr_lines = []
+    item_lines = []
+    safe_lines = []
+    # true if any key is looked up as an attribute
+    use_attrs = False
+    # the number of variables for nodes, where `n0` is the root
+    num_nodes = 1
+
+    def add_lines(node, var):
+        nonlocal use_attrs, num_nodes
+
+        if var != 'n0' and any(__is_attr_name__(key) for _, key in node[0]):
+            attr_lines.append(__CHECK_ATTR_NODE.format(var=var))
+
+        for (_, key), child in node[0].items():
+            child_var = f'n{num_nodes}'
+            num_nodes += 1
+
+            key_name = key_literal(key)
+            item_access = f'{child_var} = {var}[{key_name}]'
+
+            item_lines.append(item_access)
+
+            if __is_attr_name__(key):
+                attr_lines.append(f'{child_var} = {var}.{key}')
+                use_attrs = True
+            else:
+                attr_lines.append(item_access)
+
+            for i in child[1]:
+                attr_lines.append(f'r{i} = {child_var}')
+                item_lines.append(f'r{i} = {child_var}')
+
+            # note: if a key is not found, the variable for the node is set
+            # to `__missing`, and so is the variable for each node below it.
+            safe_lines.append(f'{child_var} = __missing')
+            safe_lines.append(f'if {var} is not __missing:')
+            safe_lines.append('    try:')
+            if type(key) is int:
+                # most likely an index into a `list`
+                safe_lines.append(f'        {item_access}')
+                safe_lines.append('    except (LookupError, TypeError):')
+            else:
+                # avoid raising an error for a missing key, which is slow
+                safe_lines.append(f'        {child_var} = {var}.get({key_name}, __missing)')
+                safe_lines.append('    except (AttributeError, TypeError):')
+            safe_lines.append('        pass')
+
+            for i in child[1]:
+                if defaults[i] is _MISSING:
+                    scope[f'__path_{i}'] = dot_paths[i].spec
+                    safe_lines.append(f'if {child_var} is __missing:')
+                    safe_lines.append(f'    raise KeyError(__path_{i})')
+                    safe_lines.append(f'r{i} = {child_var}')
+                else:
+                    scope[f'__default_{i}'] = defaults[i]
+                    safe_lines.append(f'r{i} = __default_{i} if {child_var} '
+                                      f'is __missing else {child_var}')
+
+            add_lines(child, child_var)
+
+    add_lines(root, 'n0')
+
+    def indent(lines, level):
+        pad = ' ' * level
+        return '\n'.join(pad + line for line in lines)
+
+    if use_attrs:
+        check_attrs = __EXTRACT_CHECK_ATTRS
+        fast_access = __EXTRACT_FAST_ACCESS.format(
+            attr_access=indent(attr_lines, 12),
+            item_access=indent(item_lines, 12))
+    else:
+        check_attrs = ''
+        fast_access = indent(item_lines, 8)
+
+    exec(__EXTRACT.format(
+        check_attrs=check_attrs,
+        fast_access=fast_access,
+        safe_access=indent(safe_lines, 4),
+        results=''.join(f'r{i}, ' for i in range(len(dot_paths))),
+    ), scope)
+
+    return scope['get']
+
+
+class Extractor:
+    """
+    A compiled accessor for the values at many paths in an object, such as
+    a :class:`DotWiz`, a :class:`DotWizPlus`, or a plain ``dict``. Use
+    :func:`extractor` to create one.
+
+    :param paths: The :class:`DotPath` for each value.
+    :param defaults: The default value for each path, or ``_MISSING`` if
+      there is none.
+
+    """
+    __slots__ = ('paths', 'defaults', 'get')
+
+    def __init__(self, paths, defaults):
+        if not paths:
+            raise ValueError('An extractor must contain at least one path')
+
+        self.paths = paths
+        self.defaults = defaults
+
+        #: Return a tuple of the value at each path in an object `o`.
+        self.get = __compile_extract__(paths, defaults)
+
+    def __repr__(self):
+        return f'extractor({[p.spec for p in self.paths]!r})'
+
+    def get_many(self, records):
+        """
+        Return a ``list`` with a tuple of the values at each path, for each
+        object in `records`.
+        """
+        return list(map(self.get, records))
+
+
+# A value which indicates that a path is not found.
+_NOT_FOUND = object()
+
+
+def __get_path__(self, path_, default=_MISSING, __get=__PATHS_GET):
+    """
+    Return the value at `path_` - a path string such as ``'a.b[0].c'``, or
+    a sequence of keys - in the object. If the path is not found, return
+    `default` if it's passed in; otherwise, raise the original error (such
+    as a :exc:`KeyError`).
+    """
+    # note: this is the same as `path(path_).get(...)`; it's inlined here
+    # for the common case, as it's faster to eliminate a function call.
+    if type(path_) is str:
+        p = __get(path_) or __path_from_str__(path_)
+    else:
+        p = path(path_)
+
+    return p.get(self, default)
+
+
+def __set_path__(self, path_, value):
+    """
+    Set the value at `path_` - a path string such as ``'a.b[0].c'``, or a
+    sequence of keys - in the object to `value`, creating any objects
+    which are missing along the path.
+    """
+    path(path_).set(self, value)
+
+
+def __has_path__(self, path_):
+    """
+    Return true if `path_` - a path string such as ``'a.b[0].c'``, or a
+    sequence of keys - is found in the object.
+    """
+    return path(path_).has(self)
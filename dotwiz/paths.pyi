@@ -0,0 +1,116 @@
+import re
+from typing import Any, Callable, Iterable, Mapping, Sequence, TypeVar
+
+from .common import KeyCache
+from .main import DotWiz
+from .plus import DotWizPlus
+
+_T = TypeVar('_T')
+_KT = TypeVar('_KT')
+_VT = TypeVar('_VT')
+
+_Key = str | int | Any
+_Container = dict | DotWiz | DotWizPlus | list | tuple
+_Spec = str | Sequence[_Key] | DotPath
+
+__MAX_PATHS: int = ...
+__PATHS: KeyCache = ...
+__PATHS_GET: Callable[[str | tuple[_Key, ...]], DotPath | None] = ...
+__TOKEN: re.Pattern = ...
+__GET_PATH: str = ...
+__GET_PATH_ATTR_ACCESS: str = ...
+__RESERVED_NAMES: set[str] = ...
+__ATTR_TYPES: dict[type, bool] = ...
+__EXTRACT: str = ...
+__EXTRACT_CHECK_ATTRS: str = ...
+__EXTRACT_FAST_ACCESS: str = ...
+_NOT_FOUND: object = ...
+
+
+def __check_attr_type__(t: type) -> bool: ...
+
+def __reserve_attr_names__(*classes: type) -> None: ...
+
+def __clear_attr_types__() -> None: ...
+
+def __is_attr_name__(key: _Key) -> bool: ...
+
+def path(spec: _Spec) -> DotPath: ...
+
+def __path_from_str__(s: str) -> DotPath: ...
+
+def __parse_path__(s: str) -> tuple[_Key, ...]: ...
+
+def __compile_get__(keys: tuple[_Key, ...]) -> Callable[..., Any]: ...
+
+
+class DotPath:
+
+    keys: tuple[_Key, ...]
+    spec: str | Sequence[_Key]
+
+    def __init__(self, keys: tuple[_Key, ...],
+                 spec: str | Sequence[_Key] | None = None) -> None: ...
+
+    def get(self, o: _Container, default: _T = ...) -> _VT | _T:
+        """
+        Return the value at the path in an object `o`. If the path is not
+        found, return `default` if it's passed in; otherwise, raise the
+        original error (such as a :exc:`KeyError`).
+        """
+        ...
+
+    def has(self, o: _Container) -> bool:
+        """Return true if the path is found in an object `o`."""
+        ...
+
+    def set(self, o: _Container, value: Any) -> None:
+        """
+        Set the value at the path in an object `o` to `value`.
+
+        Any objects which are missing along the path are created as an
+        empty ``dict``, which a :class:`DotWiz` then converts as usual.
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+
+    def __eq__(self, other: object) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+
+def extractor(paths: Sequence[_Spec] | Mapping[_Spec, Any],
+              default: Any = ...) -> Extractor: ...
+
+def __compile_extract__(dot_paths: list[DotPath],
+                        defaults: list[Any]) -> Callable[[_Container], tuple]: ...
+
+
+class Extractor:
+
+    paths: list[DotPath]
+    defaults: list[Any]
+
+    def __init__(self, paths: list[DotPath], defaults: list[Any]) -> None: ...
+
+    def get(self, o: _Container) -> tuple:
+        """Return a tuple of the value at each path in an object `o`."""
+        ...
+
+    def get_many(self, records: Iterable[_Container]) -> list[tuple]:
+        """
+        Return a ``list`` with a tuple of the values at each path, for each
+        object in `records`.
+        """
+        ...
+
+    def __repr__(self) -> str: ...
+
+
+def __get_path__(self: _Container, path_: _Spec, default: _T = ...,
+                 *, __get: Callable[[str], DotPath | None] = ...) -> Any: ...
+
+def __set_path__(self: _Container, path_: _Spec, value: Any) -> None: ...
+
+def __has_path__(self: _Container, path_: _Spec) -> bool: ...
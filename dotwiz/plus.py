@@ -1,20 +1,205 @@
 """Dot Wiz Plus module."""
 import itertools
 import keyword
+import operator
+from threading import Lock
 
 from pyheck import snake
 
 from .common import (
+    KeyCache,
+    _MISSING,
     __add_repr__,
     __convert_to_attr_dict__,
     __convert_to_dict__,
+    __copy_with_state__,
+    __deepcopy_values__,
+    __deepcopy_with_state__,
+    __from_each_record__,
+    __from_graph__,
+    __from_json__,
+    __from_json_file__,
+    __guard_reprs__,
+    __iter_lazy_impl__,
+    __pop_lazy_impl__,
+    __popitem_lazy_impl__,
+    __reduce_ex_impl__,
     __resolve_value__,
+    __setdefault_lazy_impl__,
+    __UNGUARDED_REPRS,
 )
+from .paths import (__get_path__, __has_path__, __set_path__,
+                    __reserve_attr_names__)
 
 
-# A running cache of special-cased or non-lowercase keys that we've
-# transformed before.
-__SPECIAL_KEYS = {}
+# The registered key normalizers, by name: each is a tuple of a function
+# which transforms a special-cased key into a valid identifier, and its own
+# cache of the keys it has transformed before.
+__NORMALIZERS = {}
+
+# Serializes changes made by `register_key_normalizer()` and
+# `set_key_normalizer()`
+__NORMALIZER_LOCK = Lock()
+
+# The name of the current key normalizer.
+__NORMALIZER_NAME = 'snake'
+
+# A (bounded) running cache of special-cased or non-lowercase keys that
+# we've transformed before, with the current key normalizer.
+__SPECIAL_KEYS = KeyCache()
+
+# The maximum number of distinct sets of key names to keep translations
+# for, in a call to `DotWizPlus.from_records()`.
+__MAX_KEY_SETS = 1024
+
+
+def configure_key_cache(maxsize=4096, policy='fifo', normalizer=None):
+    """
+    Set the maximum size and eviction policy of the cache used by
+    :class:`DotWizPlus` for special-cased keys that have been transformed
+    (into *snake case*) before.
+
+    Example::
+
+        >>> from dotwiz import configure_key_cache
+        >>> configure_key_cache(10_000, policy='lru')
+
+    :param maxsize: The maximum number of keys to cache. If ``None``, the
+      cache can grow without bound; if ``0``, nothing is cached.
+    :param policy: The eviction policy once the cache is full: either
+      ``'lru'`` (least recently used) or ``'fifo'`` (first in, first out).
+    :param normalizer: The name of the key normalizer whose cache to
+      configure; defaults to the current one.
+
+    """
+    __key_cache_for__(normalizer).configure(maxsize, policy)
+
+
+def key_cache_info(normalizer=None):
+    """
+    Return the statistics - hits, misses, evictions, maximum and current
+    size - of the cache used by :class:`DotWizPlus` for special-cased keys,
+    for the `normalizer` name (defaults to the current one).
+
+    Example::
+
+        >>> from dotwiz import DotWizPlus, clear_key_cache, key_cache_info
+        >>> clear_key_cache()
+        >>> _ = DotWizPlus({'someKey': 1}), DotWizPlus({'someKey': 2})
+        >>> key_cache_info()
+        CacheInfo(hits=1, misses=1, evictions=0, maxsize=4096, currsize=1)
+
+    """
+    return __key_cache_for__(normalizer).info()
+
+
+def clear_key_cache(normalizer=None):
+    """
+    Clear the cache used by :class:`DotWizPlus` for special-cased keys,
+    and reset its statistics, for the `normalizer` name (defaults to the
+    current one).
+    """
+    __key_cache_for__(normalizer).clear()
+
+
+def __key_cache_for__(normalizer):
+    """
+    Return the cache for the key normalizer named `normalizer`, or for the
+    current one if it's ``None``.
+    """
+    if normalizer is None:
+        return __SPECIAL_KEYS
+
+    return __normalizer_for__(normalizer)[1]
+
+
+def __normalizer_for__(name):
+    """Return the function and cache of the key normalizer named `name`"""
+    try:
+        return __NORMALIZERS[name]
+    except KeyError:
+        raise ValueError(f'Unknown key normalizer {name!r} - expected one '
+                         f'of: {", ".join(__NORMALIZERS)}') from None
+
+
+def register_key_normalizer(name, normalizer, overwrite=False,
+                            maxsize=4096, policy='fifo'):
+    """
+    Register a key normalizer, which :class:`DotWizPlus` can use (once
+    it's selected with :func:`set_key_normalizer`) to transform keys which
+    are not already *lower-cased* and valid identifiers, such as
+    ``someKey`` or ``zip-code``, into the name used for attribute access.
+
+    The built-in ``'snake'`` normalizer (the default) transforms a key into
+    *snake case*. Each normalizer has its own cache of the keys it has
+    transformed before, so `normalizer` is only called once for each key.
+
+    Example::
+
+        >>> import re
+        >>> from dotwiz import DotWizPlus, register_key_normalizer, set_key_normalizer
+        >>> register_key_normalizer('identifier',
+        ...                         lambda key: re.sub('[^0-9a-zA-Z_]|^(?=[0-9])', '_', key))
+        >>> previous = set_key_normalizer('identifier')
+        >>> DotWizPlus({'userName': 1, 'zip-code': 2}).to_attr_dict()
+        {'userName': 1, 'zip_code': 2}
+        >>> _ = set_key_normalizer(previous)
+
+    :param name: The name to register the key normalizer under.
+    :param normalizer: A function which takes a key (a ``str``), and returns
+      a valid identifier in python. Note that a key which is a reserved
+      *keyword*, such as ``for``, gets a trailing underscore instead.
+    :param overwrite: True to replace a key normalizer with the same name,
+      if one is already registered; defaults to False.
+    :param maxsize: The maximum number of keys to cache for the normalizer.
+    :param policy: The eviction policy of the cache.
+
+    """
+    global __NORMALIZE, __SPECIAL_KEYS
+
+    if not callable(normalizer):
+        raise TypeError(f'normalizer must be callable, got: {normalizer!r}')
+
+    cache = KeyCache(maxsize, policy)
+
+    with __NORMALIZER_LOCK:
+        if name in __NORMALIZERS and not overwrite:
+            raise ValueError(f'A key normalizer named {name!r} is already '
+                             f'registered - pass `overwrite=True` to '
+                             f'replace it.')
+
+        __NORMALIZERS[name] = normalizer, cache
+
+        if name == __NORMALIZER_NAME:
+            __NORMALIZE, __SPECIAL_KEYS = normalizer, cache
+
+
+def set_key_normalizer(name):
+    """
+    Set the key normalizer used by :class:`DotWizPlus` to the one registered
+    as `name` (for example, with :func:`register_key_normalizer`), and
+    return the name of the previous one.
+
+    This applies to objects created after the call; objects which already
+    exist keep their attribute names. It's best called once at startup,
+    before objects are created from other threads.
+
+    """
+    global __NORMALIZER_NAME, __NORMALIZE, __SPECIAL_KEYS
+
+    with __NORMALIZER_LOCK:
+        normalizer, cache = __normalizer_for__(name)
+        previous = __NORMALIZER_NAME
+
+        __NORMALIZER_NAME = name
+        __NORMALIZE, __SPECIAL_KEYS = normalizer, cache
+
+    return previous
+
+
+def get_key_normalizer():
+    """Return the name of the key normalizer used by :class:`DotWizPlus`."""
+    return __NORMALIZER_NAME
 
 
 def make_dot_wiz_plus(*args, **kwargs):
@@ -46,6 +231,8 @@ def __store_in_object__(self, __self_dict, key, value,
     the original key-value is stored in the underlying ``dict`` store, via
     :meth:`dict.__setitem__`.
 
+    Returns the key name used for attribute access.
+
     """
     orig_key = key
     # in case of other types, like `int`
@@ -65,33 +252,63 @@ def __store_in_object__(self, __self_dict, key, value,
     #   examples: `ThisIsATest` | `hey, world!` | `hi-there` | `3D`
     elif not key == lower_key or not key.isidentifier():
 
-        if key in __SPECIAL_KEYS:
-            key = __SPECIAL_KEYS[key]
+        cached_key = __SPECIAL_KEYS.get(key)
+
+        if cached_key is None:
+            # transform key (to `snake case`, by default) and cache the
+            # result.
+            key = __SPECIAL_KEYS.set(key, __NORMALIZE(key))
         else:
-            # transform key to `snake case` and cache the result.
-            lower_snake = snake(key)
+            key = cached_key
 
-            # I've noticed for keys like `a.b.c` or `a'b'c`, the result isn't
-            # `a_b_c` as we'd want it to be. So for now, do the conversion
-            # ourselves.
-            #   See also: https://github.com/kevinheavey/pyheck/issues/10
-            for ch in ('.', '\''):
-                if ch in lower_snake:
-                    lower_snake = lower_snake.replace(ch, '_').replace('__', '_')
+    # note: this logic is the same as `DotWizPlus.__setitem__()`
+    __set(self, orig_key, value)
+    __self_dict[key] = value
 
-            # note: this hurts performance a little, but in any case we need
-            # to check for words with a leading digit such as `123test` -
-            # since these are not valid identifiers in python, unfortunately.
-            ch = lower_snake[0]
+    return key
 
-            if ch.isdigit():  # the key has a leading digit, which is invalid.
-                lower_snake = f'_{ch}{lower_snake[1:]}'
 
-            __SPECIAL_KEYS[key] = key = lower_snake
+def __to_snake_case__(key):
+    """
+    Transform a (special-cased) `key` into a lowercase, *snake case* key
+    name that is a valid identifier in python.
+    """
+    # fast path: an ASCII key which is already lowercase, where the words
+    # are separated by a single `-`, space, `.` or `'`, such as `zip-code`;
+    # this gives the same result as `snake()` and the fix-ups below.
+    if key.islower() and key.isascii():
+        s = key.replace('-', '_').replace(' ', '_') \
+            .replace('.', '_').replace('\'', '_')
 
-    # note: this logic is the same as `DotWizPlus.__setitem__()`
-    __set(self, orig_key, value)
-    __self_dict[key] = value
+        if s.isidentifier() and '__' not in s \
+                and s[0] != '_' and s[-1] != '_':
+            return s
+
+    lower_snake = snake(key)
+
+    # I've noticed for keys like `a.b.c` or `a'b'c`, the result isn't
+    # `a_b_c` as we'd want it to be. So for now, do the conversion
+    # ourselves.
+    #   See also: https://github.com/kevinheavey/pyheck/issues/10
+    for ch in ('.', '\''):
+        if ch in lower_snake:
+            lower_snake = lower_snake.replace(ch, '_').replace('__', '_')
+
+    # note: this hurts performance a little, but in any case we need
+    # to check for words with a leading digit such as `123test` -
+    # since these are not valid identifiers in python, unfortunately.
+    ch = lower_snake[0]
+
+    if ch.isdigit():  # the key has a leading digit, which is invalid.
+        lower_snake = f'_{ch}{lower_snake[1:]}'
+
+    return lower_snake
+
+
+# The current key normalizer.
+__NORMALIZE = __to_snake_case__
+
+__NORMALIZERS['snake'] = __to_snake_case__, __SPECIAL_KEYS
 
 
 # noinspection PyDefaultArgument
@@ -127,12 +344,212 @@ def __upsert_into_dot_wiz_plus__(self, input_dict={}, **kwargs):
         __store_in_object__(self, __dict, key, value)
 
 
+def __object_hook__(cls, o):
+    """
+    Create a :class:`DotWizPlus` from a ``dict`` object `o` which is decoded
+    from JSON, and which has its nested values already converted.
+    """
+    self = cls.__new__(cls)
+    __dict = self.__dict__
+
+    for key in o:
+        __store_in_object__(self, __dict, key, o[key])
+
+    return self
+
+
+def __from_record__(cls, record, translations,
+                    __new=dict.__new__,
+                    __update=dict.update,
+                    __set=dict.__setitem__):
+    """
+    Create a :class:`DotWizPlus` from a ``dict`` object `record`.
+
+    `translations` is a mapping of each set of (original) key names seen
+    so far, to the key names used for attribute access; once a set of key
+    names has been seen, ``__store_in_object__`` doesn't need to be called
+    for each key again.
+
+    If two keys map to the same attribute name, such as ``someKey`` and
+    ``some_key``, the translation is ``False``, and each record with those
+    key names is created with ``__store_in_object__``, so that the last
+    key wins as it does for :class:`DotWizPlus`.
+    """
+    self = __new(cls)
+    keys = tuple(record)
+
+    attr_keys = translations.get(keys, _MISSING)
+
+    if attr_keys is _MISSING or attr_keys is False:
+        __dict = self.__dict__
+
+        new_attr_keys = tuple([
+            __store_in_object__(self, __dict, key,
+                                __resolve_record_value__(cls, record[key], translations))
+            for key in keys])
+
+        if attr_keys is _MISSING and len(translations) < __MAX_KEY_SETS:
+            if new_attr_keys == keys:
+                # `None` indicates that the key names are the same
+                translations[keys] = None
+            elif len(set(new_attr_keys)) < len(new_attr_keys):
+                translations[keys] = False
+            else:
+                translations[keys] = new_attr_keys
+
+        return self
+
+    __update(self, record)
+
+    if attr_keys is None:
+        attr_keys = keys
+        __dict = dict(record)
+    else:
+        __dict = dict(zip(attr_keys, record.values()))
+
+    for key, attr_key in zip(keys, attr_keys):
+        value = record[key]
+        t = type(value)
+
+        if t is dict:
+            value = __from_record__(cls, value, translations)
+        elif t is list:
+            value = [__resolve_record_value__(cls, e, translations) for e in value]
+        else:
+            continue
+
+        __set(self, key, value)
+        __dict[attr_key] = value
+
+    __set_dict(self, __dict)
+
+    return self
+
+
+def __resolve_record_value__(cls, value, translations):
+    """
+    Resolve `value`, which can be a complex type like `dict` or `list`, for
+    use in a :class:`DotWizPlus` created with :func:`__from_record__`.
+    """
+    t = type(value)
+
+    if t is dict:
+        return __from_record__(cls, value, translations)
+
+    if t is list:
+        return [__resolve_record_value__(cls, e, translations) for e in value]
+
+    return value
+
+
+def __from_records__(cls, records):
+    """
+    Create a ``list`` of :class:`DotWizPlus` instances from an iterable of
+    ``dict`` objects, such as the records in a JSON API response.
+
+    The key names used for attribute access are only worked out once for
+    each distinct set of key names, and then reused for the other records.
+    """
+    translations = {}
+
+    return [__from_record__(cls, record, translations) for record in records]
+
+
+def __from_graph_impl__(cls, o):
+    """
+    Create a :class:`DotWizPlus` from a ``dict`` object `o`, which can contain
+    shared or circular references to nested ``dict`` and ``list`` objects.
+    """
+    return __from_graph__(o, cls, __store_in_object__)
+
+
 def __setitem_impl__(self, key, value):
     """Implementation of `DotWizPlus.__setitem__` to preserve dot access"""
     value = __resolve_value__(value, DotWizPlus)
     __store_in_object__(self, self.__dict__, key, value)
 
 
+def __getstate_impl__(self, __is=operator.is_):
+    """
+    Return the state of a :class:`DotWizPlus` to pickle, which is a copy of
+    the ``dict`` storage, and the attribute name for each key.
+
+    The attribute names are ``None`` if they're the same as the keys, or
+    else a ``tuple`` in the same order as the keys; only if keys map to the
+    same attribute name is a copy of the instance :attr:`__dict__` needed.
+    """
+    storage = dict(self)
+    __dict = self.__dict__
+
+    if __dict.keys() == storage.keys():
+        attrs = None
+    elif len(__dict) == len(storage) and all(
+            map(__is, __dict.values(), storage.values())):
+        attrs = tuple(__dict)
+    else:
+        attrs = dict(__dict)
+
+    return storage, attrs
+
+
+def __setstate_impl__(self, state, __update=dict.update):
+    """
+    Restore a :class:`DotWizPlus` from its pickled `state`, without
+    converting each key to an attribute name again.
+
+    A pickle from an older version has the instance :attr:`__dict__` as
+    the `state`; the ``dict`` storage is then already restored.
+    """
+    if __UNGUARDED_REPRS:
+        __guard_reprs__()
+
+    if type(state) is dict:
+        __set_dict(self, state)
+        return
+
+    storage, attrs = state
+
+    __update(self, storage)
+
+    if attrs is None:
+        __set_dict(self, storage)
+    elif type(attrs) is tuple:
+        __set_dict(self, dict(zip(attrs, storage.values())))
+    else:
+        __set_dict(self, attrs)
+
+
+def __copy_impl__(self, __new=dict.__new__, __update=dict.update):
+    """
+    Return a shallow copy of a :class:`DotWizPlus`, for :func:`copy.copy`;
+    nested values are shared with the original, and the attribute names
+    are reused as is.
+    """
+    new = __new(type(self))
+    __update(new, self)
+    __set_dict(new, self.__dict__.copy())
+    return new
+
+
+def __deepcopy_impl__(self, memo, __new=dict.__new__, __update=dict.update):
+    """
+    Return a deep copy of a :class:`DotWizPlus`, for :func:`copy.deepcopy`;
+    the attribute names are reused, rather than converted from each key.
+    """
+    if __UNGUARDED_REPRS:
+        __guard_reprs__()
+
+    new = __new(type(self))
+    memo[id(self)] = new
+
+    __update(new, __deepcopy_values__(dict(self), memo))
+    # each value is looked up in `memo`, so it's the same (copied) object
+    # as in the `dict` storage.
+    __set_dict(new, __deepcopy_values__(self.__dict__.copy(), memo))
+
+    return new
+
+
 class DotWizPlus(dict, metaclass=__add_repr__,
                  print_char='✪',
                  use_attr_dict=True):
@@ -199,6 +616,28 @@ class DotWizPlus(dict, metaclass=__add_repr__,
     to_dict.__doc__ = 'Recursively convert the :class:`DotWizPlus` instance ' \
                       'back to a ``dict``.'
 
+    get_path = __get_path__
+    has_path = __has_path__
+    set_path = __set_path__
+
+    from_graph = classmethod(__from_graph_impl__)
+    from_records = classmethod(__from_records__)
+
+    __object_hook__ = classmethod(__object_hook__)
+
+    from_json = classmethod(__from_json__)
+    from_json_file = classmethod(__from_json_file__)
+
+    __reduce_ex__ = __reduce_ex_impl__
+    __getstate__ = __getstate_impl__
+    __setstate__ = __setstate_impl__
+
+    __copy__ = __copy_impl__
+    __deepcopy__ = __deepcopy_impl__
+
+
+# Setter for the instance `__dict__` of a `DotWizPlus`
+__set_dict = DotWizPlus.__dict__['__dict__'].__set__
 
 # A list of the public-facing methods in `DotWizPlus`
 __PUB_METHODS = (m for m in dir(DotWizPlus) if not m.startswith('_')
@@ -212,3 +651,294 @@ __LOWER_KWLIST = (kw for kw in keyword.kwlist if kw.islower())
 
 # Callable used to check if any key names are reserved keywords.
 __IS_KEYWORD = frozenset(itertools.chain(__LOWER_KWLIST, __PUB_METHODS)).__contains__
+
+
+# noinspection PyDefaultArgument
+def __upsert_into_lazy_dot_wiz_plus__(self, input_dict={}, **kwargs):
+    """
+    Helper method to generate / update a :class:`LazyDotWizPlus` (dot-access
+    dict) from a Python ``dict`` object, and optional *keyword arguments*.
+
+    Nested ``dict`` and ``list`` values are stored as-is, and are only
+    converted when first accessed.
+
+    """
+    __dict = self.__dict__
+    __pending = __get_pending__(self)
+    # note: both mappings are always set (or cleared) together
+    __pending_keys = None if __pending is None else __get_pending_keys__(self)
+
+    if kwargs:
+        # avoids the potential pitfall of a "mutable default argument" -
+        # only update or modify `input_dict` if the param is passed in.
+        if input_dict:
+            input_dict.update(kwargs)
+        else:
+            input_dict = kwargs
+
+    for key in input_dict:
+        value = input_dict[key]
+        t = type(value)
+
+        if t is dict or t is list:
+            if __pending is None:
+                __pending = {}
+                __pending_keys = {}
+                __set_pending(self, __pending)
+                __set_pending_keys(self, __pending_keys)
+
+            # remove the attribute from the instance `__dict__`, so that
+            # the value is converted on first access.
+            attr_key = __store_in_object__(self, __dict, key, value)
+            del __dict[attr_key]
+            __pending[key] = attr_key
+            __pending_keys[attr_key] = key
+
+        else:
+            __store_in_object__(self, __dict, key, value)
+
+            if __pending:
+                attr_key = __pending.pop(key, None)
+                if attr_key is not None:
+                    __pending_keys.pop(attr_key, None)
+
+
+def __setitem_lazy_impl__(self, key, value):
+    """Implementation of `LazyDotWizPlus.__setitem__` to preserve dot access"""
+    __upsert_into_lazy_dot_wiz_plus__(self, {key: value})
+
+
+def __delitem_lazy_impl__(self, key, __delete=dict.__delitem__):
+    """
+    Implementation of `LazyDotWizPlus.__delitem__`, which also removes a
+    value which isn't converted yet from the pending values.
+    """
+    __delete(self, key)
+
+    __pending = __get_pending__(self)
+
+    if __pending:
+        attr_key = __pending.pop(key, None)
+        if attr_key is not None:
+            __get_pending_keys__(self).pop(attr_key, None)
+
+
+def __clear_lazy_impl__(self, __clear=dict.clear):
+    """Implementation of `LazyDotWizPlus.clear`"""
+    __clear(self)
+
+    __set_pending(self, None)
+    __set_pending_keys(self, None)
+
+
+def __resolve_lazy_value__(self, __pending, key, attr_key,
+                           __get=dict.__getitem__,
+                           __set=dict.__setitem__):
+    """
+    Convert the (nested) value for `key` in a :class:`LazyDotWizPlus`, and
+    cache the result in place.
+    """
+    value = __resolve_value__(__get(self, key), LazyDotWizPlus)
+
+    __set(self, key, value)
+    self.__dict__[attr_key] = value
+    del __pending[key]
+    __get_pending_keys__(self).pop(attr_key, None)
+
+    return value
+
+
+def __resolve_all_lazy__(self, __items=dict.items,
+                         __contains=dict.__contains__):
+    """
+    Convert any (top-level) values that haven't been accessed yet, and
+    restore the order of attributes to match the order of keys.
+    """
+    __pending = __get_pending__(self)
+
+    if __pending is None:
+        return
+
+    for key, attr_key in list(__pending.items()):
+        # skip a key which is removed from the `dict` storage directly
+        if __contains(self, key):
+            __resolve_lazy_value__(self, __pending, key, attr_key)
+
+    # values that are converted on access are added at the *end* of the
+    # instance `__dict__`, so re-add all the attributes in the same order
+    # as they appear in the `dict`.
+    __dict = self.__dict__
+    __dict.clear()
+
+    for key, value in list(__items(self)):
+        __store_in_object__(self, __dict, key, value)
+
+    __set_pending(self, None)
+    __set_pending_keys(self, None)
+
+
+def __getstate_lazy_impl__(self, __items=dict.items):
+    """
+    Return the state of a :class:`LazyDotWizPlus` to pickle: a copy of the
+    ``dict`` storage, of the instance :attr:`__dict__`, and of the mapping
+    of key to attribute name for values which aren't converted yet.
+    """
+    __pending = __get_pending__(self)
+
+    # note: `dict(self)` would convert each value, via `__getitem__()`
+    return (dict(__items(self)), dict(self.__dict__),
+            dict(__pending) if __pending else None)
+
+
+def __setstate_lazy_impl__(self, state, __update=dict.update):
+    """Restore a :class:`LazyDotWizPlus` from its pickled `state`."""
+    if __UNGUARDED_REPRS:
+        __guard_reprs__()
+
+    storage, attrs, pending = state
+
+    __update(self, storage)
+    __set_dict(self, attrs)
+
+    if pending:
+        __set_pending(self, pending)
+        __set_pending_keys(self, {a: k for k, a in pending.items()})
+
+
+def __lazy_attr_items__(o):
+    """Return the attribute items for `o`, resolving any lazy values."""
+    if isinstance(o, LazyDotWizPlus):
+        __resolve_all_lazy__(o)
+
+    return o.__dict__.items()
+
+
+class LazyDotWizPlus(DotWizPlus):
+    """
+    :class:`LazyDotWizPlus` - a :class:`DotWizPlus` which converts nested
+    ``dict`` and ``list`` values on *first access*, rather than on creation.
+
+    This is useful when only a few fields of a large payload are ever
+    accessed, as the cost of creating the object then scales with the
+    number of values which are actually accessed.
+
+    Usage::
+
+        >>> from dotwiz import LazyDotWizPlus
+        >>> dw = LazyDotWizPlus({'Key 1': {'keyTwo': [{'3D': 1}]}, 'd': 2})
+        >>> assert dw.key_1.key_two[0]._3d == 1
+        >>> dw
+        ✪(key_1=✪(key_two=[✪(_3d=1)]), d=2)
+
+    The results of ``repr``, ``to_dict``, ``to_attr_dict``, ``pop``,
+    ``setdefault``, ``dict(...)`` and equality comparisons are the same as
+    with a :class:`DotWizPlus`, whether or not a nested value has been
+    accessed yet.
+
+    """
+    __slots__ = ('__pending__', '__pending_keys__')
+
+    __init__ = update = __upsert_into_lazy_dot_wiz_plus__
+
+    __setattr__ = __setitem__ = __setitem_lazy_impl__
+    __delattr__ = __delitem__ = __delitem_lazy_impl__
+
+    clear = __clear_lazy_impl__
+
+    from_records = classmethod(__from_each_record__)
+
+    __getstate__ = __getstate_lazy_impl__
+    __setstate__ = __setstate_lazy_impl__
+
+    __copy__ = __copy_with_state__
+    __deepcopy__ = __deepcopy_with_state__
+
+    __iter__ = __iter_lazy_impl__
+
+    pop = __pop_lazy_impl__
+    popitem = __popitem_lazy_impl__
+    setdefault = __setdefault_lazy_impl__
+
+    def __getattr__(self, item, __contains=dict.__contains__):
+        __pending_keys = __get_pending_keys__(self)
+
+        if __pending_keys:
+            key = __pending_keys.get(item, _MISSING)
+            # note: the key might be removed from the `dict` storage
+            # directly, such as with `dict.pop()`.
+            if key is not _MISSING and __contains(self, key):
+                return __resolve_lazy_value__(
+                    self, __get_pending__(self), key, item)
+
+        # defer to a `__getattr__()` added via `set_default_for_missing_keys`
+        default_getattr = getattr(DotWizPlus, '__getattr__', None)
+        if default_getattr is not None:
+            return default_getattr(self, item)
+
+        raise AttributeError(
+            f'{type(self).__name__!r} object has no attribute {item!r}')
+
+    def __getitem__(self, key, __get=dict.__getitem__):
+        __pending = __get_pending__(self)
+
+        if __pending and key in __pending:
+            return __resolve_lazy_value__(self, __pending, key, __pending[key])
+
+        return __get(self, key)
+
+    def get(self, key, default=None, __contains=dict.__contains__):
+        return self[key] if __contains(self, key) else default
+
+    def items(self):
+        __resolve_all_lazy__(self)
+        return dict.items(self)
+
+    def values(self):
+        __resolve_all_lazy__(self)
+        return dict.values(self)
+
+    def __repr__(self):
+        __resolve_all_lazy__(self)
+        # note: this is looked up on each call, as the `__repr__` is
+        # replaced once `from_graph()` is first called.
+        return DotWizPlus.__repr__(self)
+
+    def to_attr_dict(self, preserve_refs=False):
+        return __convert_to_attr_dict__(self, __lazy_attr_items__,
+                                        preserve_refs)
+
+    to_attr_dict.__doc__ = DotWizPlus.to_attr_dict.__doc__
+
+
+# Setters for the `__pending__` and `__pending_keys__` slots in `LazyDotWizPlus`
+__set_pending = LazyDotWizPlus.__pending__.__set__
+__set_pending_keys = LazyDotWizPlus.__pending_keys__.__set__
+
+
+def __get_pending__(self, __get=LazyDotWizPlus.__pending__.__get__):
+    """
+    Return the mapping of (original) key name to attribute name for values
+    in a :class:`LazyDotWizPlus` which haven't been converted yet, or
+    ``None`` if all values are converted.
+    """
+    try:
+        return __get(self)
+    except AttributeError:
+        return None
+
+
+def __get_pending_keys__(self, __get=LazyDotWizPlus.__pending_keys__.__get__):
+    """
+    Return the mapping of attribute name to (original) key name for values
+    in a :class:`LazyDotWizPlus` which haven't been converted yet, or
+    ``None`` if all values are converted; this is the reverse of the
+    mapping from :func:`__get_pending__`, for a fast attribute lookup.
+    """
+    try:
+        return __get(self)
+    except AttributeError:
+        return None
+
+
+# a key such as `to_attr_dict` is never looked up as an attribute in a path.
+__reserve_attr_names__(DotWizPlus, LazyDotWizPlus)
@@ -1,11 +1,19 @@
 import keyword
-from typing import TypeVar, Callable, Protocol, Mapping, MutableMapping, Iterable
+from threading import Lock
+from typing import (Any, TypeVar, Callable, Protocol, Mapping, MutableMapping, Iterable,
+                    ItemsView, Iterator, KeysView, ValuesView, Literal, Sequence)
+
+from _typeshed import SupportsRead
+
+from .common import CacheInfo, KeyCache
+from .paths import DotPath
 
 _T = TypeVar('_T')
 _KT = TypeVar('_KT')
 _VT = TypeVar('_VT')
 
 _SetItem = Callable[[dict, _KT, _VT], None]
+_Normalizer = Callable[[str], str]
 
 # Ref: https://stackoverflow.com/a/68392079/10237506
 class _Update(Protocol):
@@ -14,8 +22,37 @@ class _Update(Protocol):
                  **kwargs: _T) -> None: ...
 
 
-__SPECIAL_KEYS: dict[str, str] = ...
+__NORMALIZERS: dict[str, tuple[_Normalizer, KeyCache]] = ...
+__NORMALIZER_LOCK: Lock = ...
+__NORMALIZER_NAME: str = ...
+__NORMALIZE: _Normalizer = ...
+__SPECIAL_KEYS: KeyCache = ...
 __IS_KEYWORD: Callable[[object], bool] = ...
+__MAX_KEY_SETS: int = ...
+__set_dict: Callable[[DotWizPlus, dict], None] = ...
+
+
+def configure_key_cache(maxsize: int | None = 4096,
+                        policy: Literal['lru', 'fifo'] = 'fifo',
+                        normalizer: str | None = None) -> None: ...
+
+def key_cache_info(normalizer: str | None = None) -> CacheInfo: ...
+
+def clear_key_cache(normalizer: str | None = None) -> None: ...
+
+def __key_cache_for__(normalizer: str | None) -> KeyCache: ...
+
+def __normalizer_for__(name: str) -> tuple[_Normalizer, KeyCache]: ...
+
+def register_key_normalizer(name: str,
+                            normalizer: _Normalizer,
+                            overwrite: bool = False,
+                            maxsize: int | None = 4096,
+                            policy: Literal['lru', 'fifo'] = 'fifo') -> None: ...
+
+def set_key_normalizer(name: str) -> str: ...
+
+def get_key_normalizer() -> str: ...
 
 
 def make_dot_wiz_plus(*args: Iterable[_KT, _VT],
@@ -25,7 +62,9 @@ def __store_in_object__(self: DotWizPlus,
                         __self_dict: MutableMapping[_KT, _VT],
                         key: _KT,
                         value: _VT,
-                        *, __set: _SetItem = dict.__setitem__) -> None: ...
+                        *, __set: _SetItem = dict.__setitem__) -> str: ...
+
+def __to_snake_case__(key: str) -> str: ...
 
 # noinspection PyDefaultArgument
 def __upsert_into_dot_wiz_plus__(self: DotWizPlus,
@@ -37,8 +76,89 @@ def __setitem_impl__(self: DotWizPlus,
                      value: _VT) -> None: ...
 
 
+def __from_record__(cls: type[DotWizPlus],
+                    record: Mapping[_KT, _VT],
+                    translations: dict[tuple[_KT, ...], tuple[str, ...] | Literal[False] | None],
+                    *, __new: Callable[[type[DotWizPlus]], DotWizPlus] = dict.__new__,
+                    __update: _Update = dict.update,
+                    __set: _SetItem = dict.__setitem__) -> DotWizPlus: ...
+
+def __resolve_record_value__(cls: type[DotWizPlus],
+                             value: _T,
+                             translations: dict[tuple[_KT, ...], tuple[str, ...] | Literal[False] | None],
+                             ) -> _T | DotWizPlus | list[DotWizPlus]: ...
+
+def __from_records__(cls: type[DotWizPlus],
+                     records: Iterable[Mapping[_KT, _VT]]) -> list[DotWizPlus]: ...
+
+def __from_graph_impl__(cls: type[DotWizPlus], o: dict[_KT, _VT]) -> DotWizPlus: ...
+
+def __object_hook__(cls: type[DotWizPlus], o: dict[_KT, _VT]) -> DotWizPlus: ...
+
+_AttrNames = tuple[str, ...] | dict[str, _VT] | None
+
+def __getstate_impl__(self: DotWizPlus,
+                      *, __is: Callable[[object, object], bool] = ...) -> tuple[dict[_KT, _VT], _AttrNames]: ...
+
+def __setstate_impl__(self: DotWizPlus,
+                      state: tuple[dict[_KT, _VT], _AttrNames],
+                      *, __update: _Update = dict.update) -> None: ...
+
+def __copy_impl__(self: DotWizPlus,
+                  *, __new: Callable[[type[DotWizPlus]], DotWizPlus] = dict.__new__,
+                  __update: _Update = dict.update) -> DotWizPlus: ...
+
+def __deepcopy_impl__(self: DotWizPlus,
+                      memo: dict[int, Any],
+                      *, __new: Callable[[type[DotWizPlus]], DotWizPlus] = dict.__new__,
+                      __update: _Update = dict.update) -> DotWizPlus: ...
+
+
 class DotWizPlus(dict):
 
+    @classmethod
+    def __object_hook__(cls, o: dict[_KT, _VT]) -> DotWizPlus: ...
+
+    @classmethod
+    def from_graph(cls, o: dict[_KT, _VT]) -> DotWizPlus:
+        """
+        Create a :class:`DotWizPlus` from a ``dict`` object, which can contain shared
+        or circular references to nested ``dict`` and ``list`` objects.
+
+        Each distinct nested object is converted only once, and the result
+        is shared everywhere the object appears.
+        """
+        ...
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[_KT, _VT]]) -> list[DotWizPlus]:
+        """
+        Create a ``list`` of :class:`DotWizPlus` instances from an iterable of ``dict``
+        objects, such as the records in a JSON API response.
+
+        The key names used for attribute access are only worked out once for
+        each distinct set of key names, and then reused for the other records.
+        """
+        ...
+
+    @classmethod
+    def from_json(cls, s: str | bytes | bytearray,
+                  **kwargs: Any) -> DotWizPlus | list[DotWizPlus] | Any:
+        """
+        Create a :class:`DotWizPlus` from a JSON string, ``bytes`` or ``bytearray``
+        object, building each (nested) object directly during parsing.
+        """
+        ...
+
+    @classmethod
+    def from_json_file(cls, fp: SupportsRead[str | bytes],
+                       **kwargs: Any) -> DotWizPlus | list[DotWizPlus] | Any:
+        """
+        Create a :class:`DotWizPlus` from a file-like object containing a JSON
+        document, building each (nested) object directly during parsing.
+        """
+        ...
+
     # noinspection PyDefaultArgument
     def __init__(self,
                  input_dict: MutableMapping[_KT, _VT] = {},
@@ -53,16 +173,45 @@ class DotWizPlus(dict):
     def __setattr__(self, item: str, value: _VT) -> None: ...
     def __setitem__(self, k: _KT, v: _VT) -> None: ...
 
-    def to_attr_dict(self) -> dict[_KT, _VT]:
+    def get_path(self, path_: str | Sequence[_KT] | DotPath,
+                 default: _T = ...) -> _VT | _T:
+        """
+        Return the value at `path_` - a path string such as ``'a.b[0].c'``,
+        or a sequence of keys - in the :class:`DotWizPlus`. If the path is not
+        found, return `default` if it's passed in; otherwise, raise the
+        original error (such as a :exc:`KeyError`).
+        """
+        ...
+
+    def has_path(self, path_: str | Sequence[_KT] | DotPath) -> bool:
+        """
+        Return true if `path_` - a path string such as ``'a.b[0].c'``, or a
+        sequence of keys - is found in the :class:`DotWizPlus`.
+        """
+        ...
+
+    def set_path(self, path_: str | Sequence[_KT] | DotPath, value: _VT) -> None:
+        """
+        Set the value at `path_` - a path string such as ``'a.b[0].c'``, or
+        a sequence of keys - in the :class:`DotWizPlus` to `value`, creating any
+        objects which are missing along the path.
+        """
+        ...
+
+    def to_attr_dict(self, preserve_refs: bool = False) -> dict[_KT, _VT]:
         """
         Recursively convert the :class:`DotWizPlus` instance back to a ``dict``,
         while preserving the lower-cased keys used for attribute access.
         """
         ...
 
-    def to_dict(self) -> dict[_KT, _VT]:
+    def to_dict(self, preserve_refs: bool = False) -> dict[_KT, _VT]:
         """
         Recursively convert the :class:`DotWizPlus` instance back to a ``dict``.
+
+        If `preserve_refs` is true, a nested object which appears in more
+        than one place is converted only once, and the result is shared;
+        this is required for objects with circular references.
         """
         ...
 
@@ -72,3 +221,73 @@ class DotWizPlus(dict):
                **kwargs: _T) -> None: ...
 
     def __repr__(self) -> str: ...
+
+    def __reduce_ex__(self, protocol: int) -> tuple[Callable[..., DotWizPlus], tuple[type[DotWizPlus]], Any]: ...
+    def __getstate__(self) -> Any: ...
+    def __setstate__(self, state: Any) -> None: ...
+
+    def __copy__(self) -> DotWizPlus: ...
+    def __deepcopy__(self, memo: dict[int, Any]) -> DotWizPlus: ...
+
+
+# noinspection PyDefaultArgument
+def __upsert_into_lazy_dot_wiz_plus__(self: LazyDotWizPlus,
+                                      input_dict: MutableMapping[_KT, _VT] = {},
+                                      **kwargs: _T) -> None: ...
+
+def __setitem_lazy_impl__(self: LazyDotWizPlus,
+                          key: _KT,
+                          value: _VT) -> None: ...
+
+def __delitem_lazy_impl__(self: LazyDotWizPlus,
+                          key: _KT,
+                          *, __delete: Callable[[dict, _KT], None] = dict.__delitem__) -> None: ...
+
+def __clear_lazy_impl__(self: LazyDotWizPlus,
+                        *, __clear: Callable[[dict], None] = dict.clear) -> None: ...
+
+def __resolve_lazy_value__(self: LazyDotWizPlus,
+                           __pending: dict[_KT, str],
+                           key: _KT,
+                           attr_key: str,
+                           *, __get: Callable[[dict, _KT], _VT] = dict.__getitem__,
+                           __set: _SetItem = dict.__setitem__) -> _VT: ...
+
+def __resolve_all_lazy__(self: LazyDotWizPlus,
+                         *, __items: Callable[[dict], ItemsView[_KT, _VT]] = dict.items,
+                         __contains: Callable[[dict, _KT], bool] = dict.__contains__) -> None: ...
+
+def __getstate_lazy_impl__(self: LazyDotWizPlus,
+                           *, __items: Callable[[dict], ItemsView[_KT, _VT]] = dict.items) -> tuple[dict[_KT, _VT], dict[str, _VT], dict[_KT, str] | None]: ...
+
+def __setstate_lazy_impl__(self: LazyDotWizPlus,
+                           state: tuple[dict[_KT, _VT], dict[str, _VT], dict[_KT, str] | None],
+                           *, __update: _Update = dict.update) -> None: ...
+
+def __lazy_attr_items__(o: DotWizPlus) -> ItemsView[str, _VT]: ...
+
+def __get_pending__(self: LazyDotWizPlus) -> dict[_KT, str] | None: ...
+
+def __get_pending_keys__(self: LazyDotWizPlus) -> dict[str, _KT] | None: ...
+
+__set_pending: Callable[[LazyDotWizPlus, dict[_KT, str] | None], None] = ...
+__set_pending_keys: Callable[[LazyDotWizPlus, dict[str, _KT] | None], None] = ...
+
+
+class LazyDotWizPlus(DotWizPlus):
+    __pending__: dict[_KT, str] | None
+    __pending_keys__: dict[str, _KT] | None
+
+    def get(self, key: _KT, default: _T | None = None) -> _VT | _T | None: ...
+
+    def items(self) -> ItemsView[_KT, _VT]: ...
+
+    def values(self) -> ValuesView[_VT]: ...
+
+    def __iter__(self) -> Iterator[_KT]: ...
+
+    def pop(self, key: _KT, default: _VT | _T = ...) -> _VT | _T: ...
+
+    def popitem(self) -> tuple[_KT, _VT]: ...
+
+    def setdefault(self, key: _KT, default: _VT | None = None) -> _VT | None: ...
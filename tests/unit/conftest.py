@@ -2,6 +2,7 @@
 import pytest
 
 from dotwiz import DotWiz, DotWizPlus
+from dotwiz.paths import __clear_attr_types__
 
 
 class CleanupGetAttr:
@@ -18,3 +19,4 @@ class CleanupGetAttr:
         """
         del DotWiz.__getattr__
         del DotWizPlus.__getattr__
+        __clear_attr_types__()
@@ -0,0 +1,145 @@
+"""Tests for the `ColumnarList` class."""
+
+import pytest
+
+from dotwiz import *
+
+
+@pytest.fixture
+def records():
+    return [{'id': i, 'userName': f'user{i}', 'tags': ['a'],
+             'Address': {'City': 'Paris'}}
+            for i in range(5)]
+
+
+def test_columnar_list(records):
+    rows = ColumnarList(records)
+
+    assert isinstance(rows, list)
+    assert len(rows) == 5
+    assert rows[3].id == rows[3]['id'] == 3
+    assert rows[-1].userName == 'user4'
+    assert rows[0].Address.City == 'Paris'
+    assert type(rows[0].Address) is DotWiz
+    assert [row.id for row in rows] == list(range(5))
+    assert [row.id for row in rows[1:3]] == [1, 2]
+
+    assert rows[2] == records[2]
+    assert rows == records
+    assert rows.to_list() == records
+    assert rows[2].to_dict() == records[2]
+
+    assert list(rows[0]) == ['id', 'userName', 'tags', 'Address']
+    assert 'tags' in rows[0] and 'missing' not in rows[0]
+    assert rows[0].get('missing', 1) == 1
+    assert rows.column('id') == [0, 1, 2, 3, 4]
+
+    assert repr(rows[1]) == ("✫(id=1, userName='user1', tags=['a'], "
+                             "Address=✫(City='Paris'))")
+
+    # the original records are not modified
+    assert type(records[0]['Address']) is dict
+
+
+def test_columnar_list_set_value(records):
+    rows = ColumnarList(records)
+
+    rows[1].userName = 'jon'
+    rows[2]['Address'] = {'City': 'Rome'}
+
+    assert rows.column('userName')[1] == 'jon'
+    assert rows[2].Address.City == 'Rome'
+    assert rows[3].Address.City == 'Paris'
+
+    with pytest.raises(AttributeError):
+        rows[1].missing = 1
+
+    with pytest.raises(KeyError):
+        rows[1]['missing'] = 1
+
+
+@pytest.mark.parametrize('modify', [
+    lambda o: o.append({}),
+    lambda o: o.extend([{}]),
+    lambda o: o.insert(0, {}),
+    lambda o: o.pop(),
+    lambda o: o.clear(),
+    lambda o: o.__setitem__(0, {}),
+    lambda o: o.__delitem__(0),
+])
+def test_columnar_list_is_fixed_size(records, modify):
+    rows = ColumnarList(records)
+
+    with pytest.raises(TypeError):
+        modify(rows)
+
+    assert len(rows) == 5
+
+
+def test_columnar_list_with_different_keys(records):
+    records[3] = {'id': 3}
+
+    with pytest.raises(ValueError, match='record 3'):
+        ColumnarList(records)
+
+    records[3] = {'id': 3, 'userName': '', 'tags': [], 'address': {}}
+
+    with pytest.raises(ValueError, match='record 3'):
+        ColumnarList(records)
+
+
+def test_columnar_list_in_dotwiz(records):
+    dw = DotWiz(count=5, rows=ColumnarList(records))
+
+    assert type(dw.rows) is ColumnarList
+    assert dw.rows[4].userName == 'user4'
+    assert dw.to_dict() == {'count': 5, 'rows': records}
+    assert dw.to_dict(preserve_refs=True) == {'count': 5, 'rows': records}
+
+
+def test_columnar_list_plus(records):
+    rows = ColumnarList(iter(records), DotWizPlus)
+
+    assert rows[1].user_name == 'user1'
+    assert rows[1]['userName'] == 'user1'
+    assert rows[0].address.city == 'Paris'
+    assert type(rows[0].address) is DotWizPlus
+
+    dw = DotWizPlus(rows=rows)
+
+    assert dw.to_dict() == {'rows': records}
+    assert dw.to_attr_dict()['rows'][0] == {
+        'id': 0, 'user_name': 'user0', 'tags': ['a'], 'address': {'city': 'Paris'}}
+
+    objects = rows.to_objects()
+    assert type(objects[0]) is DotWizPlus
+    assert objects[2].user_name == 'user2'
+
+
+def test_columnar_list_empty():
+    assert ColumnarList() == []
+    assert ColumnarList([]).to_list() == []
+
+
+def test_columnar_list_with_non_str_keys():
+    rows = ColumnarList([{1: 'a', 'b': 2}, {1: 'c', 'b': 3}])
+
+    assert rows[1][1] == 'c'
+    assert rows[1].b == 3
+    assert rows.to_list() == [{1: 'a', 'b': 2}, {1: 'c', 'b': 3}]
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus])
+def test_columnar_list_with_method_names(cls):
+    records = [{'items': 1, 'to_dict': 2, 'get': 3, 'keys': 4, 'values': 5,
+                'my key': 6}]
+    rows = ColumnarList(records, cls)
+    row = rows[0]
+
+    assert row['items'] == 1
+    assert row.get('get') == 3
+    assert row.to_dict() == records[0]
+    assert list(row.keys()) == list(records[0])
+    assert row.values() == [1, 2, 3, 4, 5, 6]
+    assert dict(row.items()) == records[0]
+    assert 'to_dict' in repr(row)
@@ -0,0 +1,63 @@
+"""Tests for the `to_columns` function."""
+import math
+from array import array
+
+import pytest
+
+from dotwiz import *
+
+
+@pytest.fixture
+def records():
+    return [{'id': i, 'user': {'age': 20 + i, 'score': i / 2}}
+            for i in range(10)]
+
+
+@pytest.mark.parametrize('cls', [dict, DotWiz, DotWizPlus, FrozenDotWiz])
+def test_to_columns(cls, records):
+    records = [cls(r) for r in records]
+
+    columns = to_columns(records, ['id', 'user.age', 'user.score'],
+                         dtype={'id': 'q', 'user.age': 'b'},
+                         use_numpy=False)
+
+    assert list(columns) == ['id', 'user.age', 'user.score']
+    assert columns['id'] == array('q', range(10))
+    assert columns['user.age'] == array('b', range(20, 30))
+    assert columns['user.score'] == array('d', [i / 2 for i in range(10)])
+
+
+def test_to_columns_with_missing_values(records):
+    records[3] = DotWiz(id=3)
+    records[5] = {'id': 5, 'user': None}
+
+    with pytest.raises(KeyError):
+        to_columns(records, ['id', 'user.age'], use_numpy=False)
+
+    columns = to_columns(iter(records), ['id', 'user.age'], dtype='f',
+                         fill_value=math.nan, use_numpy=False)
+
+    ages = columns['user.age']
+    assert ages.typecode == 'f'
+    assert math.isnan(ages[3]) and math.isnan(ages[5])
+    assert ages[4] == 24
+
+
+def test_to_columns_with_many_records(records):
+    records = DotWiz.from_records(records * 1000)
+
+    columns = to_columns(records, ['id'], dtype='i', use_numpy=False)
+
+    assert columns['id'] == array('i', list(range(10)) * 1000)
+    assert to_columns([], ['id'], use_numpy=False) == {'id': array('d')}
+
+
+def test_to_columns_with_numpy(records):
+    numpy = pytest.importorskip('numpy')
+
+    columns = to_columns(DotWiz.from_records(records), ['id', 'user.score'],
+                         dtype={'id': 'q'})
+
+    assert isinstance(columns['id'], numpy.ndarray)
+    assert columns['id'].dtype == numpy.int64
+    assert columns['user.score'].tolist() == [i / 2 for i in range(10)]
@@ -0,0 +1,92 @@
+"""Tests for the common (shared) helpers and utilities."""
+
+import pytest
+
+from dotwiz.common import CacheInfo, KeyCache
+
+
+def test_key_cache_fifo():
+    """The oldest key is evicted from a full cache with a `fifo` policy."""
+    cache = KeyCache(2, policy='fifo')
+
+    cache.set('a', 'A')
+    cache.set('b', 'B')
+    assert cache.get('a') == 'A'
+
+    cache.set('c', 'C')
+    assert 'a' not in cache
+    assert cache.get('a') is None
+    assert cache.get('b') == 'B'
+    assert cache.info() == CacheInfo(hits=2, misses=1, evictions=1,
+                                     maxsize=2, currsize=2)
+
+
+def test_key_cache_lru():
+    """The least recently used key is evicted with a `lru` policy."""
+    cache = KeyCache(2, policy='lru')
+
+    cache.set('a', 'A')
+    cache.set('b', 'B')
+    assert cache.get('a') == 'A'
+
+    cache.set('c', 'C')
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert cache.info().evictions == 1
+
+
+def test_key_cache_configure_and_clear():
+    """Resizing the cache evicts keys, and clearing it resets the stats."""
+    cache = KeyCache(None)
+    for i in range(10):
+        cache.set(i, str(i))
+
+    assert len(cache) == 10
+
+    cache.configure(3)
+    assert len(cache) == 3
+    assert cache.info().evictions == 7
+    assert cache.get(9) == '9'
+
+    cache.clear()
+    assert cache.info() == CacheInfo(0, 0, 0, 3, 0)
+
+    # a cache with a max size of zero doesn't store anything
+    cache.configure(0)
+    assert cache.set('a', 'A') == 'A'
+    assert len(cache) == 0
+
+
+@pytest.mark.parametrize('kwargs', [{'policy': 'random'}, {'maxsize': -1}])
+def test_key_cache_with_invalid_args(kwargs):
+    """An error is raised for an invalid max size or eviction policy."""
+    with pytest.raises(ValueError):
+        KeyCache(**kwargs)
+
+
+@pytest.mark.parametrize('policy', KeyCache.POLICIES)
+def test_key_cache_with_threads(policy):
+    """A cache that is shared between threads stays bounded and consistent."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = KeyCache(8, policy=policy)
+    keys = [f'key{i % 32}' for i in range(5_000)]
+
+    def lookup(key):
+        value = cache.get(key)
+        if value is None:
+            value = cache.set(key, key.upper())
+        return value
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lookup, keys))
+
+    assert results == [k.upper() for k in keys]
+    # note: the size may briefly exceed `maxsize`, by up to the number of
+    # threads, when the `lru` policy is used.
+    assert len(cache) <= 8 + 8
+
+    info = cache.info()
+    # each distinct key is a miss at least once
+    assert info.misses >= len(set(keys))
+    assert info.hits + info.misses <= len(keys)
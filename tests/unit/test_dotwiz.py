@@ -1,5 +1,12 @@
 """Tests for `dotwiz` package."""
 
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+
 import pytest
 
 from dotwiz import *
@@ -206,3 +213,463 @@ def test_dotwiz_to_dict():
             }
         ]
     }
+
+
+def test_lazy_dotwiz():
+    """Confirm intended functionality of `LazyDotWiz`"""
+    data = {'a': {'b': [{'c': 1}, [{'x': {'y': 2}}]]}, 'd': 2, 'e': {'f': 3}}
+
+    dw = LazyDotWiz(data)
+
+    # nested values are not converted until they are accessed
+    assert type(dict.__getitem__(dw, 'a')) is dict
+    assert dw == DotWiz(data)
+    assert dw.to_dict() == data
+
+    assert dw.a.b[1][0].x.y == 2
+    assert isinstance(dw.a, LazyDotWiz)
+    assert isinstance(dict.__getitem__(dw, 'a'), LazyDotWiz)
+    assert dw['e'].f == 3
+    assert dw.get('e') == {'f': 3}
+    assert dw.get('missing') is None
+
+    with pytest.raises(AttributeError):
+        _ = dw.missing
+
+
+def test_lazy_dotwiz_repr():
+    """The `repr` of a `LazyDotWiz` is the same as for a `DotWiz`."""
+    data = {'a': {'b': [{'c': 1}]}, 'd': 2, 'e': [{'f': 3}]}
+
+    dw = LazyDotWiz(data)
+    assert repr(dw) == repr(DotWiz(data))
+
+    dw = LazyDotWiz(data)
+    _ = dw.e
+    assert repr(dw) == repr(DotWiz(data)) == "✫(a=✫(b=[✫(c=1)]), d=2, e=[✫(f=3)])"
+
+
+def test_lazy_dotwiz_set_and_update():
+    """Values set on a `LazyDotWiz` are converted on access."""
+    dw = LazyDotWiz(a={'b': 1})
+    _ = dw.a
+
+    dw.a = {'c': 2}
+    dw['d'] = [{'e': 3}]
+    dw.update(f={'g': 4})
+
+    assert dw.a.c == 2
+    assert dw.d[0].e == 3
+    assert dw.f.g == 4
+    assert dw.to_dict() == {'a': {'c': 2}, 'd': [{'e': 3}], 'f': {'g': 4}}
+
+
+def test_lazy_dotwiz_with_method_names():
+    """A nested value for a key such as `items` is the same as in `DotWiz`."""
+    data = {'order': {'items': [{'id': 1}], 'keys': {'a': 1}, 'total': {'x': 2}}}
+
+    lw = LazyDotWiz(data)
+    dw = DotWiz(data)
+
+    assert lw.order.items == dw.order.items == [{'id': 1}]
+    assert lw.order.items[0].id == 1
+    assert lw.order.keys.a == 1
+    assert type(dict.__getitem__(lw.order, 'total')) is dict
+
+    lw.order.update(values=[{'y': 3}])
+    assert lw.order.values[0].y == 3
+
+    repr(lw)
+    assert lw.order.items == [{'id': 1}]
+
+    dw.order.update(values=[{'y': 3}])
+    assert lw.to_dict() == dw.to_dict()
+
+
+def test_lazy_dotwiz_pop_setdefault_and_copy():
+    """`pop`, `setdefault` and `dict()` return converted values."""
+    dw = LazyDotWiz({'a': {'b': 1}, 'c': [{'d': 2}], 'e': {'f': 3}, 'g': 4})
+
+    copy = dict(dw)
+    assert type(copy['a']) is LazyDotWiz
+    assert type(copy['c'][0]) is LazyDotWiz
+    assert {**dw} == copy
+
+    assert type(dw.pop('a')) is LazyDotWiz
+    assert 'a' not in dw
+    assert dw.pop('a', None) is None
+    with pytest.raises(KeyError):
+        dw.pop('a')
+
+    assert dw.popitem() == ('g', 4)
+    key, value = dw.popitem()
+    assert key == 'e' and type(value) is LazyDotWiz
+
+    assert type(dw.setdefault('c')[0]) is LazyDotWiz
+    assert dw.setdefault('h', {'i': 5}).i == 5
+    assert dw.h.i == 5
+
+    dw.clear()
+    with pytest.raises(KeyError):
+        dw.popitem()
+
+
+class TestLazyDefaultForMissingKeys(CleanupGetAttr):
+
+    def test_usage(self):
+        """:func:`set_default_for_missing_keys` also applies to `LazyDotWiz`."""
+        set_default_for_missing_keys('test')
+
+        dw = LazyDotWiz(a={'b': 1})
+        assert dw.a.b == 1
+        assert dw.world == 'test'
+
+
+def test_dotwiz_lite():
+    """Confirm intended functionality of `DotWizLite`"""
+    data = {'a': 1, 'b': {'c': [{'d': 2}]}, 3: 'three'}
+    dw = DotWizLite(data)
+
+    # the instance `__dict__` and the `dict` storage are the same object
+    assert vars(dw) is dw
+    assert isinstance(dw.b, DotWizLite)
+    assert isinstance(dw.b.c[0], DotWizLite)
+
+    assert dw.a == 1
+    assert dw.b.c[0].d == 2
+    assert dw[3] == 'three'
+    assert dw == DotWiz(data)
+    assert dw.to_dict() == data
+    assert repr(dw) == "✫(a=1, b=✫(c=[✫(d=2)]), 3='three')"
+
+
+def test_dotwiz_lite_set_and_del_attr():
+    """Setting and deleting attributes on a `DotWizLite`."""
+    dw = DotWizLite()
+    dw.a = {'b': 1}
+    dw['c'] = [{'d': 2}]
+    dw.update(e={'f': 3})
+
+    assert dw.a.b == 1
+    assert dw.c[0].d == 2
+    assert dw.e.f == 3
+
+    del dw.a
+    assert 'a' not in dw
+    # unlike with `DotWiz`, the attribute is also removed
+    assert not hasattr(dw, 'a')
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizLite, LazyDotWiz])
+def test_dotwiz_from_json(cls):
+    """Confirm intended functionality of `DotWiz.from_json`"""
+    string = '{"a": 1, "b": {"c": [{"d": 2}, [{"e": {}}]]}, "for": null}'
+    expected = cls(json.loads(string))
+
+    for s in (string, string.encode(), bytearray(string.encode())):
+        dw = cls.from_json(s)
+
+        assert type(dw) is cls
+        assert type(dw.b.c[0]) is cls
+        assert dw.b.c[1][0].e == {}
+        assert dw == expected
+        assert repr(dw) == repr(expected)
+
+    dw = cls.from_json_file(io.StringIO(string))
+    assert dw.b.c[0].d == 2
+    assert dw.to_dict() == json.loads(string)
+
+
+def test_dotwiz_from_json_with_array():
+    """The top-level value for `DotWiz.from_json` can be any JSON type."""
+    result = DotWiz.from_json('[{"a": {"b": 1}}, 2]', parse_int=str)
+    assert result == [DotWiz(a={'b': '1'}), '2']
+    assert result[0].a.b == '1'
+
+
+def test_dotwiz_to_dict_with_deeply_nested_values():
+    """`DotWiz.to_dict` works for objects of any depth."""
+    depth = 10_000
+
+    dw = node = DotWiz()
+    for i in range(depth):
+        child = DotWiz(i=i)
+        dict.__setitem__(node, 'n', [child])
+        node = child
+
+    result = dw.to_dict()
+
+    for i in range(depth):
+        result = result['n'][0]
+        assert type(result) is dict
+        assert result['i'] == i
+
+    assert result == {'i': depth - 1}
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizLite, LazyDotWiz])
+def test_dotwiz_from_graph_with_shared_and_circular_refs(cls):
+    """`DotWiz.from_graph` preserves shared and circular references."""
+    shared = {'x': 1}
+    data = {'a': shared, 'b': [shared, {'y': shared}]}
+    data['self'] = data
+    data['b'].append(data['b'])
+
+    dw = cls.from_graph(data)
+
+    assert type(dw) is cls
+    assert dw.self is dw
+    assert type(dw.a) is cls
+    assert dw.a is dw.b[0] is dw.b[1].y
+    assert dw.b[2] is dw.b
+    assert dw.a.x == 1
+
+    assert repr(dw.self) == repr(dw)
+    assert 'self=✫(...)' in repr(dw)
+
+    result = dw.to_dict(preserve_refs=True)
+
+    assert type(result) is dict
+    assert result['self'] is result
+    assert result['a'] is result['b'][0] is result['b'][1]['y']
+    assert result['b'][2] is result['b']
+    assert result['a'] == shared
+
+
+def test_dotwiz_repr_is_guarded_after_from_graph():
+    """`repr()` only guards against circular references after `from_graph`"""
+    code = ('import dotwiz\n'
+            'dw = dotwiz.DotWiz(a=1)\n'
+            'dw.self = dw\n'
+            'try: repr(dw)\n'
+            'except RecursionError: print("RecursionError")\n'
+            'data = {"a": 1}\n'
+            'data["self"] = data\n'
+            'print(repr(dotwiz.LazyDotWiz.from_graph(data)))\n'
+            'print(repr(dw))')
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], cwd=root,
+                            capture_output=True, text=True, check=True,
+                            encoding='utf-8')
+
+    assert result.stdout.splitlines() == [
+        'RecursionError', '✫(a=1, self=✫(...))', '✫(a=1, self=✫(...))']
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizLite, DotWizPlus,
+                                 LazyDotWiz, LazyDotWizPlus])
+def test_dotwiz_repr_is_guarded_after_unpickle_or_deepcopy(cls):
+    """`repr()` guards against circular references on an unpickled object,
+    or a deep copy, even if `from_graph` isn't called in this process."""
+    data = {'a': 1}
+    data['self'] = data
+    # pickled here, and unpickled in a new process
+    pickled = pickle.dumps(cls.from_graph(data), protocol=0).decode('latin-1')
+
+    code = ('import copy, pickle, dotwiz\n'
+            f'dw = pickle.loads({pickled!r}.encode("latin-1"))\n'
+            'print(repr(dw))\n'
+            f'dw = dotwiz.{cls.__name__}(a=1)\n'
+            'dw["self"] = dw\n'
+            'print(repr(copy.deepcopy(dw)))')
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], cwd=root,
+                            capture_output=True, text=True, check=True,
+                            encoding='utf-8')
+
+    expected = repr(cls.from_graph(data))
+    assert result.stdout.splitlines() == [expected, expected]
+
+
+def test_dotwiz_to_dict_without_preserve_refs():
+    """`DotWiz.to_dict` copies shared values by default."""
+    dw = DotWiz(a={'x': 1})
+    dict.__setitem__(dw, 'b', dw.a)
+
+    result = dw.to_dict()
+    assert result == {'a': {'x': 1}, 'b': {'x': 1}}
+    assert result['a'] is not result['b']
+
+    result = dw.to_dict(preserve_refs=True)
+    assert result['a'] is result['b']
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus, LazyDotWiz])
+def test_dotwiz_to_dict_with_circular_refs(cls):
+    """`DotWiz.to_dict` raises an error for a circular reference."""
+    dw = cls(a=1)
+    dw.me = dw
+    dw.items_ = [{'b': dw}]
+
+    with pytest.raises(ValueError, match='circular reference'):
+        dw.to_dict()
+
+    data = {'a': {'b': [1]}}
+    data['a']['b'].append(data)
+
+    with pytest.raises(ValueError, match='circular reference'):
+        cls.from_graph(data).to_dict()
+
+    assert cls.from_graph(data).to_dict(preserve_refs=True)['a']['b'][0] == 1
+
+
+def test_dotwiz_plus_to_attr_dict_with_circular_refs():
+    """`DotWizPlus.to_attr_dict` raises an error for a circular reference."""
+    dw = DotWizPlus(someKey=1)
+    dw.me = dw
+
+    with pytest.raises(ValueError, match='circular reference'):
+        dw.to_attr_dict()
+
+
+def test_dotwiz_specialize():
+    """`DotWiz.specialize` generates a class for a shape of key names."""
+    data = {'a': 3, 'b': 1, 'c': {'aa': 33, 'bb': [{'x': 77}]}}
+
+    cls = DotWiz.specialize(data)
+
+    assert issubclass(cls, DotWiz)
+    assert DotWiz.specialize(data) is cls
+    assert cls.__slots__ == ('a', 'b', 'c')
+
+    dw = cls(data)
+
+    assert dw.c.bb[0].x == 77
+    assert isinstance(dw.c, DotWiz) and type(dw.c) is not DotWiz
+    assert isinstance(dw.c.bb[0], DotWiz) and type(dw.c.bb[0]) is not DotWiz
+
+    assert dw == DotWiz(data)
+    assert repr(dw) == repr(DotWiz(data))
+    assert dw.to_dict() == data
+    assert dw['c']['aa'] == 33
+    assert list(dw) == ['a', 'b', 'c']
+
+
+def test_dotwiz_specialize_with_different_keys():
+    """A specialized `DotWiz` can be created with any set of keys."""
+    cls = DotWiz.specialize(['id', 'items', 'x-y'])
+
+    assert cls.__slots__ == ('id', )
+
+    dw = cls({'id': 1, 'items': 2, 'x-y': {'z': 3}})
+    assert dw.id == 1
+    assert dw['items'] == 2
+    assert dw['x-y'].z == 3
+
+    dw = cls({'x-y': 3, 'id': 1})
+    assert dw == {'x-y': 3, 'id': 1}
+    assert list(dw) == ['x-y', 'id']
+
+    dw = cls(id=1, name='Jon')
+    assert dw.name == 'Jon'
+
+    dw = cls({'name': 'Jon', 'other': 'value', 'id': 2})
+    assert dw.id == 2
+    assert dw.other == 'value'
+
+    with pytest.raises(AttributeError):
+        _ = cls({'a': 1, 'b': 2, 'c': 3}).id
+
+
+def test_dotwiz_specialize_set_and_update():
+    """Setting and updating values in a specialized `DotWiz`."""
+    cls = DotWiz.specialize(['a', 'b'])
+
+    dw = cls(a=1, b=2)
+    dw.a = {'x': [{'y': 1}]}
+    dw['b'] = 3
+    dw.c = 4
+    dw.update(b=5, d={'e': 6})
+
+    assert dw.a.x[0].y == 1
+    assert dw['a'].x[0].y == 1
+    assert dw.b == dw['b'] == 5
+    assert dw.c == dw['c'] == 4
+    assert dw.d.e == 6
+    assert dw.to_dict() == {'a': {'x': [{'y': 1}]}, 'b': 5, 'c': 4, 'd': {'e': 6}}
+
+    assert cls.from_json('{"a": {"x": 1}, "b": 2}') == {'a': {'x': 1}, 'b': 2}
+    assert cls.from_json('{"a": {"x": 1}, "b": 2}').a.x == 1
+
+
+@pytest.mark.parametrize('cls', [DotWizLite, LazyDotWiz])
+def test_dotwiz_specialize_not_supported(cls):
+    with pytest.raises(TypeError):
+        cls.specialize(['a'])
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizLite, LazyDotWiz])
+def test_dotwiz_from_records(cls):
+    """`DotWiz.from_records` creates an object for each record."""
+    records = [{'a': i, 'b': {'c': [{'d': i}, 1]}, 'key-e': None}
+               for i in range(3)]
+    records.append({'x': {'y': 'z'}})
+
+    result = cls.from_records(iter(records))
+
+    assert result == records
+    assert [repr(o) for o in result] == [repr(cls(r)) for r in records]
+    assert all(type(o) is cls for o in result)
+
+    assert result[2].b.c[0].d == 2
+    assert result[2]['key-e'] is None
+    assert result[3].x.y == 'z'
+
+    # the input is not modified
+    assert type(records[0]['b']) is dict
+
+
+def test_dotwiz_from_records_with_specialized_class():
+    records = [{'a': 1, 'b': {'c': 2}}, {'a': 3}]
+
+    cls = DotWiz.specialize(records[0])
+    result = cls.from_records(records)
+
+    assert result == records
+    assert result[0].b.c == 2
+    assert result[1].a == 3
+
+
+def test_import_does_not_load_dotwiz_plus():
+    """`DotWizPlus` (and `pyheck`) is only imported on first use"""
+    code = ('import sys, dotwiz\n'
+            'print("pyheck" in sys.modules, "dotwiz.plus" in sys.modules)\n'
+            'dotwiz.DotWizPlus\n'
+            'print("pyheck" in sys.modules, "dotwiz.plus" in sys.modules)')
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], cwd=root,
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.split() == ['False', 'False', 'True', 'True']
+
+
+def test_import_does_not_load_optional_modules():
+    """The optional features (and `numpy`) are only imported on first use"""
+    modules = ['numpy', 'dotwiz.columnar', 'dotwiz.columns',
+               'dotwiz.instrument', 'dotwiz.loaders']
+    code = ('import sys, dotwiz\n'
+            f'print(*[m in sys.modules for m in {modules!r}])\n'
+            'dotwiz.to_columns([], ["a"], use_numpy=False)\n'
+            'print("numpy" in sys.modules)')
+
+    root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    result = subprocess.run([sys.executable, '-c', code], cwd=root,
+                            capture_output=True, text=True, check=True)
+
+    assert result.stdout.split() == ['False'] * len(modules) + ['False']
+
+
+def test_lazy_names():
+    import dotwiz
+
+    assert dotwiz.DotWizPlus is dotwiz.plus.DotWizPlus
+    assert dotwiz.FrozenDotWiz is dotwiz.frozen.FrozenDotWiz
+    assert dotwiz.ColumnarList is dotwiz.columnar.ColumnarList
+    assert dotwiz.profile is dotwiz.instrument.profile
+    assert set(dotwiz.__all__) <= set(dir(dotwiz))
+
+    with pytest.raises(AttributeError):
+        dotwiz.DoesNotExist
@@ -1,7 +1,12 @@
 """Tests for the `DotWizPlus` class."""
 
+import io
+import json
+import re
+
 import pytest
 
+import dotwiz.plus
 from dotwiz import *
 
 from .conftest import CleanupGetAttr
@@ -246,3 +251,355 @@ def test_key_in_special_keys():
 
     dw = DotWizPlus({'3D': True})
     assert dw._3d
+
+
+def test_lazy_dotwiz_plus():
+    """Confirm intended functionality of `LazyDotWizPlus`"""
+    data = {'Key 1': {'keyTwo': [{'3D': 1}]}, 'd': 2, 'X-y': [1, {'Z': {}}]}
+
+    dw = LazyDotWizPlus(data)
+
+    # nested values are not converted until they are accessed
+    assert type(dict.__getitem__(dw, 'Key 1')) is dict
+    assert dw == DotWizPlus(data)
+    assert dw.to_dict() == data
+
+    assert dw.key_1.key_two[0]._3d == 1
+    assert isinstance(dw.key_1, LazyDotWizPlus)
+    assert isinstance(dw['X-y'][1], LazyDotWizPlus)
+    assert dw.x_y[1].z == {}
+    assert dw.get('d') == 2
+    assert dw.get('missing') is None
+
+    with pytest.raises(AttributeError):
+        _ = dw.missing
+
+
+def test_lazy_dotwiz_plus_repr_and_to_attr_dict():
+    """
+    The `repr` and `to_attr_dict()` of a `LazyDotWizPlus` are the same as
+    for a `DotWizPlus`, regardless of the order in which values are accessed.
+    """
+    data = {'Key 1': {'keyTwo': [{'3D': 1}]}, 'd': 2, 'for': [{'A': {}}]}
+    expected = DotWizPlus(data)
+
+    dw = LazyDotWizPlus(data)
+    assert dw.to_attr_dict() == expected.to_attr_dict()
+
+    dw = LazyDotWizPlus(data)
+    _ = dw.for_
+    assert repr(dw) == repr(expected) == \
+           "✪(key_1=✪(key_two=[✪(_3d=1)]), d=2, for_=[✪(a=✪())])"
+
+
+def test_lazy_dotwiz_plus_set_and_update():
+    """Values set on a `LazyDotWizPlus` are converted on access."""
+    dw = LazyDotWizPlus(a={'b': 1})
+
+    dw.a = 2
+    dw['New-Key'] = {'C': 3}
+    dw.update(d=[{'E': 4}])
+
+    assert dw.a == 2
+    assert dw.new_key.c == 3
+    assert dw.d[0].e == 4
+    assert repr(dw) == "✪(a=2, new_key=✪(c=3), d=[✪(e=4)])"
+
+
+def test_lazy_dotwiz_plus_pop_setdefault_and_copy():
+    """`pop`, `setdefault` and `dict()` return converted values."""
+    dw = LazyDotWizPlus({'A-b': {'C': 1}, 'dE': [{'F': 2}], 'g': 3})
+
+    copy = dict(dw)
+    assert type(copy['A-b']) is LazyDotWizPlus
+    assert copy['dE'][0].f == 2
+
+    assert dw.pop('A-b').c == 1
+    assert dw.setdefault('dE')[0].f == 2
+    assert dw.setdefault('H i', {'J': 4}).j == 4
+    assert dw.h_i.j == 4
+    assert dw.popitem()[1].j == 4
+
+
+def test_lazy_dotwiz_plus_pending_attributes():
+    """Each attribute name maps back to its key, until it's converted."""
+    dw = LazyDotWizPlus({'someKey': {'a': 1}, 'other': [{'b': 2}], 'c': 3})
+
+    assert dw.__pending_keys__ == {'some_key': 'someKey', 'other': 'other'}
+    assert dw.some_key.a == 1
+    assert dw.__pending_keys__ == {'other': 'other'}
+
+    dw.other = 4
+    assert dw.__pending_keys__ == {}
+    assert dw.__pending__ == {}
+
+    dw['New Key'] = {'d': 5}
+    assert dw.new_key.d == 5
+    assert dw.to_dict() == {'someKey': {'a': 1}, 'other': 4, 'c': 3,
+                            'New Key': {'d': 5}}
+
+    with pytest.raises(AttributeError):
+        _ = dw.missing
+
+
+def test_key_cache_info_and_clear():
+    """Confirm the statistics for the special-cased key cache."""
+    clear_key_cache()
+
+    DotWizPlus({'someKey': 1, 'lower': 2})
+    DotWizPlus({'someKey': 3})
+
+    info = key_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    clear_key_cache()
+    assert key_cache_info().currsize == 0
+
+
+def test_configure_key_cache():
+    """The special-cased key cache is bounded by the configured size."""
+    clear_key_cache()
+    configure_key_cache(2, policy='lru')
+
+    try:
+        dw = DotWizPlus({'keyOne': 1, 'keyTwo': 2, 'keyThree': 3})
+        assert dw.to_attr_dict() == {'key_one': 1, 'key_two': 2, 'key_three': 3}
+
+        info = key_cache_info()
+        assert (info.maxsize, info.currsize, info.evictions) == (2, 2, 1)
+
+    finally:
+        configure_key_cache()
+        clear_key_cache()
+
+
+def test_dotwiz_plus_with_threads():
+    """
+    `DotWizPlus` objects created from many threads at once, with overlapping
+    special-cased keys, are the same as those created from a single thread.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    records = [{f'Key-{i % 50}': i, f'otherKey{i % 7}': {'NestedKey': i}}
+               for i in range(2_000)]
+    expected = [DotWizPlus(r).to_attr_dict() for r in records]
+
+    clear_key_cache()
+    configure_key_cache(16, policy='lru')
+
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(
+                lambda r: DotWizPlus(r).to_attr_dict(), records))
+
+        assert results == expected
+
+    finally:
+        configure_key_cache()
+        clear_key_cache()
+
+
+@pytest.mark.parametrize('key,expected', [
+    ('zip-code', 'zip_code'),
+    ('first name', 'first_name'),
+    ('a.b.c', 'a_b_c'),
+    ("it's", 'it_s'),
+    ('v2-api', 'v2_api'),
+    ('some--key', 'some_key'),
+    ('-leading', 'leading'),
+    ('3d-model', '_3d_model'),
+    ('camelCase', 'camel_case'),
+    ('HTTPServer', 'http_server'),
+    ('Snake_Case', 'snake_case'),
+    ('ÄpfelBaum', 'äpfel_baum'),
+])
+def test_snake_case_key_normalizer(key, expected):
+    """The fast path for ASCII keys gives the same result as `pyheck`."""
+    assert dotwiz.plus.__to_snake_case__(key) == expected
+    assert DotWizPlus({key: 1}).to_attr_dict() == {expected: 1}
+
+
+@pytest.fixture
+def identifier_normalizer():
+    """Register (and select) a key normalizer which keeps the case of keys."""
+    def normalize(key):
+        return re.sub('[^0-9a-zA-Z_]|^(?=[0-9])', '_', key)
+
+    register_key_normalizer('identifier', normalize, overwrite=True)
+    previous = set_key_normalizer('identifier')
+
+    yield normalize
+
+    set_key_normalizer(previous)
+
+
+def test_register_key_normalizer(identifier_normalizer):
+    assert get_key_normalizer() == 'identifier'
+
+    dw = DotWizPlus({'userName': 1, 'zip-code': {'3D': 2}, 'for': 3})
+
+    assert dw.userName == 1
+    assert dw.zip_code._3D == 2
+    assert dw.for_ == 3
+    assert dw.to_dict() == {'userName': 1, 'zip-code': {'3D': 2}, 'for': 3}
+
+
+def test_key_normalizers_have_separate_caches(identifier_normalizer):
+    clear_key_cache('snake')
+    clear_key_cache()
+
+    DotWizPlus({'someKey': 1})
+    DotWizPlus({'someKey': 2})
+
+    assert key_cache_info().hits == 1
+    assert key_cache_info('snake').currsize == 0
+
+    set_key_normalizer('snake')
+    assert DotWizPlus({'someKey': 3}).to_attr_dict() == {'some_key': 3}
+    assert key_cache_info('identifier').currsize == 1
+    assert key_cache_info().misses == 1
+
+
+def test_register_key_normalizer_with_errors():
+    with pytest.raises(ValueError, match='already registered'):
+        register_key_normalizer('snake', str.lower)
+
+    with pytest.raises(TypeError):
+        register_key_normalizer('invalid', 'not callable')
+
+    with pytest.raises(ValueError, match='Unknown key normalizer'):
+        set_key_normalizer('invalid')
+
+    with pytest.raises(ValueError, match='Unknown key normalizer'):
+        key_cache_info('invalid')
+
+    assert get_key_normalizer() == 'snake'
+
+
+@pytest.mark.parametrize('cls', [DotWizPlus, LazyDotWizPlus])
+def test_dotwiz_plus_from_json(cls):
+    """Confirm intended functionality of `DotWizPlus.from_json`"""
+    string = '{"Key 1": {"keyTwo": [{"3D": 2}]}, "for": null, "a": [1]}'
+    expected = cls(json.loads(string))
+
+    for s in (string, string.encode()):
+        dw = cls.from_json(s)
+
+        assert type(dw) is cls
+        assert type(dw.key_1.key_two[0]) is cls
+        assert dw.key_1.key_two[0]._3d == 2
+        assert dw.for_ is None
+        assert dw == expected
+        assert repr(dw) == repr(expected)
+
+    dw = cls.from_json_file(io.BytesIO(string.encode()))
+    assert dw.to_dict() == json.loads(string)
+    assert dw.to_attr_dict() == expected.to_attr_dict()
+
+
+def test_dotwiz_plus_to_dict_and_to_attr_dict_with_deeply_nested_values():
+    """`to_dict` and `to_attr_dict` work for objects of any depth."""
+    depth = 10_000
+
+    dw = node = DotWizPlus()
+    for _ in range(depth):
+        child = DotWizPlus()
+        node['Next-Node'] = [[child]]
+        node = child
+
+    result = dw.to_dict()
+    attr_result = dw.to_attr_dict()
+
+    for _ in range(depth):
+        result = result['Next-Node'][0][0]
+        attr_result = attr_result['next_node'][0][0]
+
+    assert result == attr_result == {}
+
+
+@pytest.mark.parametrize('cls', [DotWizPlus, LazyDotWizPlus])
+def test_dotwiz_plus_from_graph_with_shared_and_circular_refs(cls):
+    """`DotWizPlus.from_graph` preserves shared and circular references."""
+    shared = {'Some Key': 1}
+    data = {'keyOne': shared, 'Key 2': [shared]}
+    data['Self'] = data
+
+    dw = cls.from_graph(data)
+
+    assert type(dw) is cls
+    assert dw.self is dw
+    assert dw.key_one is dw.key_2[0]
+    assert dw.key_one.some_key == 1
+    assert 'self=✪(...)' in repr(dw)
+
+    result = dw.to_dict(preserve_refs=True)
+    assert result['Self'] is result
+    assert result['keyOne'] is result['Key 2'][0]
+    assert result['keyOne'] == shared
+
+    result = dw.to_attr_dict(preserve_refs=True)
+    assert result['self'] is result
+    assert result['key_one'] is result['key_2'][0]
+    assert result['key_one'] == {'some_key': 1}
+
+
+@pytest.mark.parametrize('cls', [DotWizPlus, LazyDotWizPlus])
+def test_dotwiz_plus_from_records(cls):
+    """`DotWizPlus.from_records` creates an object for each record."""
+    records = [{'Key 1': i, 'keyTwo': [{'3D': i}], 'items': {'for': i}}
+               for i in range(3)]
+    records.append({'key_1': 'same', 'Key_1': 'keys'})
+    records.append({'Key 1': 'other', 'keyTwo': None, 'items': None})
+
+    result = cls.from_records(records)
+
+    assert result == records
+    assert all(type(o) is cls for o in result)
+    assert [o.to_attr_dict() for o in result] == [cls(r).to_attr_dict() for r in records]
+    assert [repr(o) for o in result] == [repr(cls(r)) for r in records]
+
+    assert result[2].key_1 == 2
+    assert result[2].key_two[0]._3d == 2
+    assert result[2].items_.for_ == 2
+    assert result[3].key_1 == 'keys'
+    assert result[4].key_1 == 'other'
+    assert result[4].key_two is None
+
+
+@pytest.mark.parametrize('cls', [DotWizPlus, FrozenDotWizPlus])
+def test_dotwiz_plus_from_records_with_colliding_keys(cls):
+    """The last key wins for every record, when two keys map to one name."""
+    records = [{'someKey': {'b': i}, 'some_key': i} for i in range(3)]
+
+    result = cls.from_records(records)
+
+    assert [o.to_attr_dict() for o in result] == [cls(r).to_attr_dict() for r in records]
+    assert [o.some_key for o in result] == [0, 1, 2]
+    assert [o['someKey'].b for o in result] == [0, 1, 2]
+
+
+def test_lazy_dotwiz_plus_delete_and_clear():
+    """Removing a value which isn't converted yet also removes it as pending."""
+    dw = LazyDotWizPlus({'a': {'b': 1}, 'someKey': [{'c': 2}], 'd': {'e': 3}})
+
+    del dw['a']
+    del dw.someKey
+    assert dw.__pending__ == {'d': 'd'}
+    assert dw.__pending_keys__ == {'d': 'd'}
+
+    assert not hasattr(dw, 'a')
+    assert not hasattr(dw, 'some_key')
+    assert repr(dw) == '✪(d=✪(e=3))'
+    assert dw.to_attr_dict() == {'d': {'e': 3}}
+
+    dw = LazyDotWizPlus({'a': {'b': 1}})
+    dw.clear()
+    assert not hasattr(dw, 'a')
+    assert list(dw.items()) == []
+    assert repr(dw) == '✪()'
+
+    # a key which is removed from the `dict` storage directly
+    dw = LazyDotWizPlus({'a': {'b': 1}, 'c': 2})
+    dict.pop(dw, 'a')
+    assert not hasattr(dw, 'a')
+    assert dw.to_attr_dict() == {'c': 2}
@@ -0,0 +1,221 @@
+"""Tests for the `FrozenDotWiz` and `FrozenDotWizPlus` classes."""
+
+import functools
+
+import pytest
+
+from dotwiz import *
+
+from .conftest import CleanupGetAttr
+
+
+@pytest.fixture
+def config():
+    return {'db': {'host': 'localhost', 'port': 5432},
+            'servers': [{'name': 'a', 'tags': ['x']}, {'name': 'b'}],
+            'debug': False}
+
+
+def test_frozen_dotwiz(config):
+    """Nested values are frozen on creation."""
+    fdw = FrozenDotWiz(config, extra={'k': 'v'})
+
+    assert isinstance(fdw, DotWiz)
+    assert type(fdw.db) is FrozenDotWiz
+    assert type(fdw.servers) is tuple
+    assert type(fdw.servers[0]) is FrozenDotWiz
+    assert fdw.servers[0].tags == ('x', )
+    assert fdw.db.port == fdw['db']['port'] == 5432
+    assert fdw.extra.k == 'v'
+
+    assert repr(fdw) == ("✫(db=✫(host='localhost', port=5432), servers=(✫(name='a', "
+                         "tags=('x',)), ✫(name='b')), debug=False, extra=✫(k='v'))")
+
+    # the input is not modified
+    assert type(config['db']) is dict
+    assert 'extra' not in config
+
+    config['extra'] = {'k': 'v'}
+    assert fdw.to_dict() == config
+
+
+def test_frozen_dotwiz_from_mutable_dotwiz():
+    fdw = FrozenDotWiz(DotWiz(a={'b': [{'c': 1}]}))
+
+    assert type(fdw.a) is FrozenDotWiz
+    assert type(fdw.a.b[0]) is FrozenDotWiz
+    assert fdw.a.b[0].c == 1
+
+
+@pytest.mark.parametrize('modify', [
+    lambda o: o.__setitem__('debug', True),
+    lambda o: setattr(o, 'debug', True),
+    lambda o: o.__delitem__('debug'),
+    lambda o: delattr(o, 'debug'),
+    lambda o: o.db.update(port=1),
+    lambda o: o.clear(),
+    lambda o: o.pop('debug'),
+    lambda o: o.popitem(),
+    lambda o: o.setdefault('new', 1),
+])
+def test_frozen_dotwiz_is_immutable(config, modify):
+    fdw = FrozenDotWiz(config)
+
+    with pytest.raises(TypeError, match='immutable'):
+        modify(fdw)
+
+    assert fdw.to_dict() == config
+
+    # calling `__init__()` again has no effect
+    fdw.__init__({'debug': True})
+    assert fdw.debug is False
+
+
+def test_frozen_dotwiz_evolve(config):
+    """`evolve` only copies the objects along the path to the new value."""
+    v1 = FrozenDotWiz(config)
+
+    v2 = v1.evolve('db.port', 5433)
+
+    assert v2.db.port == 5433
+    assert v1.db.port == 5432
+    assert v2.db is not v1.db
+    assert v2.servers is v1.servers
+
+    v3 = v2.evolve('servers.0.tags', ['y', {'z': 1}])
+
+    assert v3.servers[0].tags[1].z == 1
+    assert type(v3.servers[0].tags[1]) is FrozenDotWiz
+    assert v3.servers[1] is v2.servers[1]
+    assert v3.db is v2.db
+    assert v2.servers[0].tags == ('x', )
+
+    v4 = v3.evolve(('new.key', 'with', 'dots'), 1)
+
+    assert v4['new.key']['with'].dots == 1
+    assert list(v4) == ['db', 'servers', 'debug', 'new.key']
+
+    assert v4.to_dict() == {
+        'db': {'host': 'localhost', 'port': 5433},
+        'servers': [{'name': 'a', 'tags': ['y', {'z': 1}]}, {'name': 'b'}],
+        'debug': False,
+        'new.key': {'with': {'dots': 1}},
+    }
+    assert v1.to_dict() == config
+
+
+def test_frozen_dotwiz_evolve_with_invalid_path(config):
+    fdw = FrozenDotWiz(config)
+
+    with pytest.raises(TypeError):
+        fdw.evolve('debug.value', True)
+
+    with pytest.raises(IndexError):
+        fdw.evolve('servers.5.name', 'c')
+
+    with pytest.raises(ValueError):
+        fdw.evolve((), 1)
+
+
+def test_frozen_dotwiz_evolve_tuple_index():
+    fdw = FrozenDotWiz({'a': [1, 2, 3]})
+
+    assert fdw.evolve(('a', -1), 9).a == (1, 2, 9)
+    assert fdw.evolve('a.-3', 9).a == (9, 2, 3)
+    assert fdw.evolve(('a', 1), 9).a == (1, 9, 3)
+    assert fdw.a == (1, 2, 3)
+
+    for index in (3, 10, -4):
+        with pytest.raises(IndexError):
+            fdw.evolve(('a', index), 9)
+
+    with pytest.raises(IndexError):
+        fdw.evolve('a.10', 9)
+
+
+def test_frozen_dotwiz_from_json():
+    fdw = FrozenDotWiz.from_json('{"a": [{"b": 1}], "c": {"d": [2]}}')
+
+    assert type(fdw) is FrozenDotWiz
+    assert type(fdw.a) is tuple
+    assert fdw.a[0].b == 1
+    assert fdw.c.d == (2, )
+
+    result = FrozenDotWiz.from_records([{'a': [1]}, {'b': {'c': 2}}])
+
+    assert result[0].a == (1, )
+    assert type(result[1].b) is FrozenDotWiz
+
+    with pytest.raises(TypeError):
+        FrozenDotWiz.from_graph({'a': 1})
+
+
+@pytest.mark.parametrize('cls', [FrozenDotWiz, FrozenDotWizPlus])
+def test_frozen_hash(cls, config):
+    """A frozen object is hashable, and the hash is consistent with `==`."""
+    fdw = cls(config)
+    same = cls(dict(reversed(list(config.items()))))
+
+    assert fdw == same
+    assert hash(fdw) == hash(same)
+    assert hash(fdw) == hash(fdw)
+    assert {fdw: 'value'}[same] == 'value'
+    assert len({fdw, same, fdw.evolve('debug', True)}) == 2
+
+    # the hash value is cached
+    assert fdw.__hash_value__ == hash(fdw)
+    # ... but not copied to a new version
+    with pytest.raises(AttributeError):
+        _ = fdw.evolve('debug', True).__hash_value__
+
+    # the hash is based on the `dict` storage only
+    assert hash(FrozenDotWiz(config)) == hash(FrozenDotWizPlus(config))
+
+    with pytest.raises(TypeError, match='unhashable'):
+        hash(cls(values={1, 2}))
+
+
+def test_frozen_hash_with_lru_cache(config):
+    calls = []
+
+    @functools.lru_cache()
+    def get_port(o):
+        calls.append(o)
+        return o.db.port
+
+    assert get_port(FrozenDotWiz(config)) == 5432
+    assert get_port(FrozenDotWiz(config)) == 5432
+    assert len(calls) == 1
+
+
+class TestFrozenHashWithDefaults(CleanupGetAttr):
+
+    def test_frozen_hash_with_default_for_missing_keys(self):
+        """The cached hash is not affected by a default for missing keys."""
+        set_default_for_missing_keys(12345)
+
+        fdw = FrozenDotWiz(a=1)
+        assert fdw.missing == 12345
+        assert hash(fdw) == hash(frozenset({('a', 1)}))
+
+
+def test_frozen_dotwiz_plus(config):
+    config['Special Key'] = {'keyTwo': [{'3D': 1}]}
+    fdw = FrozenDotWizPlus(config)
+
+    assert isinstance(fdw, DotWizPlus)
+    assert fdw.special_key.key_two[0]._3d == 1
+    assert type(fdw.special_key.key_two) is tuple
+    assert repr(fdw.special_key) == '✪(key_two=(✪(_3d=1),))'
+
+    with pytest.raises(TypeError, match='immutable'):
+        fdw.special_key = 1
+
+    v2 = fdw.evolve('Special Key.keyTwo.0.3D', 2)
+
+    assert v2.special_key.key_two[0]._3d == 2
+    assert fdw.special_key.key_two[0]._3d == 1
+    assert v2.db is fdw.db
+
+    assert v2.to_dict()['Special Key'] == {'keyTwo': [{'3D': 2}]}
+    assert v2.to_attr_dict()['special_key'] == {'key_two': [{'_3d': 2}]}
@@ -0,0 +1,284 @@
+"""Tests for the opt-in instrumentation of `DotWiz` classes."""
+import pytest
+
+import dotwiz
+from dotwiz import *
+
+
+@pytest.fixture
+def instrumented():
+    calls = []
+
+    enable_instrumentation(lambda *args: calls.append(args))
+    reset_instrumentation()
+
+    yield calls
+
+    disable_instrumentation()
+    reset_instrumentation()
+
+
+def test_disabled_by_default():
+    assert not is_instrumentation_enabled()
+
+    DotWiz({'a': {'b': 1}})
+
+    assert instrumentation_snapshot()['nodes'] == 0
+
+
+def test_counts_nodes_and_lists(instrumented):
+    dw = DotWiz({'a': {'b': [1, {'c': 2}]}, 'd': [3]})
+
+    stats = instrumentation_snapshot()
+    assert stats['nodes'] == 3
+    assert stats['lists'] == 2
+    assert stats['operations']['create']['calls'] == 1
+    assert stats['operations']['create']['seconds'] > 0
+
+    dw.to_dict()
+    dw.update(e={'f': 1})
+
+    stats = instrumentation_snapshot()
+    assert stats['nodes'] == 4
+    assert stats['operations']['to_dict']['calls'] == 1
+    assert stats['operations']['update']['calls'] == 1
+
+
+def test_hook(instrumented):
+    DotWiz({'a': {'b': 1}}).to_dict()
+
+    assert [(op, nodes) for op, _, nodes in instrumented] == [
+        ('create', 2), ('to_dict', 0)]
+    assert all(seconds >= 0 for _, seconds, _ in instrumented)
+
+
+@pytest.mark.parametrize('cls', [DotWizLite, LazyDotWiz, DotWizPlus,
+                                 LazyDotWizPlus, FrozenDotWiz,
+                                 FrozenDotWizPlus])
+def test_all_classes(instrumented, cls):
+    dw = cls({'a': {'b': 1}})
+    dw.a.b
+    dw.to_dict()
+
+    stats = instrumentation_snapshot()
+    assert stats['nodes'] == 2
+    assert stats['operations']['to_dict']['calls'] == 1
+
+
+def test_from_json(instrumented):
+    dw = DotWiz.from_json('{"a": {"b": [1, [{"c": 2}]]}}')
+    assert dw.a.b == [1, [{'c': 2}]]
+
+    stats = instrumentation_snapshot()
+    assert stats['operations']['from_json']['calls'] == 1
+    # the objects created while parsing are not timed on their own
+    assert 'create' not in stats['operations']
+    assert stats['nodes'] == 3
+    assert stats['lists'] == 2
+    assert instrumented == [('from_json', instrumented[0][1], 3)]
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus])
+def test_from_records_and_from_graph(instrumented, cls):
+    cls.from_records([{'a': {'b': [1]}}, {'a': {'b': []}}])
+
+    stats = instrumentation_snapshot()
+    assert stats['operations']['from_records']['calls'] == 1
+    # the returned `list` is also counted
+    assert (stats['nodes'], stats['lists']) == (4, 3)
+
+    reset_instrumentation()
+    data = {'x': {'y': [1]}}
+    data['self'] = data
+    cls.from_graph(data)
+
+    stats = instrumentation_snapshot()
+    assert stats['operations'] == {'from_graph': stats['operations']['from_graph']}
+    assert (stats['nodes'], stats['lists']) == (2, 1)
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizLite, DotWizPlus])
+def test_counts_set_values(instrumented, cls):
+    dw = cls(a=1)
+    reset_instrumentation()
+
+    dw['b'] = [{'c': 1}, [2, {'d': 3}]]
+    dw.e = {'f': [3]}
+    dw.a = 2
+
+    stats = instrumentation_snapshot()
+    assert stats['operations']['update']['calls'] == 3
+    assert 'create' not in stats['operations']
+    assert (stats['nodes'], stats['lists']) == (3, 3)
+
+
+def test_counts_lazy_values_on_access(instrumented):
+    dw = LazyDotWiz({'a': {'b': {'c': 1}}, 'd': [1]})
+
+    stats = instrumentation_snapshot()
+    assert (stats['nodes'], stats['lists']) == (1, 1)
+
+    dw.a.b
+    assert instrumentation_snapshot()['nodes'] == 3
+
+
+def test_key_cache(instrumented):
+    dotwiz.clear_key_cache()
+    reset_instrumentation()
+
+    DotWizPlus({'someKey': 1})
+    DotWizPlus({'someKey': 2, 'otherKey': 3})
+
+    stats = instrumentation_snapshot()
+    assert stats['key_cache_hits'] == 1
+    assert stats['key_cache_misses'] == 2
+
+
+def test_key_cache_only_counts_while_enabled():
+    dotwiz.clear_key_cache()
+    reset_instrumentation()
+
+    # lookups before instrumentation is enabled are not counted
+    DotWizPlus({'someKey': 1, 'otherKey': 2})
+    enable_instrumentation()
+
+    try:
+        stats = instrumentation_snapshot()
+        assert (stats['key_cache_hits'], stats['key_cache_misses']) == (0, 0)
+
+        DotWizPlus({'someKey': 1, 'newKey': 2})
+        disable_instrumentation()
+
+        # nor are lookups after it's disabled
+        DotWizPlus({'someKey': 1, 'lastKey': 2})
+        stats = instrumentation_snapshot()
+        assert (stats['key_cache_hits'], stats['key_cache_misses']) == (1, 1)
+
+    finally:
+        disable_instrumentation()
+        reset_instrumentation()
+
+
+def test_key_cache_counts_every_normalizer(instrumented):
+    dotwiz.register_key_normalizer('upper_test', str.upper, overwrite=True)
+    dotwiz.clear_key_cache()
+    reset_instrumentation()
+
+    DotWizPlus({'someKey': 1})
+    DotWizPlus({'someKey': 2, 'otherKey': 3})
+    previous = dotwiz.set_key_normalizer('upper_test')
+
+    try:
+        DotWizPlus({'someKey': 1})
+        DotWizPlus({'someKey': 2, 'otherKey': 3})
+    finally:
+        dotwiz.set_key_normalizer(previous)
+
+    stats = instrumentation_snapshot()
+    assert stats['key_cache_hits'] == 2
+    assert stats['key_cache_misses'] == 4
+
+
+def test_reset(instrumented):
+    DotWiz({'a': [1]})
+    reset_instrumentation()
+
+    assert instrumentation_snapshot() == {
+        'nodes': 0, 'lists': 0, 'key_cache_hits': 0, 'key_cache_misses': 0,
+        'operations': {}}
+
+
+def test_disable_restores_methods():
+    originals = {cls: dict(cls.__dict__)
+                 for cls in (DotWiz, DotWizPlus, FrozenDotWiz)}
+
+    enable_instrumentation()
+    assert is_instrumentation_enabled()
+    assert DotWiz.__dict__['__init__'] is not originals[DotWiz]['__init__']
+
+    disable_instrumentation()
+    assert not is_instrumentation_enabled()
+
+    for cls, cls_dict in originals.items():
+        for name, value in cls_dict.items():
+            assert cls.__dict__[name] is value
+
+    assert FrozenDotWiz({'a': 1}).a == 1
+
+
+def build(n):
+    return [DotWiz({'a': {'b': [{'c': i}]}}) for i in range(n)]
+
+
+def test_profile():
+    with profile() as p:
+        records = build(10)
+        records[0].to_dict()
+        DotWizPlus.from_json('{"someKey": 1}')
+
+    assert not is_instrumentation_enabled()
+    assert DotWiz.__dict__['__init__'].__module__ == 'dotwiz.main'
+
+    entries = sorted(p.report(), key=lambda e: e.op)
+    assert [(e.op, e.cls, e.calls) for e in entries] == [
+        ('create', 'DotWiz', 10), ('from_json', 'DotWizPlus', 1),
+        ('to_dict', 'DotWiz', 1)]
+
+    create = entries[0]
+    assert create.location.startswith(
+        f'{__file__}:{build.__code__.co_firstlineno + 1}(')
+    assert create.nodes == 30
+    assert create.max_depth == 3
+    assert create.seconds > 0
+    assert create.bytes > 0
+
+
+@pytest.mark.parametrize('cls', [LazyDotWiz, LazyDotWizPlus])
+def test_profile_lazy(cls):
+    with profile(trace_memory=False) as p:
+        dw = cls({'a': {'b': {'c': 1}}, 'd': [{'e': 1}]})
+
+    # the nested values are counted, but not converted
+    assert [(e.op, e.calls, e.nodes, e.max_depth) for e in p.report()] == [
+        ('create', 1, 4, 3)]
+    assert type(dict.__getitem__(dw, 'a')) is dict
+
+
+def test_profile_sort_by():
+    with profile(sort_by='nodes', trace_memory=False) as p:
+        DotWiz({'a': 1})
+        DotWiz({'a': {'b': {'c': {}}}})
+
+    entries = p.report()
+    assert [e.nodes for e in entries] == [4, 1]
+    assert all(e.bytes == 0 for e in entries)
+
+    assert [e.max_depth for e in p.report('max_depth')] == [4, 1]
+
+    with pytest.raises(ValueError):
+        profile(sort_by='invalid')
+
+
+def test_profile_decorator(capsys):
+    @profile(print_report=True, trace_memory=False)
+    def create():
+        return DotWiz(a={'b': 1})
+
+    create()
+
+    out = capsys.readouterr().out
+    assert 'create' in out
+    assert 'DotWiz' in out
+    assert 'test_instrument.py' in out
+
+
+def test_profile_with_instrumentation(instrumented):
+    with profile(trace_memory=False) as p:
+        DotWiz({'a': {'b': 1}})
+
+    # the methods stay instrumented after the profile exits
+    assert is_instrumentation_enabled()
+    DotWiz({'a': 1})
+
+    assert p.report()[0].calls == 1
+    assert instrumentation_snapshot()['operations']['create']['calls'] == 2
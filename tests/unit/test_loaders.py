@@ -0,0 +1,57 @@
+"""Tests for the `dotwiz.loaders` module."""
+
+import io
+import json
+
+import pytest
+
+from dotwiz import *
+
+
+@pytest.fixture
+def json_lines():
+    lines = [json.dumps({'id': i, 'Some-Key': {'ñame': 'é' * i}})
+             for i in range(100)]
+    # include blank lines, and Windows-style line endings
+    return '\r\n'.join(lines[:50]) + '\n\n  \n' + '\n'.join(lines[50:])
+
+
+@pytest.mark.parametrize('binary', [False, True])
+@pytest.mark.parametrize('chunk_size', [1, 16, 1 << 20])
+def test_iter_json_lines(json_lines, binary, chunk_size):
+    """Confirm intended functionality of `iter_json_lines`"""
+    fp = io.BytesIO(json_lines.encode()) if binary else io.StringIO(json_lines)
+
+    records = list(iter_json_lines(fp, chunk_size=chunk_size))
+
+    assert len(records) == 100
+    assert all(type(r) is DotWiz for r in records)
+    assert records[7].id == 7
+    assert records[99]['Some-Key'].ñame == 'é' * 99
+
+
+def test_iter_json_lines_with_dotwiz_plus_and_batches(json_lines):
+    """Records can be yielded in batches, and as other classes."""
+    batches = list(iter_json_lines(io.StringIO(json_lines), DotWizPlus,
+                                   batch_size=30, chunk_size=64))
+
+    assert [len(b) for b in batches] == [30, 30, 30, 10]
+    assert type(batches[0][0]) is DotWizPlus
+    assert batches[3][9].some_key.ñame == 'é' * 99
+
+
+@pytest.mark.parametrize('binary', [False, True])
+def test_iter_json_lines_with_line_spanning_many_chunks(binary):
+    """A line which is much longer than the chunk size is read whole."""
+    data = json.dumps({'a': 'ñ' * 5000}) + '\n{"b": 1}\n' + json.dumps({'c': 'é' * 999})
+    fp = io.BytesIO(data.encode()) if binary else io.StringIO(data)
+
+    records = list(iter_json_lines(fp, chunk_size=16))
+
+    assert records == [{'a': 'ñ' * 5000}, {'b': 1}, {'c': 'é' * 999}]
+
+
+def test_iter_json_lines_with_invalid_batch_size():
+    """An error is raised for a batch size which is not positive."""
+    with pytest.raises(ValueError):
+        iter_json_lines(io.StringIO(''), batch_size=0)
@@ -0,0 +1,263 @@
+"""Tests for dotted-path accessors, such as `DotWiz.get_path`."""
+
+from datetime import date
+
+import pytest
+
+from dotwiz import *
+
+from .conftest import CleanupGetAttr
+
+
+@pytest.fixture
+def data():
+    return {'order': {'items': [{'sku': 'A1'}, {'sku': 'B2', 'items': 3}]},
+            'Special Key': {'a.b': 1, 'keyTwo': [[1, 2]]}}
+
+
+@pytest.mark.parametrize('spec,keys', [
+    ('a', ('a', )),
+    ('a.b.c', ('a', 'b', 'c')),
+    ('a[0]', ('a', 0)),
+    ('a.b[-1][2].c', ('a', 'b', -1, 2, 'c')),
+    ('a["b.c"].d', ('a', 'b.c', 'd')),
+    ("['a'][0]", ('a', 0)),
+    ('Special Key.keyTwo', ('Special Key', 'keyTwo')),
+    (('a', 0, 'b.c'), ('a', 0, 'b.c')),
+])
+def test_path(spec, keys):
+    p = path(spec)
+
+    assert type(p) is DotPath
+    assert p.keys == keys
+    assert p.spec == spec
+    assert p == path(keys)
+    assert path(p) is p
+    assert repr(p) == f'path({spec!r})'
+
+
+def test_path_is_cached():
+    assert path('a.b[0]') is path('a.b[0]')
+    assert path(('a', 'b', 0)) is path(['a', 'b', 0])
+
+
+def test_path_cache_is_bounded():
+    import dotwiz.paths
+
+    cache = dotwiz.paths.__PATHS
+
+    for i in range(cache.maxsize + 10):
+        path(f'key{i}.value')
+
+    assert len(cache) == cache.maxsize
+    assert path('key0.value').keys == ('key0', 'value')
+
+    # a key which is not hashable is fine, though it's not cached
+    p = path(['a', ('b', [])])
+    assert p.keys == ('a', ('b', []))
+
+
+@pytest.mark.parametrize('spec', [
+    '', '.a', 'a.', 'a..b', 'a.[0]', 'a[0]b', 'a[b]', 'a["b]', 'a[0', (),
+])
+def test_path_invalid(spec):
+    with pytest.raises(ValueError):
+        path(spec)
+
+
+@pytest.mark.parametrize('cls', [dict, DotWiz, DotWizLite, DotWizPlus,
+                                 LazyDotWiz, LazyDotWizPlus,
+                                 FrozenDotWiz, FrozenDotWizPlus])
+def test_get_path(cls, data):
+    o = cls(data)
+    get = path('order.items[1].sku').get
+
+    assert get(o) == 'B2'
+    assert path('order.items[-1].items').get(o) == 3
+    assert path('Special Key["a.b"]').get(o) == 1
+    assert path(['Special Key', 'keyTwo', 0, 1]).get(o) == 2
+
+    assert get(o, None) == 'B2'
+    assert path('order.missing').get(o, None) is None
+    assert path('order.items[5].sku').get(o, 'x') == 'x'
+    assert path('order.items.sku').get(o, 'x') == 'x'
+
+    with pytest.raises(KeyError):
+        path('order.missing').get(o)
+
+    with pytest.raises(IndexError):
+        path('order.items[5]').get(o)
+
+    assert path('order.items[0]').has(o)
+    assert not path('order.items[0].price').has(o)
+
+    if cls is not dict:
+        assert o.get_path('order.items[1].sku') == 'B2'
+        assert o.get_path(('order', 'items', 0, 'sku')) == 'A1'
+        assert o.get_path('order.missing', 1) == 1
+        assert o.has_path('Special Key.keyTwo[0][1]')
+        assert not o.has_path('Special Key.keyTwo[1]')
+
+
+def test_get_path_with_values_which_are_not_dotwiz():
+    dw = DotWiz(a=({'items': 1, 'b': {'keys': 2}}, ))
+
+    # `dict` methods are not returned for a key which is missing
+    assert dw.get_path('a[0].items') == 1
+    assert dw.get_path('a[0].b.keys') == 2
+    assert dw.get_path('a[0].b.values', None) is None
+
+    dw = DotWiz(a=DotWizPlus({'keyOne': 1, 'items': 2}))
+
+    assert dw.get_path('a.keyOne') == 1
+    assert dw.get_path('a.items') == 2
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizLite, DotWizPlus,
+                                 LazyDotWiz, LazyDotWizPlus,
+                                 FrozenDotWiz, FrozenDotWizPlus])
+def test_get_path_with_method_names(cls):
+    """The methods of a class are not returned for a key which is missing"""
+    o = cls(a={'b': 1}, to_dict=2)
+
+    for name in ('to_dict', 'to_attr_dict', 'specialize', 'get_path',
+                 'from_records', 'evolve'):
+        assert o.get_path(('a', name), 'DEF') == 'DEF'
+        assert not o.has_path(f'a.{name}')
+
+    assert o.get_path('to_dict') == 2
+    assert o.get_path('a.b') == 1
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizLite, DotWizPlus,
+                                 LazyDotWiz, FrozenDotWiz])
+def test_get_path_with_non_dotwiz_leaves(cls):
+    """Attributes of a value which isn't a `DotWiz` are not path keys"""
+    o = cls(a='hello', n=5, d=date(2020, 1, 2), b={'c': 'x'})
+
+    for spec in ('a.upper', 'n.real', 'd.year', 'b.c.upper'):
+        assert o.get_path(spec, None) is None
+        assert not o.has_path(spec)
+        assert path(spec).get(o, None) is None
+
+    with pytest.raises(TypeError):
+        o.get_path('n.real')
+
+    assert o.get_path('b.c') == 'x'
+
+
+class TestGetPathWithDefaults(CleanupGetAttr):
+
+    def test_get_path_with_default_for_missing_keys(self):
+        """A default for missing keys doesn't apply to a path."""
+        dw = DotWiz(a={'b': 1})
+
+        assert dw.get_path('a.c', None) is None
+
+        set_default_for_missing_keys('test')
+        assert dw.a.c == 'test'
+
+        assert dw.get_path('a.b') == 1
+        assert dw.get_path('a.c', None) is None
+
+
+@pytest.mark.parametrize('cls', [dict, DotWiz, DotWizLite, DotWizPlus])
+def test_set_path(cls, data):
+    o = cls(data)
+
+    path('order.items[0].sku').set(o, 'C3')
+    assert path('order.items[0].sku').get(o) == 'C3'
+
+    path('order.shipping.address["zip.code"]').set(o, '12345')
+    assert path('order.shipping.address["zip.code"]').get(o) == '12345'
+
+    if cls is not dict:
+        o.set_path('order.items[1].sku', {'id': 'D4'})
+        assert o.get_path('order.items[1].sku.id') == 'D4'
+
+        o.set_path(['order', 'total'], 7)
+        assert o.get_path('order.total') == 7
+
+    if cls is DotWiz:
+        assert o.order.shipping.address['zip.code'] == '12345'
+        assert o.order.items[1].sku.id == 'D4'
+        assert o.order.total == 7
+
+    with pytest.raises(IndexError):
+        path('order.items[5].sku').set(o, 'E5')
+
+
+def test_set_path_on_frozen_dotwiz(data):
+    fdw = FrozenDotWiz(data)
+
+    with pytest.raises(TypeError, match='immutable'):
+        fdw.set_path('order.items[0].sku', 'C3')
+
+
+@pytest.mark.parametrize('cls', [dict, DotWiz, DotWizLite, DotWizPlus,
+                                 LazyDotWiz, FrozenDotWiz])
+def test_extractor(cls, data):
+    o = cls(data)
+    ex = extractor(['order.items[0].sku',
+                    'order.items[1].items',
+                    ('Special Key', 'a.b'),
+                    path('Special Key.keyTwo[0][1]'),
+                    'order.items[1].sku'])
+
+    assert type(ex) is Extractor
+    assert ex.get(o) == ('A1', 3, 1, 2, 'B2')
+    assert ex.get_many([o, data]) == [('A1', 3, 1, 2, 'B2')] * 2
+
+    with pytest.raises(KeyError, match='order.items'):
+        ex.get({'order': {}})
+
+
+def test_extractor_with_defaults(data):
+    ex = extractor({'order.items[0].sku': None,
+                    'order.items[5].sku': 'none',
+                    'order.total': 0,
+                    'order.items[0].sku.id': 'not a dict',
+                    'customer.name': '',
+                    'customer.address.city': 'Paris'})
+
+    for o in data, DotWiz(data), DotWizPlus(data):
+        assert ex.get(o) == ('A1', 'none', 0, 'not a dict', '', 'Paris')
+
+    ex = extractor(['order.items[0].sku', 'order.total', 'customer'],
+                   default=None)
+    assert ex.get(DotWiz(data)) == ('A1', None, None)
+    assert ex.get({}) == (None, None, None)
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus, LazyDotWiz,
+                                 FrozenDotWiz, FrozenDotWizPlus])
+def test_extractor_with_method_names(cls):
+    """The methods of a class are not returned for a key which is missing"""
+    ex = extractor({'a.b': None, 'to_dict': 'DEF', 'a.get_path': 'DEF',
+                    'a.evolve': 'DEF', 'a.to_attr_dict': 'DEF'})
+
+    assert ex.get(cls(a={'b': 1})) == (1, 'DEF', 'DEF', 'DEF', 'DEF')
+    assert ex.get(cls(a={'b': 1}, to_dict=2))[1] == 2
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus, LazyDotWiz,
+                                 FrozenDotWiz, FrozenDotWizPlus])
+def test_extractor_with_non_dotwiz_leaves(cls):
+    """Attributes of a value which isn't a `DotWiz` are not path keys"""
+    ex = extractor({'a.upper': None, 'b.c': 0, 'n.real': None,
+                    'd.year': None})
+    o = cls(a='x', b={'c': 3}, n=5, d=date(2020, 1, 2))
+
+    assert ex.get(o) == (None, 3, None, None)
+
+
+def test_extractor_with_nested_paths():
+    """A path can end at a value which another path goes through."""
+    dw = DotWiz(a={'b': {'c': 1}})
+    ex = extractor(['a.b', 'a.b.c', 'a', 'a.b.c'])
+
+    assert ex.get(dw) == (dw.a.b, 1, dw.a, 1)
+    assert repr(ex) == "extractor(['a.b', 'a.b.c', 'a', 'a.b.c'])"
+
+    with pytest.raises(ValueError):
+        extractor([])
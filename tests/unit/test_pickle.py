@@ -0,0 +1,245 @@
+"""Tests for pickling (and copying) `DotWiz` and `DotWizPlus` objects."""
+import copy
+import pickle
+
+import pytest
+
+import dotwiz.plus
+from dotwiz import *
+
+
+@pytest.fixture
+def data():
+    return {'id': 1, 'userName': 'jon', 'items': [{'3D': True}, 'a'],
+            'Address': {'City': 'Paris', 'zip-code': '75001'}}
+
+
+ALL_CLASSES = [DotWiz, DotWizPlus, DotWizLite, LazyDotWiz, LazyDotWizPlus,
+               FrozenDotWiz, FrozenDotWizPlus]
+
+
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize('cls', ALL_CLASSES)
+def test_pickle_round_trip(cls, protocol, data):
+    dw = cls(data)
+    new = pickle.loads(pickle.dumps(dw, protocol))
+
+    assert type(new) is cls
+    assert new == dw
+    assert new.to_dict() == data
+    assert repr(new) == repr(dw)
+    assert type(new['Address']) is cls
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus, FrozenDotWiz, FrozenDotWizPlus])
+def test_pickle_restores_attributes(cls, data):
+    dw = cls(data)
+    new = pickle.loads(pickle.dumps(dw))
+
+    assert new.__dict__ == dw.__dict__
+    assert list(new.__dict__) == list(dw.__dict__)
+
+
+def test_pickle_dot_wiz_plus_keeps_attribute_names(data):
+    dw = DotWizPlus(data)
+    new = pickle.loads(pickle.dumps(dw))
+
+    assert new.user_name == 'jon'
+    assert new.items_[0]._3d is True
+    assert new.address.zip_code == '75001'
+    assert new.to_attr_dict() == dw.to_attr_dict()
+
+    # keys which map to the same attribute name
+    dw = DotWizPlus({'myKey': 1, 'my_key': 2})
+    new = pickle.loads(pickle.dumps(dw))
+
+    assert new.my_key == 2
+    assert dict(new) == {'myKey': 1, 'my_key': 2}
+
+
+def test_pickle_dot_wiz_plus_does_not_convert_keys_again(data, monkeypatch):
+    dw = DotWizPlus(data)
+    payload = pickle.dumps(dw)
+
+    def store_in_object(*args, **kwargs):
+        raise AssertionError('a key should not be converted again')
+
+    monkeypatch.setattr(dotwiz.plus, '__store_in_object__', store_in_object)
+
+    new = pickle.loads(payload)
+
+    assert new.address.city == 'Paris'
+
+
+@pytest.mark.parametrize('cls', [LazyDotWiz, LazyDotWizPlus])
+def test_pickle_lazy(cls, data):
+    dw = cls(data)
+    assert dw.to_dict() == data
+
+    new = pickle.loads(pickle.dumps(dw))
+    # nested values are converted on first access, as before
+    assert type(dict.__getitem__(new, 'Address')) is dict
+    assert type(new['Address']) is cls
+    assert new == dw
+
+    # after accessing a value
+    dw['Address']
+    new = pickle.loads(pickle.dumps(dw))
+    assert type(dict.__getitem__(new, 'Address')) is cls
+    assert new.to_dict() == data
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus])
+def test_pickle_circular_references(cls):
+    data = {'a': 1, 'b': []}
+    data['self'] = data
+    data['b'].append(data)
+
+    dw = cls.from_graph(data)
+    new = pickle.loads(pickle.dumps(dw))
+
+    assert new['self'] is new
+    assert new['b'][0] is new
+    assert new.self.self.a == 1
+
+
+def test_pickle_specialized_dot_wiz(data):
+    cls = DotWiz.specialize(data)
+    dw = cls(data)
+
+    new = pickle.loads(pickle.dumps(dw))
+
+    assert type(new) is cls
+    assert new.userName == 'jon'
+    assert new.Address.City == 'Paris'
+    assert new == dw
+
+
+def test_pickle_frozen_hash(data):
+    dw = FrozenDotWiz(data)
+    new = pickle.loads(pickle.dumps(dw))
+
+    assert hash(new) == hash(dw)
+    assert {dw: 1}[new] == 1
+
+    with pytest.raises(TypeError, match='immutable'):
+        new.id = 2
+
+
+def test_pickle_writes_each_value_once():
+    value = 'x' * 1000
+    dw = DotWiz(a=value)
+
+    assert len(pickle.dumps(dw)) < 1100
+
+
+@pytest.mark.parametrize('cls', ALL_CLASSES)
+def test_copy(cls, data):
+    dw = cls(data)
+    new = copy.copy(dw)
+
+    assert type(new) is cls
+    assert new == dw
+    assert new.to_dict() == data
+    assert dict.__getitem__(new, 'Address') is dict.__getitem__(dw, 'Address')
+
+    if cls in (FrozenDotWiz, FrozenDotWizPlus):
+        assert new is dw
+    else:
+        assert new is not dw
+        # the copy can be changed, without changing the original
+        new['id'] = 2
+        assert new.id == 2 and dw.id == 1
+
+
+@pytest.mark.parametrize('cls', ALL_CLASSES)
+def test_deepcopy(cls, data):
+    dw = cls(data)
+    new = copy.deepcopy(dw)
+
+    assert type(new) is cls
+    assert new == dw
+    assert new.to_dict() == data
+    assert repr(new) == repr(dw)
+    assert new['Address'] is not dw['Address']
+    assert type(new['Address']) is cls
+    assert new.__dict__.keys() == dw.__dict__.keys()
+
+
+def test_deepcopy_dot_wiz_plus_does_not_convert_keys_again(data, monkeypatch):
+    dw = DotWizPlus(data)
+
+    def store_in_object(*args, **kwargs):
+        raise AssertionError('a key should not be converted again')
+
+    monkeypatch.setattr(dotwiz.plus, '__store_in_object__', store_in_object)
+
+    new = copy.copy(dw)
+    assert new.user_name == 'jon'
+
+    new = copy.deepcopy(dw)
+    assert new.items_[0]._3d is True
+    assert new.address.zip_code == '75001'
+    assert new.__dict__['address'] is new['Address']
+
+
+@pytest.mark.parametrize('cls', [DotWiz, DotWizPlus])
+def test_deepcopy_shared_and_circular_references(cls):
+    shared = {'x': [1]}
+    data = {'a': shared, 'b': shared}
+    data['self'] = data
+
+    dw = cls.from_graph(data)
+    new = copy.deepcopy(dw)
+
+    assert new['self'] is new
+    assert new['a'] is new['b'] is not dw['a']
+    assert new.a.x == [1] and new.a.x is not dw.a.x
+
+
+def test_copy_specialized_dot_wiz(data):
+    cls = DotWiz.specialize(data)
+    dw = cls(data)
+
+    for new in copy.copy(dw), copy.deepcopy(dw):
+        assert type(new) is cls
+        assert new.userName == 'jon'
+        assert new.Address.City == 'Paris'
+        assert new == dw
+
+
+def test_pickle_columnar_list(data):
+    rows = ColumnarList([data, data], DotWizPlus)
+    new = pickle.loads(pickle.dumps(rows))
+
+    assert type(new) is ColumnarList
+    assert new == rows
+    assert new[1].address.city == 'Paris'
+    assert new.column('id') == [1, 1]
+
+
+# pickled (with protocol 2) by a version before `__getstate__` was added,
+# where the state is the instance `__dict__`.
+LEGACY_PICKLES = {
+    DotWiz: b'\x80\x02cdotwiz.main\nDotWiz\nq\x00)\x81q\x01(X\x02\x00\x00\x00idq\x02K\x01X\x08\x00\x00\x00userNameq\x03X\x03\x00\x00\x00jonq\x04X\x04\x00\x00\x00tagsq\x05]q\x06(h\x00)\x81q\x07X\x02\x00\x00\x003Dq\x08\x88s}q\th\x08\x88sbX\x01\x00\x00\x00aq\neX\x07\x00\x00\x00Addressq\x0bh\x00)\x81q\x0c(X\x04\x00\x00\x00Cityq\rX\x05\x00\x00\x00Parisq\x0eX\x08\x00\x00\x00zip-codeq\x0fX\x05\x00\x00\x0075001q\x10u}q\x11(h\rh\x0eh\x0fh\x10ubu}q\x12(h\x02K\x01h\x03h\x04h\x05h\x06h\x0bh\x0cub.',
+    DotWizPlus: b'\x80\x02cdotwiz.plus\nDotWizPlus\nq\x00)\x81q\x01(X\x02\x00\x00\x00idq\x02K\x01X\x08\x00\x00\x00userNameq\x03X\x03\x00\x00\x00jonq\x04X\x04\x00\x00\x00tagsq\x05]q\x06(h\x00)\x81q\x07X\x02\x00\x00\x003Dq\x08\x88s}q\tX\x03\x00\x00\x00_3dq\n\x88sbX\x01\x00\x00\x00aq\x0beX\x07\x00\x00\x00Addressq\x0ch\x00)\x81q\r(X\x04\x00\x00\x00Cityq\x0eX\x05\x00\x00\x00Parisq\x0fX\x08\x00\x00\x00zip-codeq\x10X\x05\x00\x00\x0075001q\x11u}q\x12(X\x04\x00\x00\x00cityq\x13h\x0fX\x08\x00\x00\x00zip_codeq\x14h\x11ubu}q\x15(h\x02K\x01X\t\x00\x00\x00user_nameq\x16h\x04h\x05h\x06X\x07\x00\x00\x00addressq\x17h\rub.',
+}
+
+
+@pytest.mark.parametrize('cls', LEGACY_PICKLES)
+def test_unpickle_legacy_state(cls):
+    data = {'id': 1, 'userName': 'jon', 'tags': [{'3D': True}, 'a'],
+            'Address': {'City': 'Paris', 'zip-code': '75001'}}
+
+    dw = pickle.loads(LEGACY_PICKLES[cls])
+    expected = cls(data)
+
+    assert type(dw) is cls
+    assert dw == expected
+    assert dw.to_dict() == data
+    assert dw.__dict__ == expected.__dict__
+    assert type(dw['Address']) is cls
+    assert dw.tags[0] == expected.tags[0]
+
+    new = pickle.loads(pickle.dumps(dw))
+    assert new.__dict__ == expected.__dict__